@@ -0,0 +1,50 @@
+"""
+Measures how long ``python -c "import perjury"`` takes in a fresh
+interpreter.  Run from the repository root::
+
+    python benchmarks/import_time.py --runs 20
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_import(statement, runs):
+    """
+    Returns a sorted list of wall clock timings, in seconds, of running
+    ``statement`` in ``runs`` fresh interpreters.
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    timings = []
+
+    for i in xrange(runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', statement], env=env)
+        timings.append(time.time() - start)
+
+    return sorted(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = time_import('pass', args.runs)
+    timings = time_import('import perjury', args.runs)
+
+    median = timings[len(timings) // 2]
+    baseline_median = baseline[len(baseline) // 2]
+
+    print 'interpreter startup: {0:.1f} ms'.format(baseline_median * 1000)
+    print 'import perjury:      {0:.1f} ms'.format(median * 1000)
+    print 'import overhead:     {0:.1f} ms'.format((median - baseline_median) * 1000)
+
+
+if __name__ == '__main__':
+    main()
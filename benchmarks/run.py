@@ -0,0 +1,330 @@
+"""
+Runs the perjury benchmarks and reports values per second, estimated memory
+per million values, how unique generators slow down as their value space
+fills up and import time.  Nothing touches the network.  Run from the
+repository root::
+
+    python benchmarks/run.py --output baseline.json
+
+and later, to compare against that baseline and exit non-zero if anything
+got more than 20% slower::
+
+    python benchmarks/run.py --compare baseline.json --threshold 0.2
+
+Generators are timed both in batches with ``generate_many`` and one value
+at a time, as ``name()``.  Pass benchmark names to only run some of them,
+``--list`` to see them all.
+The ``ModelGenerator`` benchmarks are skipped if Django is not installed.
+"""
+from __future__ import division
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from import_time import time_import
+
+
+BENCHMARKS = []
+
+
+def benchmark(name, setup):
+    """
+    Registers the benchmark ``name``.  ``setup`` is called with no arguments
+    before timing starts and returns the function to time.  Functions are
+    called with a batch size and return that many values.
+    """
+    BENCHMARKS.append((name, setup))
+
+
+def deep_size(values):
+    """
+    Returns an estimate in bytes of the memory held by the list ``values``
+    and the distinct values in it, not counting anything they refer to.
+    """
+    seen = set()
+    size = sys.getsizeof(values)
+    for value in values:
+        if id(value) not in seen:
+            seen.add(id(value))
+            size += sys.getsizeof(value)
+    return size
+
+
+def measure(fn, duration, batch_size, repeats=5):
+    """
+    Calls ``fn(batch_size)`` for ``duration`` seconds, split into
+    ``repeats`` runs, and returns the values per second of the fastest run
+    and the estimated bytes per million values.
+    """
+    fn(batch_size)
+    rates = []
+    for i in xrange(repeats):
+        count = 0
+        elapsed = 0.0
+        while elapsed < duration / repeats:
+            start = time.time()
+            values = fn(batch_size)
+            elapsed += time.time() - start
+            count += len(values)
+        rates.append(count / elapsed)
+
+    return {
+        'values_per_second': max(rates),
+        'bytes_per_million': deep_size(values) * 1000000 // max(len(values), 1),
+        }
+
+
+def unique_degradation(space, steps=10):
+    """
+    Fills nine tenths of the values of a unique generator over ``space``
+    values and returns the values per second reached for each ``steps``th of
+    that.
+    """
+    from perjury import util
+
+    rng = random.Random(0)
+    fn = util.unique(lambda: rng.randrange(space), depth_limit=10000)
+    step = space * 9 // 10 // steps
+    rates = []
+    for i in xrange(steps):
+        start = time.time()
+        for j in xrange(step):
+            fn()
+        rates.append(step / (time.time() - start))
+    return rates
+
+
+def batched(fn):
+    return lambda n: [fn() for i in xrange(n)]
+
+
+def setup_generator(name):
+    def setup():
+        from perjury import generators
+        generator = getattr(generators, name)
+        return getattr(generator, 'generate_many', batched(generator))
+    return setup
+
+
+def setup_call(name):
+    def setup():
+        from perjury import generators
+        return batched(getattr(generators, name))
+    return setup
+
+
+def setup_unique_choice():
+    from perjury import generators
+    from perjury.exceptions import ValueSpaceExhaustedError
+
+    choices = generators.Choice(range(1000000))
+    state = [choices.as_unique()]
+
+    def fn(n):
+        try:
+            return state[0].generate_many(n)
+        except ValueSpaceExhaustedError:
+            state[0] = choices.as_unique()
+            return state[0].generate_many(n)
+    return fn
+
+
+def setup_template():
+    from perjury.generators.template import Template
+    return Template('{first_name}.{last_name}{int:2}@{domain}').generate_many
+
+
+def setup_unique_util():
+    from perjury import util
+
+    def fn(n):
+        rng = random.Random(0)
+        return util.generate_many(util.unique(lambda: rng.randrange(2 ** 32)), n)
+    return fn
+
+
+def setup_markov():
+    from perjury.content import WORD_LIST
+    from perjury.generators.markov import MarkovGenerator
+
+    rng = random.Random(0)
+    sentences = []
+    for i in xrange(2000):
+        sentences.extend(rng.choice(WORD_LIST) for j in xrange(rng.randint(4, 12)))
+        sentences.append('.')
+    generator = MarkovGenerator(' '.join(sentences), token_size=2, rng=rng)
+    return batched(generator.sentence)
+
+
+def configure_django():
+    from django.conf import settings
+    if not settings.configured:
+        settings.configure(DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+                },
+            })
+
+    from django.core.management.color import no_style
+    from django.db import connection, models
+
+    class BenchmarkModel(models.Model):
+        name = models.CharField(max_length=255)
+        email = models.EmailField()
+        count = models.IntegerField()
+        price = models.DecimalField(max_digits=10, decimal_places=2)
+        created = models.DateTimeField()
+        description = models.TextField()
+
+        class Meta:
+            app_label = 'benchmarks'
+
+    cursor = connection.cursor()
+    statements, _ = connection.creation.sql_create_model(BenchmarkModel, no_style())
+    for statement in statements:
+        cursor.execute(statement)
+    return BenchmarkModel
+
+
+_models = {}
+
+
+def benchmark_model():
+    if 'model' not in _models:
+        _models['model'] = configure_django()
+    return _models['model']
+
+
+def model_generator():
+    model = benchmark_model()
+    from perjury.generators.django_models import ModelGenerator
+    return ModelGenerator(model)
+
+
+def setup_model_kwargs():
+    return batched(model_generator().build_model_kwargs)
+
+
+def setup_model_call():
+    return batched(model_generator())
+
+
+def setup_model_create_many():
+    return model_generator().create_many
+
+
+for name in ('smallint', 'decimal', 'word', 'words', 'first_name', 'email',
+             'datetime_generator', 'current_datetime'):
+    benchmark(name, setup_generator(name))
+
+for name in ('smallint', 'word', 'words', 'first_name', 'email'):
+    benchmark(name + '()', setup_call(name))
+
+benchmark('template', setup_template)
+benchmark('unique_choice', setup_unique_choice)
+benchmark('util.unique', setup_unique_util)
+benchmark('markov.sentence', setup_markov)
+benchmark('ModelGenerator.build_model_kwargs', setup_model_kwargs)
+benchmark('ModelGenerator.__call__', setup_model_call)
+benchmark('ModelGenerator.create_many', setup_model_create_many)
+
+
+def run(names, duration, batch_size, import_runs):
+    results = {'benchmarks': {}, 'python': sys.version.split()[0]}
+
+    for name, setup in BENCHMARKS:
+        if names and name not in names:
+            continue
+        try:
+            fn = setup()
+        except ImportError as e:
+            print >> sys.stderr, 'skipping {0}: {1}'.format(name, e)
+            continue
+        results['benchmarks'][name] = measure(fn, duration, batch_size)
+        print >> sys.stderr, '{0:40} {1:>14,.0f} values/s'.format(
+                name, results['benchmarks'][name]['values_per_second'])
+
+    if not names or 'unique_degradation' in names:
+        results['unique_degradation'] = unique_degradation(100000)
+
+    if import_runs and (not names or 'import' in names):
+        baseline = time_import('pass', import_runs)
+        timings = time_import('import perjury', import_runs)
+        results['import_ms'] = (timings[len(timings) // 2] -
+                                baseline[len(baseline) // 2]) * 1000
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints how each benchmark in ``results`` compares to ``baseline`` and
+    returns the names of those that got slower by more than ``threshold``, as
+    a fraction.
+    """
+    regressions = []
+    for name, result in sorted(results['benchmarks'].items()):
+        try:
+            before = baseline['benchmarks'][name]['values_per_second']
+        except KeyError:
+            continue
+        change = result['values_per_second'] / before - 1
+        flag = ''
+        if change < -threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print '{0:40} {1:>+7.1%}{2}'.format(name, change, flag)
+
+    if 'import_ms' in results and 'import_ms' in baseline:
+        change = results['import_ms'] - baseline['import_ms']
+        print '{0:40} {1:>+7.1f} ms'.format('import', change)
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+            description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('names', nargs='*')
+    parser.add_argument('--list', action='store_true')
+    parser.add_argument('--duration', type=float, default=1.0,
+            help='seconds to time each benchmark for')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--import-runs', type=int, default=10)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2)
+    args = parser.parse_args()
+
+    if args.list:
+        for name, setup in BENCHMARKS:
+            print name
+        print 'unique_degradation'
+        print 'import'
+        return
+
+    results = run(args.names, args.duration, args.batch_size, args.import_runs)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    elif not args.compare:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
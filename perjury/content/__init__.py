@@ -1,799 +1,85 @@
-MALE_NAMES = (
-    'james', 'john', 'robert', 'michael', 'william', 'david', 'richard',
-    'charles', 'joseph', 'thomas', 'christopher', 'daniel', 'paul', 'mark',
-    'donald', 'george', 'kenneth', 'steven', 'edward', 'brian', 'ronald',
-    'anthony', 'kevin', 'jason', 'matthew', 'gary', 'timothy', 'jose', 'larry',
-    'jeffrey', 'frank', 'scott', 'eric', 'stephen', 'andrew', 'raymond',
-    'gregory', 'joshua', 'jerry', 'dennis', 'walter', 'patrick', 'peter',
-    'harold', 'douglas', 'henry', 'carl', 'arthur', 'ryan', 'roger', 'joe',
-    'juan', 'jack', 'albert', 'jonathan', 'justin', 'terry', 'gerald', 'keith',
-    'samuel', 'willie', 'ralph', 'lawrence', 'nicholas', 'roy', 'benjamin',
-    'bruce', 'brandon', 'adam', 'harry', 'fred', 'wayne', 'billy', 'steve',
-    'louis', 'jeremy', 'aaron', 'randy', 'howard', 'eugene', 'carlos',
-    'russell', 'bobby', 'victor', 'martin', 'ernest', 'phillip', 'todd',
-    'jesse', 'craig', 'alan', 'shawn', 'clarence', 'sean', 'philip', 'chris',
-    'johnny', 'earl', 'jimmy', 'antonio', 'danny', 'bryan', 'tony', 'luis',
-    'mike', 'stanley', 'leonard', 'nathan', 'dale', 'manuel', 'rodney',
-    'curtis', 'norman', 'allen', 'marvin', 'vincent', 'glenn', 'jeffery',
-    'travis', 'jeff', 'chad', 'jacob', 'lee', 'melvin', 'alfred', 'kyle',
-    'francis', 'bradley', 'jesus', 'herbert', 'frederick', 'ray', 'joel',
-    'edwin', 'don', 'eddie', 'ricky', 'troy', 'randall', 'barry', 'alexander',
-    'bernard', 'mario', 'leroy', 'francisco', 'marcus', 'micheal', 'theodore',
-    'clifford', 'miguel', 'oscar', 'jay', 'jim', 'tom', 'calvin', 'alex',
-    'jon', 'ronnie', 'bill', 'lloyd', 'tommy', 'leon', 'derek', 'warren',
-    'darrell', 'jerome', 'floyd', 'leo', 'alvin', 'tim', 'wesley', 'gordon',
-    'dean', 'greg', 'jorge', 'dustin', 'pedro', 'derrick', 'dan', 'lewis',
-    'zachary', 'corey', 'herman', 'maurice', 'vernon', 'roberto', 'clyde',
-    'glen', 'hector', 'shane', 'ricardo', 'sam', 'rick', 'lester', 'brent',
-    'ramon', 'charlie', 'tyler', 'gilbert', 'gene', 'marc', 'reginald',
-    'ruben', 'brett', 'angel', 'nathaniel', 'rafael', 'leslie', 'edgar',
-    'milton', 'raul', 'ben', 'chester', 'cecil', 'duane', 'franklin', 'andre',
-    'elmer', 'brad', 'gabriel', 'ron', 'mitchell', 'roland', 'arnold',
-    'harvey', 'jared', 'adrian', 'karl', 'cory', 'claude', 'erik', 'darryl',
-    'jamie', 'neil', 'jessie', 'christian', 'javier', 'fernando', 'clinton',
-    'ted', 'mathew', 'tyrone', 'darren', 'lonnie', 'lance', 'cody', 'julio',
-    'kelly', 'kurt', 'allan', 'nelson', 'guy', 'clayton', 'hugh', 'max',
-    'dwayne', 'dwight', 'armando', 'felix', 'jimmie', 'everett', 'jordan',
-    'ian', 'wallace', 'ken', 'bob', 'jaime', 'casey', 'alfredo', 'alberto',
-    'dave', 'ivan', 'johnnie', 'sidney', 'byron', 'julian', 'isaac', 'morris',
-    'clifton', 'willard', 'daryl', 'ross', 'virgil', 'andy', 'marshall',
-    'salvador', 'perry', 'kirk', 'sergio', 'marion', 'tracy', 'seth', 'kent',
-    'terrance', 'rene', 'eduardo', 'terrence', 'enrique', 'freddie', 'wade',
-    )
+"""
+Word lists used by the builtin generators.
 
-FEMALE_NAMES = (
-    'mary', 'patricia', 'linda', 'barbara', 'elizabeth', 'jennifer', 'maria',
-    'susan', 'margaret', 'dorothy', 'lisa', 'nancy', 'karen', 'betty', 'helen',
-    'sandra', 'donna', 'carol', 'ruth', 'sharon', 'michelle', 'laura', 'sarah',
-    'kimberly', 'deborah', 'jessica', 'shirley', 'cynthia', 'angela',
-    'melissa', 'brenda', 'amy', 'anna', 'rebecca', 'virginia', 'kathleen',
-    'pamela', 'martha', 'debra', 'amanda', 'stephanie', 'carolyn', 'christine',
-    'marie', 'janet', 'catherine', 'frances', 'ann', 'joyce', 'diane', 'alice',
-    'julie', 'heather', 'teresa', 'doris', 'gloria', 'evelyn', 'jean',
-    'cheryl', 'mildred', 'katherine', 'joan', 'ashley', 'judith', 'rose',
-    'janice', 'kelly', 'nicole', 'judy', 'christina', 'kathy', 'theresa',
-    'beverly', 'denise', 'tammy', 'irene', 'jane', 'lori', 'rachel', 'marilyn',
-    'andrea', 'kathryn', 'louise', 'sara', 'anne', 'jacqueline', 'wanda',
-    'bonnie', 'julia', 'ruby', 'lois', 'tina', 'phyllis', 'norma', 'paula',
-    'diana', 'annie', 'lillian', 'emily', 'robin', 'peggy', 'crystal',
-    'gladys', 'rita', 'dawn', 'connie', 'florence', 'tracy', 'edna', 'tiffany',
-    'carmen', 'rosa', 'cindy', 'grace', 'wendy', 'victoria', 'edith', 'kim',
-    'sherry', 'sylvia', 'josephine', 'thelma', 'shannon', 'sheila', 'ethel',
-    'ellen', 'elaine', 'marjorie', 'carrie', 'charlotte', 'monica', 'esther',
-    'pauline', 'emma', 'juanita', 'anita', 'rhonda', 'hazel', 'amber', 'eva',
-    'debbie', 'april', 'leslie', 'clara', 'lucille', 'jamie', 'joanne',
-    'eleanor', 'valerie', 'danielle', 'megan', 'alicia', 'suzanne', 'michele',
-    'gail', 'bertha', 'darlene', 'veronica', 'jill', 'erin', 'geraldine',
-    'lauren', 'cathy', 'joann', 'lorraine', 'lynn', 'sally', 'regina', 'erica',
-    'beatrice', 'dolores', 'bernice', 'audrey', 'yvonne', 'annette', 'june',
-    'samantha', 'marion', 'dana', 'stacy', 'ana', 'renee', 'ida', 'vivian',
-    'roberta', 'holly', 'brittany', 'melanie', 'loretta', 'yolanda',
-    'jeanette', 'laurie', 'katie', 'kristen', 'vanessa', 'alma', 'sue',
-    'elsie', 'beth', 'jeanne', 'vicki', 'carla', 'tara', 'rosemary', 'eileen',
-    'terri', 'gertrude', 'lucy', 'tonya', 'ella', 'stacey', 'wilma', 'gina',
-    'kristin', 'jessie', 'natalie', 'agnes', 'vera', 'willie', 'charlene',
-    'bessie', 'delores', 'melinda', 'pearl', 'arlene', 'maureen', 'colleen',
-    'allison', 'tamara', 'joy', 'georgia', 'constance', 'lillie', 'claudia',
-    'jackie', 'marcia', 'tanya', 'nellie', 'minnie', 'marlene', 'heidi',
-    'glenda', 'lydia', 'viola', 'courtney', 'marian', 'stella', 'caroline',
-    'dora', 'jo', 'vickie', 'mattie', 'terry', 'maxine', 'irma', 'mabel',
-    'marsha', 'myrtle', 'lena', 'christy', 'deanna', 'patsy', 'hilda',
-    'gwendolyn', 'jennie', 'nora', 'margie', 'nina', 'cassandra', 'leah',
-    'penny', 'kay', 'priscilla', 'naomi', 'carole', 'brandy', 'olga', 'billie',
-    'dianne', 'tracey', 'leona', 'jenny', 'felicia', 'sonia', 'miriam',
-    'velma', 'becky', 'bobbie', 'violet', 'kristina', 'toni', 'misty', 'mae',
-    'shelly', 'daisy', 'ramona', 'sherri', 'erika', 'katrina', 'claire',
-    'lindsey', 'lindsay', 'geneva', 'guadalupe', 'belinda', 'margarita',
-    'sheryl', 'cora', 'faye', 'ada', 'natasha', 'sabrina', 'isabel',
-    'marguerite', 'hattie', 'harriet', 'molly', 'cecilia', 'kristi', 'brandi',
-    'blanche', 'sandy', 'rosie', 'joanna', 'iris', 'eunice', 'angie', 'inez',
-    'lynda', 'madeline', 'amelia', 'alberta', 'genevieve', 'monique', 'jodi',
-    'janie', 'maggie', 'kayla', 'sonya', 'jan', 'lee', 'kristine', 'candace',
-    'fannie', 'maryann', 'opal', 'alison', 'yvette', 'melody', 'luz', 'susie',
-    'olivia', 'flora', 'shelley', 'kristy', 'mamie', 'lula', 'lola', 'verna',
-    'beulah', 'antoinette', 'candice', 'juana', 'jeannette', 'pam', 'kelli',
-    'hannah', 'whitney', 'bridget', 'karla', 'celia', 'latoya', 'patty',
-    'shelia', 'gayle', 'della', 'vicky', 'lynne', 'sheri', 'marianne', 'kara',
-    'jacquelyn', 'erma', 'blanca', 'myra', 'leticia', 'pat', 'krista',
-    'roxanne', 'angelica', 'johnnie', 'robyn', 'francis', 'adrienne',
-    'rosalie', 'alexandra', 'brooke', 'bethany', 'sadie', 'bernadette',
-    'traci', 'jody', 'kendra', 'jasmine', 'nichole', 'rachael', 'chelsea',
-    'mable', 'ernestine', 'muriel', 'marcella', 'elena', 'krystal', 'angelina',
-    'nadine', 'kari', 'estelle', 'dianna', 'paulette', 'lora', 'mona',
-    'doreen', 'rosemarie', 'angel', 'desiree', 'antonia', 'hope', 'ginger',
-    'janis', 'betsy', 'christie', 'freda', 'mercedes', 'meredith', 'lynette',
-    'teri', 'cristina', 'eula', 'leigh', 'meghan', 'sophia', 'eloise',
-    'rochelle', 'gretchen', 'cecelia', 'raquel', 'henrietta', 'alyssa', 'jana',
-    'kelley', 'gwen', 'kerry', 'jenna', 'tricia', 'laverne', 'olive', 'alexis',
-    'tasha', 'silvia', 'elvira', 'casey', 'delia', 'sophie', 'kate', 'patti',
-    'lorena', 'kellie', 'sonja', 'lila', 'lana', 'darla', 'may', 'mindy',
-    'essie', 'mandy', 'lorene', 'elsa', 'josefina', 'jeannie', 'miranda',
-    'dixie', 'lucia', 'marta', 'faith', 'lela', 'johanna', 'shari', 'camille',
-    'tami', 'shawna', 'elisa', 'ebony', 'melba', 'ora', 'nettie', 'tabitha',
-    'ollie', 'jaime', 'winifred', 'kristie', 'marina', 'alisha', 'aimee',
-    'rena', 'myrna', 'marla', 'tammie', 'latasha', 'bonita', 'patrice',
-    'ronda', 'sherrie', 'addie', 'francine', 'deloris', 'stacie', 'adriana',
-    'cheri', 'shelby', 'abigail', 'celeste', 'jewel', 'cara', 'adele',
-    'rebekah', 'lucinda', 'dorthy', 'chris', 'effie', 'trina', 'reba', 'shawn',
-    'sallie', 'aurora', 'lenora', 'etta', 'lottie', 'kerri', 'trisha', 'nikki',
-    'estella', 'francisca', 'josie', 'tracie', 'marissa', 'karin', 'brittney',
-    'janelle', 'lourdes', 'laurel', 'helene', 'fern', 'elva', 'corinne',
-    'kelsey', 'ina', 'bettie', 'elisabeth', 'aida', 'caitlin', 'ingrid', 'iva',
-    'eugenia', 'christa', 'goldie', 'cassie', 'maude', 'jenifer', 'therese',
-    'frankie', 'dena', 'lorna', 'janette', 'latonya', 'candy', 'morgan',
-    'consuelo', 'tamika', 'rosetta', 'debora', 'cherie', 'polly', 'dina',
-    'jewell', 'fay', 'jillian', 'dorothea', 'nell', 'trudy', 'esperanza',
-    'patrica', 'kimberley', 'shanna', 'helena', 'carolina', 'cleo', 'stefanie',
-    'rosario', 'ola', 'janine', 'mollie', 'lupe', 'alisa', 'lou', 'maribel',
-    'susanne', 'bette', 'susana', 'elise', 'cecile', 'isabelle', 'lesley',
-    'jocelyn', 'paige', 'joni', 'rachelle', 'leola', 'daphne', 'alta', 'ester',
-    'petra', 'graciela', 'imogene', 'jolene', 'keisha', 'lacey', 'glenna',
-    'gabriela', 'keri', 'ursula', 'lizzie', 'kirsten', 'shana', 'adeline',
-    'mayra', 'jayne', 'jaclyn', 'gracie', 'sondra', 'carmela', 'marisa',
-    'rosalind', 'charity', 'tonia', 'beatriz', 'marisol', 'clarice', 'jeanine',
-    'sheena', 'angeline', 'frieda', 'lily', 'robbie', 'shauna', 'millie',
-    'claudette', 'cathleen', 'angelia', 'gabrielle', 'autumn', 'katharine',
-    'summer', 'jodie', 'staci', 'lea', 'christi', 'jimmie', 'justine', 'elma',
-    'luella', 'margret', 'dominique', 'socorro', 'rene', 'martina', 'margo',
-    'mavis', 'callie', 'bobbi', 'maritza', 'lucile', 'leanne', 'jeannine',
-    'deana', 'aileen', 'lorie', 'ladonna', 'willa', 'manuela', 'gale', 'selma',
-    'dolly', 'sybil', 'abby', 'lara', 'dale', 'ivy', 'dee', 'winnie', 'marcy',
-    'luisa', 'jeri', 'magdalena', 'ofelia', 'meagan', 'audra', 'matilda',
-    'leila', 'cornelia', 'bianca', 'simone', 'bettye', 'randi', 'virgie',
-    'latisha', 'barbra', 'georgina', 'eliza', 'leann', 'bridgette', 'rhoda',
-    'haley', 'adela', 'nola', 'bernadine', 'flossie', 'ila', 'greta', 'ruthie',
-    'nelda', 'minerva', 'lilly', 'terrie', 'letha', 'hilary', 'estela',
-    'valarie', 'brianna', 'rosalyn', 'earline', 'catalina', 'ava', 'mia',
-    'clarissa', 'lidia', 'corrine', 'alexandria', 'concepcion', 'tia',
-    'sharron', 'rae', 'dona', 'ericka', 'jami', 'elnora', 'chandra', 'lenore',
-    'neva', 'marylou', 'melisa', 'tabatha', 'serena', 'avis', 'allie', 'sofia',
-    'jeanie', 'odessa', 'nannie', 'harriett', 'loraine', 'penelope',
-    'milagros', 'emilia', 'benita', 'allyson', 'ashlee', 'tania', 'tommie',
-    'esmeralda', 'karina', 'eve', 'pearlie', 'zelma', 'malinda', 'noreen',
-    'tameka', 'saundra', 'hillary', 'amie', 'althea', 'rosalinda', 'jordan',
-    'lilia', 'alana', 'gay', 'clare', 'alejandra', 'elinor', 'michael',
-    'lorrie', 'jerri', 'darcy', 'earnestine', 'carmella', 'taylor', 'noemi',
-    'marcie', 'liza', 'annabelle', 'louisa', 'earlene', 'mallory', 'carlene',
-    'nita', 'selena', 'tanisha', 'katy', 'julianne', 'john', 'lakisha',
-    'edwina', 'maricela', 'margery', 'kenya', 'dollie', 'roxie', 'roslyn',
-    'kathrine', 'nanette', 'charmaine', 'lavonne', 'ilene', 'kris', 'tammi',
-    'suzette', 'corine', 'kaye', 'jerry',
-    )
+Each list is stored one entry per line in a text file next to this module and
+is only read from disk the first time it is used, so importing perjury does
+not pay for content that is never generated.  The module level names are
+:class:`LazyContent` sequences that behave like the tuples they load.
+"""
+import os.path
+
+
+CONTENT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_cache = {}
+
+
+def load(name):
+    """
+    Returns the content file ``name`` as a tuple of lines.  Files are read at
+    most once per process.
+    """
+    try:
+        return _cache[name]
+    except KeyError:
+        pass
+
+    with open(os.path.join(CONTENT_DIR, '{0}.txt'.format(name))) as f:
+        content = tuple(line.rstrip('\n') for line in f if line.strip())
+
+    _cache[name] = content
+    return content
+
+
+class LazyContent(object):
+    """
+    Read only sequence of the concatenated content files ``names``, loaded on
+    first use.
+    """
+    def __init__(self, *names):
+        self.names = names
+        self._content = None
+
+    def resolve(self):
+        """
+        Returns the loaded content as a tuple.
+        """
+        if self._content is None:
+            content = ()
+            for name in self.names:
+                content += load(name)
+            self._content = content
+        return self._content
+
+    def __len__(self):
+        return len(self.resolve())
+
+    def __getitem__(self, index):
+        return self.resolve()[index]
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __contains__(self, value):
+        return value in self.resolve()
+
+    def __add__(self, other):
+        if isinstance(other, LazyContent):
+            return LazyContent(*(self.names + other.names))
+        return self.resolve() + tuple(other)
+
+    def __repr__(self):
+        return 'LazyContent({0})'.format(', '.join(map(repr, self.names)))
+
+
+MALE_NAMES = LazyContent('male_names')
+
+FEMALE_NAMES = LazyContent('female_names')
 
 FIRST_NAMES = MALE_NAMES + FEMALE_NAMES
 
-LAST_NAMES = (
-    'smith', 'johnson', 'williams', 'jones', 'brown', 'davis', 'miller',
-    'wilson', 'moore', 'taylor', 'anderson', 'thomas', 'jackson', 'white',
-    'harris', 'martin', 'thompson', 'garcia', 'martinez', 'robinson', 'clark',
-    'rodriguez', 'lewis', 'lee', 'walker', 'hall', 'allen', 'young',
-    'hernandez', 'king', 'wright', 'lopez', 'hill', 'scott', 'green', 'adams',
-    'baker', 'gonzalez', 'nelson', 'carter', 'mitchell', 'perez', 'roberts',
-    'turner', 'phillips', 'campbell', 'parker', 'evans', 'edwards', 'collins',
-    'stewart', 'sanchez', 'morris', 'rogers', 'reed', 'cook', 'morgan', 'bell',
-    'murphy', 'bailey', 'rivera', 'cooper', 'richardson', 'cox', 'howard',
-    'ward', 'torres', 'peterson', 'gray', 'ramirez', 'james', 'watson',
-    'brooks', 'kelly', 'sanders', 'price', 'bennett', 'wood', 'barnes', 'ross',
-    'henderson', 'coleman', 'jenkins', 'perry', 'powell', 'long', 'patterson',
-    'hughes', 'flores', 'washington', 'butler', 'simmons', 'foster',
-    'gonzales', 'bryant', 'alexander', 'russell', 'griffin', 'diaz', 'hayes',
-    'myers', 'ford', 'hamilton', 'graham', 'sullivan', 'wallace', 'woods',
-    'cole', 'west', 'jordan', 'owens', 'reynolds', 'fisher', 'ellis',
-    'harrison', 'gibson', 'mcdonald', 'cruz', 'marshall', 'ortiz', 'gomez',
-    'murray', 'freeman', 'wells', 'webb', 'simpson', 'stevens', 'tucker',
-    'porter', 'hunter', 'hicks', 'crawford', 'henry', 'boyd', 'mason',
-    'morales', 'kennedy', 'warren', 'dixon', 'ramos', 'reyes', 'burns',
-    'gordon', 'shaw', 'holmes', 'rice', 'robertson', 'hunt', 'black',
-    'daniels', 'palmer', 'mills', 'nichols', 'grant', 'knight', 'ferguson',
-    'rose', 'stone', 'hawkins', 'dunn', 'perkins', 'hudson', 'spencer',
-    'gardner', 'stephens', 'payne', 'pierce', 'berry', 'matthews', 'arnold',
-    'wagner', 'willis', 'ray', 'watkins', 'olson', 'carroll', 'duncan',
-    'snyder', 'hart', 'cunningham', 'bradley', 'lane', 'andrews', 'ruiz',
-    'harper', 'fox', 'riley', 'armstrong', 'carpenter', 'weaver', 'greene',
-    'lawrence', 'elliott', 'chavez', 'sims', 'austin', 'peters', 'kelley',
-    'franklin', 'lawson', 'fields', 'gutierrez', 'ryan', 'schmidt', 'carr',
-    'vasquez', 'castillo', 'wheeler', 'chapman', 'oliver', 'montgomery',
-    'richards', 'williamson', 'johnston', 'banks', 'meyer', 'bishop', 'mccoy',
-    'howell', 'alvarez', 'morrison', 'hansen', 'fernandez', 'garza', 'harvey',
-    'little', 'burton', 'stanley', 'nguyen', 'george', 'jacobs', 'reid', 'kim',
-    'fuller', 'lynch', 'dean', 'gilbert', 'garrett', 'romero', 'welch',
-    'larson', 'frazier', 'burke', 'hanson', 'day', 'mendoza', 'moreno',
-    'bowman', 'medina', 'fowler', 'brewer', 'hoffman', 'carlson', 'silva',
-    'pearson', 'holland', 'douglas', 'fleming', 'jensen', 'vargas', 'byrd',
-    'davidson', 'hopkins', 'may', 'terry', 'herrera', 'wade', 'soto',
-    'walters', 'curtis', 'neal', 'caldwell', 'lowe', 'jennings', 'barnett',
-    'graves', 'jimenez', 'horton', 'shelton', 'barrett', 'obrien', 'castro',
-    'sutton', 'gregory', 'mckinney', 'lucas', 'miles', 'craig', 'rodriquez',
-    'chambers', 'holt', 'lambert', 'fletcher', 'watts', 'bates', 'hale',
-    'rhodes', 'pena', 'beck', 'newman', 'haynes', 'mcdaniel', 'mendez', 'bush',
-    'vaughn', 'parks', 'dawson', 'santiago', 'norris', 'hardy', 'love',
-    'steele', 'curry', 'powers', 'schultz', 'barker', 'guzman', 'page',
-    'munoz', 'ball', 'keller', 'chandler', 'weber', 'leonard', 'walsh',
-    'lyons', 'ramsey', 'wolfe', 'schneider', 'mullins', 'benson', 'sharp',
-    'bowen', 'daniel', 'barber', 'cummings', 'hines', 'baldwin', 'griffith',
-    'valdez', 'hubbard', 'salazar', 'reeves', 'warner', 'stevenson', 'burgess',
-    'santos', 'tate', 'cross', 'garner', 'mann', 'mack', 'moss', 'thornton',
-    'dennis', 'mcgee', 'farmer', 'delgado', 'aguilar', 'vega', 'glover',
-    'manning', 'cohen', 'harmon', 'rodgers', 'robbins', 'newton', 'todd',
-    'blair', 'higgins', 'ingram', 'reese', 'cannon', 'strickland', 'townsend',
-    'potter', 'goodwin', 'walton', 'rowe', 'hampton', 'ortega', 'patton',
-    'swanson', 'joseph', 'francis', 'goodman', 'maldonado', 'yates', 'becker',
-    'erickson', 'hodges', 'rios', 'conner', 'adkins', 'webster', 'norman',
-    'malone', 'hammond', 'flowers', 'cobb', 'moody', 'quinn', 'blake',
-    'maxwell', 'pope', 'floyd', 'osborne', 'paul', 'mccarthy', 'guerrero',
-    'lindsey', 'estrada', 'sandoval', 'gibbs', 'tyler', 'gross', 'fitzgerald',
-    'stokes', 'doyle', 'sherman', 'saunders', 'wise', 'colon', 'gill',
-    'alvarado', 'greer', 'padilla', 'simon', 'waters', 'nunez', 'ballard',
-    'schwartz', 'mcbride', 'houston', 'christensen', 'klein', 'pratt',
-    'briggs', 'parsons', 'mclaughlin', 'zimmerman', 'french', 'buchanan',
-    'moran', 'copeland', 'roy', 'pittman', 'brady', 'mccormick', 'holloway',
-    'brock', 'poole', 'frank', 'logan', 'owen', 'bass', 'marsh', 'drake',
-    'wong', 'jefferson', 'park', 'morton', 'abbott', 'sparks', 'patrick',
-    'norton', 'huff', 'clayton', 'massey', 'lloyd', 'figueroa', 'carson',
-    'bowers', 'roberson', 'barton', 'tran', 'lamb', 'harrington', 'casey',
-    'boone', 'cortez', 'clarke', 'mathis', 'singleton', 'wilkins', 'cain',
-    'bryan', 'underwood', 'hogan', 'mckenzie', 'collier', 'luna', 'phelps',
-    'mcguire', 'allison', 'bridges', 'wilkerson', 'nash', 'summers', 'atkins',
-    'wilcox', 'pitts', 'conley', 'marquez', 'burnett', 'richard', 'cochran',
-    'chase', 'davenport', 'hood', 'gates', 'clay', 'ayala', 'sawyer', 'roman',
-    'vazquez', 'dickerson', 'hodge', 'acosta', 'flynn', 'espinoza',
-    'nicholson', 'monroe', 'wolf', 'morrow', 'kirk', 'randall', 'anthony',
-    'whitaker', 'oconnor', 'skinner', 'ware', 'molina', 'kirby', 'huffman',
-    'bradford', 'charles', 'gilmore', 'dominguez', 'oneal', 'bruce', 'lang',
-    'combs', 'kramer', 'heath', 'hancock', 'gallagher', 'gaines', 'shaffer',
-    'short', 'wiggins', 'mathews', 'mcclain', 'fischer', 'wall', 'small',
-    'melton', 'hensley', 'bond', 'dyer', 'cameron', 'grimes', 'contreras',
-    'christian', 'wyatt', 'baxter', 'snow', 'mosley', 'shepherd', 'larsen',
-    'hoover', 'beasley', 'glenn', 'petersen', 'whitehead', 'meyers', 'keith',
-    'garrison', 'vincent', 'shields', 'horn', 'savage', 'olsen', 'schroeder',
-    'hartman', 'woodard', 'mueller', 'kemp', 'deleon', 'booth', 'patel',
-    'calhoun', 'wiley', 'eaton', 'cline', 'navarro', 'harrell', 'lester',
-    'humphrey', 'parrish', 'duran', 'hutchinson', 'hess', 'dorsey', 'bullock',
-    'robles', 'beard', 'dalton', 'avila', 'vance', 'rich', 'blackwell', 'york',
-    'johns', 'blankenship', 'trevino', 'salinas', 'campos', 'pruitt', 'moses',
-    'callahan', 'golden', 'montoya', 'hardin', 'guerra', 'mcdowell', 'carey',
-    'stafford', 'gallegos', 'henson', 'wilkinson', 'booker', 'merritt',
-    'miranda', 'atkinson', 'orr', 'decker', 'hobbs', 'preston', 'tanner',
-    'knox', 'pacheco', 'stephenson', 'glass', 'rojas', 'serrano', 'marks',
-    'hickman', 'english', 'sweeney', 'strong', 'prince', 'mcclure', 'conway',
-    'walter', 'roth', 'maynard', 'farrell', 'lowery', 'hurst', 'nixon',
-    'weiss', 'trujillo', 'ellison', 'sloan', 'juarez', 'winters', 'mclean',
-    'randolph', 'leon', 'boyer', 'villarreal', 'mccall', 'gentry', 'carrillo',
-    'kent', 'ayers', 'lara', 'shannon', 'sexton', 'pace', 'hull', 'leblanc',
-    'browning', 'velasquez', 'leach', 'chang', 'house', 'sellers', 'herring',
-    'noble', 'foley', 'bartlett', 'mercado', 'landry', 'durham', 'walls',
-    'barr', 'mckee', 'bauer', 'rivers', 'everett', 'bradshaw', 'pugh', 'velez',
-    'rush', 'estes', 'dodson', 'morse', 'sheppard', 'weeks', 'camacho', 'bean',
-    'barron', 'livingston', 'middleton', 'spears', 'branch', 'blevins', 'chen',
-    'kerr', 'mcconnell', 'hatfield', 'harding', 'ashley', 'solis', 'herman',
-    'frost', 'giles', 'blackburn', 'william', 'pennington', 'woodward',
-    'finley', 'mcintosh', 'koch', 'best', 'solomon', 'mccullough', 'dudley',
-    'nolan', 'blanchard', 'rivas', 'brennan', 'mejia', 'kane', 'benton',
-    'joyce', 'buckley', 'haley', 'valentine', 'maddox', 'russo', 'mcknight',
-    'buck', 'moon', 'mcmillan', 'crosby', 'berg', 'dotson', 'mays', 'roach',
-    'church', 'chan', 'richmond', 'meadows', 'faulkner', 'oneill', 'knapp',
-    'kline', 'barry', 'ochoa', 'jacobson', 'gay', 'avery', 'hendricks',
-    'horne', 'shepard', 'hebert', 'cherry', 'cardenas', 'mcintyre', 'whitney',
-    'waller', 'holman', 'donaldson', 'cantu', 'terrell', 'morin', 'gillespie',
-    'fuentes', 'tillman', 'sanford', 'bentley', 'peck', 'key', 'salas',
-    'rollins', 'gamble', 'dickson', 'battle', 'santana', 'cabrera',
-    'cervantes', 'howe', 'hinton', 'hurley', 'spence', 'zamora', 'yang',
-    'mcneil', 'suarez', 'case', 'petty', 'gould', 'mcfarland', 'sampson',
-    'carver', 'bray', 'rosario', 'macdonald', 'stout', 'hester', 'melendez',
-    'dillon', 'farley', 'hopper', 'galloway', 'potts', 'bernard', 'joyner',
-    'stein', 'aguirre', 'osborn', 'mercer', 'bender', 'franco', 'rowland',
-    'sykes', 'benjamin', 'travis', 'pickett', 'crane', 'sears', 'mayo',
-    'dunlap', 'hayden', 'wilder', 'mckay', 'coffey', 'mccarty', 'ewing',
-    'cooley', 'vaughan', 'bonner', 'cotton', 'holder', 'stark', 'ferrell',
-    'cantrell', 'fulton', 'lynn', 'lott', 'calderon', 'rosa', 'pollard',
-    'hooper', 'burch', 'mullen', 'fry', 'riddle', 'levy', 'david', 'duke',
-    'odonnell', 'guy', 'michael', 'britt', 'frederick', 'daugherty', 'berger',
-    'dillard', 'alston', 'jarvis', 'frye', 'riggs', 'chaney', 'odom', 'duffy',
-    'fitzpatrick', 'valenzuela', 'merrill', 'mayer', 'alford', 'mcpherson',
-    'acevedo', 'donovan', 'barrera', 'albert', 'cote', 'reilly', 'compton',
-    'raymond', 'mooney', 'mcgowan', 'craft', 'cleveland', 'clemons', 'wynn',
-    'nielsen', 'baird', 'stanton', 'snider', 'rosales', 'bright', 'witt',
-    'stuart', 'hays', 'holden', 'rutledge', 'kinney', 'clements', 'castaneda',
-    'slater', 'hahn', 'emerson', 'conrad', 'burks', 'delaney', 'pate',
-    'lancaster', 'sweet', 'justice', 'tyson', 'sharpe', 'whitfield', 'talley',
-    'macias', 'irwin', 'burris', 'ratliff', 'mccray', 'madden', 'kaufman',
-    'beach', 'goff', 'cash', 'bolton', 'mcfadden', 'levine', 'good', 'byers',
-    'kirkland', 'kidd', 'workman', 'carney', 'dale', 'mcleod', 'holcomb',
-    'england', 'finch', 'head', 'burt', 'hendrix', 'sosa', 'haney', 'franks',
-    'sargent', 'nieves', 'downs', 'rasmussen', 'bird', 'hewitt', 'lindsay',
-    'le', 'foreman', 'valencia', 'oneil', 'delacruz', 'vinson', 'dejesus',
-    'hyde', 'forbes', 'gilliam', 'guthrie', 'wooten', 'huber', 'barlow',
-    'boyle', 'mcmahon', 'buckner', 'rocha', 'puckett', 'langley', 'knowles',
-    'cooke', 'velazquez', 'whitley', 'noel', 'vang',
-    )
+LAST_NAMES = LazyContent('last_names')
 
-WORD_LIST = (
-    'john', 'intense', 'lucky', 'solid', 'hot', 'clever', 'amusing', 'wicked',
-    'damp', 'sticky', 'warm', 'courteous', 'young', 'slow', 'selfish', 'great',
-    'vigorous', 'glamorous', 'clean', 'placid', 'enthusiastic', 'instinctive',
-    'wild', 'hurt', 'tricky', 'diplomatic', 'sympathetic', 'painstaking',
-    'raspy', 'proud', 'thoughtful', 'delicious', 'itchy', 'cute', 'debtor',
-    'trip', 'france', 'cone', 'missile', 'statistic', 'equipment', 'push',
-    'fine', 'antarctica', 'apparel', 'meteorology', 'tsunami', 'head',
-    'balance', 'fowl', 'spoon', 'croissant', 'library', 'purchase',
-    'staircase', 'wasp', 'carnation', 'cannon', 'bronze', 'glass', 'kendo',
-    'cello', 'taiwan', 'shape', 'cauliflower', 'green', 'run', 'scarf',
-    'tower', 'regret', 'disgust', 'roof', 'hen', 'law',
-        )
+WORD_LIST = LazyContent('word_list')
 
-USERNAMES = (
-    'oracle', 'nagios', 'postgres', 'ftpuser', 'temp', 'apache', 'testing',
-    'tester', 'student', 'tomcat', 'webadmin', 'alex', '123456', 'nobody',
-    'doofnase', 'paul', 'moehre', 'office', 'amanda', 'testuser', 'toor',
-    'john', 'david', 'administrator', 'michael', 'cyrus', 'linux', 'teamspeak',
-    'squid', 'adam', 'mike', 'prueba', 'spam', 'eric', 'server', 'richard',
-    'robert', 'r00t', 'students', 'qwerty', 'mailman', 'wwwrun', 'samba',
-    'sarah', 'danny', 'user1', 'pgsql', 'daniel', 'steve', '1q2w3e', '1234',
-    'test123', 'george', 'adrian', 'patrick', 'dave', 'chris', 'angel',
-    'james', 'bill', 'alan', 'thomas', 'frank', 'clamav', 'brian', 'mark',
-    'shell', 'anna', 'lisa', 'kevin', 'matt', 'library', 'internet', 'daemon',
-    'andrea', 'tony', 'martin', 'andrew', 'peter', 'jeff', 'jack', 'victor',
-    'cvsuser', 'jacob', 'uucp', 'nicole', 'angela', 'changeme', 'mythtv',
-    'susan', 'steven', 'welcome', 'laura', 'monica', 'anthony', 'gast', 'xbox',
-    'zabbix', '1a2b3c', 'smmsp', 'jason', 'mailtest', 'carlos', 'ftptest',
-    'justin', 'julia', 'sshd', 'webuser', 'sybase', 'fred', 'craig', 'julie',
-    'linda', 'kelly', 'jerry', 'jessica', 'informix', 'mary', 'patricia',
-    'aaron', 'scott', 'sara', 'stephen', 'carol', 'proxy', 'victoria',
-    'asterisk', 'larry', 'brett', 'maria', 'andy', 'felix', 'caroline',
-    'alberto', 'admins', 'elizabeth', 'sharon', 'barbara', 'albert', 'emma',
-    'webalizer', 'sync', 'jean', 'diane', 'install', 'emily', 'bruce', 'simon',
-    'marcus', 'abuse', '12345', 'alfred', 'vincent', 'allan', 'louise',
-    'charles', 'william', 'gary', 'test4', 'harry', 'gregory', 'alias',
-    'sandy', 'gopher', 'ronald', 'bwadmin', 'grace', 'nina', 'jordan', 'ircd',
-    'ashley', 'gabriel', 'cacti', 'alice', 'rpcuser', 'catherine', 'testftp',
-    'walter', 'scan', 'josh', 'gnats', 'diana', 'joshua', 'alexander',
-    'admin1', 'sysadmin', 'brad', 'mailnull', 'roger', 'olivia', 'denise',
-    'chloe', 'nancy', 'christine', 'cactiuser', 'users', 'tina', 'keith',
-    'vmail', 'claudia', 'dennis', 'marine', 'april', 'nfsnobody', 'jenny',
-    'admin2', 'sasha', 'robin', 'leslie', 'francis', 'alexandra', 'stephanie',
-    'ident', 'jboss', 'kate', 'samuel', 'helen', 'lucas', 'unknown', 'noel',
-    'cindy', 'monique', 'ellen', 'dana', 'abigail', 'jabber', 'oper', 'donna',
-    'claire', 'juan', 'ryan', 'eddie', 'console', 'angie', 'sunny', 'vscan',
-    'polycom', 'desktop', 'cpanel', 'sean', 'jimmy', 'matthew', 'arun',
-    'viktor', 'tiffany', 'maryse', 'henry', 'center', 'black', 'unix',
-    'edward', 'doug', 'contact', 'arthur', 'abby', 'sophie', 'carla',
-    'deborah', 'isabelle', 'debbie', 'toto', 'joseph', 'navy', 'chuck',
-    'cvsroot', 'identd', 'dovecot', 'louis', 'jeremy', 'share', 'madison',
-    'dean', 'amber', 'dino', 'phpbb', 'katie', 'cstrike', 'sandra', 'oliver',
-    'jessie', 'benjamin', 'natasha', 'lauren', 'philip', 'hacker', 'info2',
-    'pete', 'webmin', 'ftp1', 'vicky', 'elena', 'rebecca', 'lucky', 'core',
-    'bind', 'alin', 'mathilda', 'clark', 'mario', 'user2', 'marc', 'denis',
-    'dylan', 'junior', 'cecilia', 'arnold', 'samantha', 'cristina', 'staff',
-    'aron', 'anne', 'alina', 'ubuntu', 'naomi', 'virus', 'rachel', 'clara',
-    'cheryl', 'white', 'control', 'morgan', 'kernel', 'carmen', 'dexter',
-    'alumni', 'carl', 'alexis', 'andre', 'web1', 'telnetd', 'manage',
-    'recruit', 'cesar', 'tracy', 'tommy', 'mathilde', 'jennifer', 'customer',
-    'counter', 'maya', 'netdump', 'hera', 'trinity', 'taylor', 'openvpn',
-    'erin', 'nathan', 'martine', 'apache2', 'love', 'leon', 'oscar', 'halt',
-    'webpop', 'ivan', 'ftpadmin', 'redhat', 'austin', 'andreea', 'kayla',
-    'party', 'greg', 'daniela', 'patrol', 'emil', 'marthe', 'helpdesk',
-    'jeffrey', 'software', 'will', 'johnny', 'sysop', 'isabella', 'blue', 'print',
-    'press', 'martha', 'kristen', 'danielle', 'hans', 'anita', 'userftp', 'hadoop',
-    'class', 'betty', 'luis', 'bryan', 'bobby', 'verlihub', 'nathalie', 'karen',
-    'benny', 'stanley', 'sophia', 'shutdown', 'megan', 'marie', 'ldap', 'escape',
-    'andrei', 'seascape', 'elvis', 'db2inst1', 'dasusr1', 'luca', 'dummy',
-    'alicia', 'cactitest', 'cisco', 'exim', 'charlotte', 'brenda', 'bailey',
-    'marco', 'joan', 'anton', 'alexa', 'smbuser', 'jasmine', 'natalie',
-    'majordomo', 'bash', 'lily', 'eggdrop', 'dirk', 'pcap', 'gabrielle', 'bernard',
-    'tanya', 'sonny', 'ricky', 'paula', 'carolyn', 'stacey', 'teamspeak3',
-    'paulette', 'monitor', 'terry', 'nicholas', 'carolina', 'anderson', 'work',
-    'freddy', 'edith', 'camille', 'smith', 'sabrina', 'molly', 'abc123', 'allison',
-    'carrie', 'popa3d', 'harvey', 'renee', 'info1', 'ford', 'donald', 'boris',
-    'michelle', 'ella', 'bart', 'school', 'nokia', 'stan', 'riley', 'hector',
-    'dark', 'christopher', 'alison', 'marty', 'debian', 'pamela', 'jonathan',
-    'adriana', 'PlcmSpIp', 'pascal', 'astrid', 'scanner', 'prova', 'jill',
-    'bogdan', 'valerie', 'abel', 'harold', 'brandon', 'pass', 'boss', 'sydney',
-    'passwd', 'vcsa', 'odette', 'faith', 'erika', 'apple', 'aurora', 'alyssa',
-    'sbear', 'christian', 'zenoss', 'ramesh', 'nikita', 'graham', 'gold', 'hailey',
-    'edgar', 'destiny', 'jackie', 'root2', 'nath', 'leah', 'jane', 'test5',
-    'teacher', 'shoutcast', 'alpha', 'rose', 'ftpguest', 'florence', 'ethan',
-    'cynthia', 'appserver', 'web2', 'wang', 'super', 'glenn', 'fran', 'andi',
-    'beth', 'cristi', 'build', 'firewall', 'phil', 'open', 'melissa', 'annie',
-    'angelina', 'admissions', 'adminweb', 'vpopmail', 'green', 'dorothy', 'doctor',
-    'brooke', 'weblogic', 'penelope', 'emerson', 'adela', 'sebastian', 'reception',
-    'marvin', 'kaitlyn', 'joey', 'elisa', 'connie', 'normi', 'miguel', 'lorena',
-    'gabriella', 'arianna', 'oceance', 'math', 'erica', 'vanessa', 'paige',
-    'kathy', 'clinton', 'rick', 'cathy', 'barry', 'webcam', 'raul', 'play',
-    'eugen', 'bruno', 'ventas', 'sabine', '12345678', 'soft', 'judith', 'filip',
-    'darwin', 'brigitte', 'vivian', 'transfer', 'shit', 'margaret', 'fabio',
-    'claude', 'charlie', 'agent', 'tamara', 'roberto', 'franklin', 'angelo',
-    'sherry', 'andres', 'admin123', 'resin', 'duncan', 'dinesh', 'calvin',
-    'virginia', 'mihai', 'eduard', 'director', 'dawn', 'casey', 'yolanda', 'sally',
-    'rosa', 'joanne', 'emmanuel', 'candy', 'antonio', 'user3', 'russ', 'ines',
-    'gerry', 'ernest', 'timothy', 'michel', 'cruz', 'webadm', 'qazwsx', 'jesse',
-    'jenna', 'heather', 'gloria', 'allen', 'test01', 'psybnc', 'lynx', 'king',
-    'herbert', 'fluffy', 'andra', 'wayne', 'trash', 'qtss', 'ahmed', 'word',
-    'rich', 'mona', 'iris', 'deploy', 'testmail', 'test12', 'nasa', 'maggie',
-    'hannah', 'american', 'gordon', 'delta', 'collins', 'dominique', 'cecile',
-    'beatrice', 'webtest', 'karl', 'doris', 'agnes', 'sven', 'ruben', 'gracie',
-    'madeline', 'eddy', 'diego', 'dani', 'china', 'appowner', 'theresa', 'theo',
-    'mikael', 'magic', 'bert', 'vlad', 'kylie', 'helene', 'gina', 'douglas',
-    'cara', 'wilma', 'smart', 'mickey', 'emilie', 'brianna', 'userweb', 'orange',
-    'jesus', 'alyson', 'virtual', 'star', 'securityagent', 'matrix', 'isabel',
-    'christina', 'canna', 'stefan', 'mailbox', 'gnax', 'gabi', 'snort', 'rafael',
-    'purple', 'hack', 'foster', 'bret', 'amavisd', 'webster', 'portal', 'merlin',
-    'leonard', 'wwwdata', 'veronica', 'tomcat4', 'kaylee', 'guest2', 'aaliyah',
-    'stella', 'beta', 'asia', 'alexandru', 'makayla', 'katherine', 'earl', 'cody',
-    'marcel', 'jared', 'computer', 'valentin', 'tested', 'melody', 'maurice',
-    'dominic', 'dick', 'corinne', 'carter', 'backuppc', 'vmware', 'sylvia',
-    'squirrelmail', 'oracle1', 'nscd', 'manuel', 'julian', 'vladimir', 'test6',
-    'savannah', 'jeanne', 'abraham', 'judy', 'joel', 'eugene', 'xerox',
-    'windowserver', 'pauline', 'omega', 'hlds', 'harris', 'tokend', 'tara',
-    'silver', 'rock', 'joanna', 'hugo', 'erik', 'chantal', 'amavis', 'suva',
-    'seth', 'lukas', 'ftpusr', 'elise', 'audrey', 'anurag', 'antony', 'andreas',
-    'radu', 'joyce', 'jose', 'spider', 'mckenna', 'aida', 'test7', 'production',
-    'lynn', 'flower', 'emanuela', 'dustin', '1234567', 'station', 'perry', 'mouse',
-    'lucie', 'billy', 'alvin', 'wolfgang', 'wendy', 'marina', 'lorraine', 'ingrid',
-    'fedora', 'remote', 'georgia', 'brandy', 'avery', 'otto', 'kimberly', 'huang',
-    'eppc', 'dedicated', 'daisy', 'content', 'bird', 'user123', 'player', 'edwin',
-    'sammy', 'friends', 'dbadmin', 'simona', 'pedro', 'igor', 'eleanor', 'amalia',
-    'adine', 'view', 'testtest', 'ruth', 'physics', 'karina', 'harley', 'ginger',
-    'cyrusimap', 'colin', 'willie', 'raymond', 'ralph', 'evelyn', 'xavier',
-    'silvia', 'mariana', 'leroy', 'fabrice', 'divine', 'dale', 'claudine', 'bear',
-    'xgridagent', 'summer', 'spike', 'skylar', 'pico', 'luke', 'ftp123', 'crystal',
-    'cameron', 'azure', 'amelia', 'samir', 'fabian', 'elaine', 'christiane',
-    'stacy', 'rene', 'postgresql', 'nadia', 'heidi', 'demos', 'courier',
-    'bernadette', 'anastacia', 'Aaron', 'xgridcontroller', 'test8', 'sonia',
-    'harrison', 'antoinette', 'annette', 'violet', 'solaris', 'mackenzie', 'janet',
-    'ingres', 'clock', 'britney', 'vera', 'rita', 'norman', 'morris', 'irene',
-    'courtney', 'snoopy', 'hunter', 'frances', 'eleve', 'basic', 'alka', 'wilson',
-    'walker', 'pablo', 'marlon', 'laurie', 'pink', 'japan', 'genevieve', 'asdfgh',
-    '111111', 'swsoft', 'shaun', 'radiomail', 'marius', 'kristin', 'grey', 'copia',
-    'colette', 'cafe', 'bunny', 'alain', 'wolf', 'shadow', 'jojo', 'jasmin',
-    'cyber', 'coco', 'clemence', 'bianca', 'bella', 'africa', 'adolf', 'adeline',
-    'test9', 'superman', 'roland', 'india', 'corinna', 'carina', 'bran', 'bradley',
-    'aptproxy', 'ursula', 'ross', 'nickelan', 'kmem', 'harrypotter', 'christelle',
-    'brown', 'yahoo', 'reagan', 'francois', 'enzo', 'michi', 'horde', 'guest3',
-    'florian', 'derek', 'capucine', 'Zmeu', 'wesley', 'rodrigo', 'natalia',
-    'mercedes', 'josette', 'database', 'carson', 'caesar', 'bridget', 'text',
-    'philippine', 'olga', 'leonardo', 'helena', 'freebsd', 'celia', 'antonia',
-    '000000', 'teresa', 'stef', 'owen', 'leticia', 'laurent', 'fish', 'dany',
-    'damian', 'constance', 'catalin', 'bank', 'baby', 'alec', 'adolph', 'tuxedo',
-    'proba', 'nico', 'knoppix', 'guest1', 'felicia', 'diamond', 'chester',
-    'cassie', 'windows', 'test03', 'ftpd', 'doodz', 'dance', 'chase', 'aurelie',
-    'stuart', 'regina', 'lance', 'connor', 'catalina', 'pierre', 'monika',
-    'marcelle', 'lucy', 'lawrence', 'isaac', 'ionut', 'eleonore', 'db2fenc1',
-    'custom', 'casandra', 'brooklyn', 'vsifax', 'temporary', 'suzuki', 'spencer',
-    'robinson', 'phoenix', 'kenny', 'ernie', 'aurore', 'alfonso', 'radio', 'jorge',
-    'default', 'dakota', 'change', 'autumn', 'aidan', 'webs', 'user0', 'router',
-    'michal', 'margaux', 'jenifer', 'jake', 'ioana', 'gray', 'esther', 'anouk',
-    'porno', 'penny', 'nicolas', 'michele', 'laure', 'german', 'format',
-    'fernando', 'device', 'christa', 'beverly', 'bandit', '123qwe', 'jupiter',
-    'ircop', 'indigo', 'elke', 'dream', 'cliff', 'caleb', 'amaude', 'vwalker',
-    'tomas', 'simple', 'prove', 'klaus', 'kathi', 'hostmaster', 'ariel', 'almacen',
-    'alexandre', '123abc', 'nora', 'manon', 'mama', 'jackson', 'inez', 'florin',
-    'duke', 'Admin', 'student1', 'ovidiu', 'jonas', 'dora', 'company', 'beny',
-    'martinez', 'ludovic', 'louise1', 'holly', 'dorian', 'davis', 'copy', 'carlo',
-    'willy', 'tasha', 'stud', 'sakura', 'reseller', 'parker', 'nanouser',
-    'lillian', 'elly', 'delia', 'cora', 'whitney', 'tristan', 'hello', 'farrell',
-    'card', 'tigger', 'roman', 'rexmen', 'qwertyuiop', 'nelson', 'mauro', 'marta',
-    'luigi', 'kathrine', 'filter', 'chen', 'updates', 'test10', 'magenta', 'link',
-    'kris', 'gwen', 'gregg', 'gilbert', 'ghost', 'eshop', 'cyan', 'corina',
-    'carole', 'tatiana', 'shannon', 'pwrchute', 'ming', 'mandrake', 'lucia',
-    'lorenzo', 'logan', 'janice', 'flash', 'cornelia', 'chorist', 'chang', 'cary',
-    'amelie', '1qaz2wsx', 'sistemas', 'shelby', 'moon', 'mars', 'marian', 'kurt',
-    'kent', 'honey', 'first', 'ashton', 'anca', 'abcdef', 'zephyr', 'warren',
-    'tweety', 'roberta', 'lloyd', 'elsa', 'drew', 'cyborg', 'cleopatra', 'zimbra',
-    'tiger', 'space', 'nice', 'lara', 'kelvin', 'herman', 'gerald', 'gateway',
-    'garry', 'digital', 'cezar', 'celine', 'bertha', 'aaaaaa', 'zxcvbnm', 'web0',
-    'power', 'nologin', 'melanie', 'lucian', 'juliana', 'johny', 'jade', 'howard',
-    'girl', 'gaby', 'falcon', 'eliza', 'Aaliyah', 'thegame', 'sunsun', 'student4',
-    'post1', 'neil', 'murphy', 'luciana', 'fritz', 'dima', 'credit', 'beavis',
-    'zeus', 'wget', 'sergio', 'ping', 'pass123', 'notepad', 'maverick', 'maureen',
-    'mateo', 'luna', 'lola', 'lidia', 'laetitia', 'garcia', 'frederique',
-    'francoise', 'demouser', 'carey', 'tyler', 'testweb', 'supportweb', 'smbadmin',
-    'simone', 'miriam', 'markus', 'kathleen', 'gamma', 'export', 'elisabeth',
-    'bitch', 'bernd', 'antispam', 'ajay', 'xander', 'toni', 'technicom', 'svnuser',
-    'randy', 'qweasdzxc', 'popserver', 'popauth', 'mustang', 'marquerite',
-    'malcom', 'johan', 'jody', 'france', 'family', 'evan', 'dolores', 'desiree',
-    'colet', 'asdfghjkl', '123456789', 'viper', 'todd', 'suse', 'qwe123',
-    'picture', 'margaud', 'lars', 'julien', 'hammer', 'bryce', 'bonnie', 'adelina',
-    'willow', 'test11', 'sheila', 'norm', 'monday', 'maroon', 'kyle', 'jerome',
-    'costel', 'zena', 'wanda', 'trial', 'teamspeak2', 'rocky', 'luce', 'axel',
-    'woody', 'visitante', 'simulation', 'sierra', 'marcy', 'haru', 'fiona',
-    'drive', 'biology', 'aline', 'alba', 'vicki', 'rupert', 'miller', 'matilda',
-    'loan', 'jaime', 'freeze', 'elodie', 'echo', 'disney', 'develop', 'connect',
-    'christy', 'chemistry', 'camila', 'amadeus', 'administrador', 'viorel',
-    'spamd', 'police', 'noah', 'motorola', 'klog', 'greta', 'global', 'dorin',
-    'daniele', 'cassandra', 'carly', 'brent', 'tomcat5', 'test1234', 'tammy',
-    'roxana', 'right', 'porsche', 'peggy', 'laurence', 'kitty', 'kennedy', 'ivory',
-    'irina', 'hall', 'colleen', 'cdrom', 'candi', 'bambi', 'avahi', 'audio',
-    'alisa', 'agata', 'advice', 'yellow', 'venus', 'tania', 'sorin', 'serge',
-    'quincy', 'mongrel', 'cooper', 'angelica', 'albertha', 'troy', 'sponsor',
-    'siteweb', 'shelly', 'rootalias', 'proftpd', 'pepe', 'patty', 'myra', 'liza',
-    'kirk', 'henriette', 'gertrude', 'gemma', 'flora', 'devil', 'denied', 'carola',
-    'bram', 'banana', 'attila', 'anda', 'Access', 'testing1', 'snow', 'secret',
-    'ronda', 'robyn', 'qazwsxedc', 'phoebe', 'paulo', 'matteo', 'mariah', 'lois',
-    'latitia', 'kato', 'indiana', 'hortense', 'enrique', 'december', 'cole',
-    'cher', 'zxcvbn', 'zach', 'watson', 'teszt', 'rudy', 'printer', 'oracle2',
-    'mandy', 'lotus', 'laurentiu', 'johnson', 'eugenia', 'emilia', 'cron',
-    'compras', 'clint', 'cecil', 'aiko', 'adolfo', 'Jewel', 'susanne', 'sunos',
-    'siteadmin', 'lynda', 'dragon', 'dorotheee', 'dalia', 'bond', 'bauer',
-    'alfredo', 'adriano', 'abcdefg', 'Administrator', 'testing123', 'paradise',
-    'mason', 'lavinia', 'karla', 'javi', 'haxor', 'education', 'cornelius',
-    'claudiu', 'Ionut', '1234567890', 'yoshida', 'teddy', 'magdalena', 'kayten',
-    'javier', 'inter', 'hilary', 'gibson', 'gene', 'crimson', 'cent', 'billie',
-    'adina', 'adabas', '654321', 'wright', 'west', 'theodore', 'spring', 'ralf',
-    'qweasd', 'pavel', 'obelix', 'mirc', 'lydia', 'kenneth', 'katrina', 'jeanine',
-    'hank', 'cycle', 'clare', 'charity', 'web7', 'shell1', 'selma', 'scotty',
-    'ronaldo', 'lost', 'justice', 'iraf', 'hallo', 'guset', 'gt05', 'giovanni',
-    'engineer', 'eden', 'cecily', 'buster', 'beryl', 'winston', 'uplink',
-    'undernet', 'stacie', 'sabin', 'renata', 'position', 'mircte', 'joerg',
-    'freddie', 'einstein', 'dario', 'curtis', 'athena', 'user4', 'sells', 'petru',
-    'ns08', 'ns07', 'netshell', 'nash', 'mitchell', 'majordom', 'lilkim', 'intech',
-    'friend', 'frankie', 'denzel', 'brands', 'zachary', 'yvonne', 'violeta',
-    'sidney', 'scarlet', 'randall', 'qmailr', 'premier', 'madonna', 'lindsey',
-    'justine', 'jayden', 'hoshi', 'hillary', 'garfield', 'game', 'enquiry',
-    'enquiries', 'dieter', 'alinus', '123test', 'takahashi', 'sony', 'sirsi',
-    'rootkit', 'rodriguez', 'robbie', 'netadmin', 'mcedit', 'london', 'leona',
-    'jester', 'hermes', 'gillian', 'general', 'ferrari', 'debby', 'chip', 'adele',
-    'zxvf', 'shawn', 'servidor', 'scorpion', 'ruiz', 'rudolf', 'raphael', 'qmails',
-    'hasegawa', 'dnscache', 'cris', 'bishop', 'aurelia', 'august', 'anja',
-    'america', 'alliance', 'Abel', 'yoko', 'travis', 'rumeno', 'reboot', 'qmailq',
-    'lewis', 'june', 'hanna', 'glen', 'fuck', 'flopy', 'festival', 'duane',
-    'damon', 'cristian', 'cosmin', 'clarence', 'bettina', 'sport', 'seven',
-    'nothing', 'medina', 'jeanette', 'buck', 'adrienne', 'abbey', 'williams',
-    'susie', 'randi', 'prince', 'nishiyama', 'marion', 'leave', 'kristine',
-    'hamlet', 'emanuel', 'dhcp', 'deathrun', 'basil', 'unseen', 'terra', 'sybil',
-    'snake', 'shirley', 'philippe', 'paola', 'octavia', 'martina', 'marcela',
-    'mara', 'ismail', 'hugues', 'hotel', 'haruko', 'gallery', 'felipe', 'eduardo',
-    'corine', 'coffee', 'aurel', 'adrien', 'abba', 'valentine', 'temporal',
-    'takada', 'stephan', 'sofia', 'smile', 'services', 'rosestreetlabs', 'polly',
-    'olivier', 'liliana', 'left', 'kimura', 'josephine', 'jones', 'jodie',
-    'gonzales', 'gladys', 'finn', 'curt', 'char', 'caren', 'bull', 'amana',
-    'agatha', 'tomato', 'tino', 'tester1', 'sunday', 'rolo', 'protocol', 'otilia',
-    'oleg', 'machine', 'livechat', 'lenox', 'kendall', 'helga', 'godzilla',
-    'gavin', 'fletcher', 'field', 'daria', 'coke', 'campbell', 'camelia', 'berlin',
-    'becky', 'batman', 'amie', 'aggie', 'weenie', 'wanker', 'tess', 'rebeca',
-    'phone', 'peyton', 'park', 'nicki', 'marissa', 'marcia', 'marci', 'manuela',
-    'local', 'kobayashi', 'joaquin', 'jada', 'hellen', 'golf', 'globus', 'gigi',
-    'feliz', 'fatima', 'discovery', 'chick', 'buffy', 'brandi', 'ashlyn', 'aris',
-    'apples', 'alexia', 'winnie', 'washington', 'tuesday', 'sato', 'rodney',
-    'ramona', 'radvd', 'qmaill', 'paintball1', 'nevada', 'netstat', 'nakamura',
-    'mdom', 'marcos', 'levi', 'lebedev', 'jillian', 'jana', 'hung', 'gomez',
-    'genoveva', 'frei', 'eillen', 'egghead', 'drweb', 'davide', 'commando',
-    'cedric', 'boxer', 'testi', 'sylvie', 'support123', 'roma', 'research',
-    'personal', 'nichole', 'more', 'mick', 'lana', 'julius', 'juliet', 'fuji',
-    'franco', 'ferari', 'english', 'debug', 'columbia', 'candice', 'bela', 'beer',
-    'bebe', 'yuan', 'xena', 'vivek', 'save', 'santiago', 'phillip', 'patrice',
-    'notice', 'nate', 'julio', 'johanna', 'jking', 'iceuser', 'hassan', 'emmy',
-    'christie', 'chan', 'caitlin', 'briana', 'boby', 'berta', 'barney', 'augusta',
-    'viola', 'venom', 'tempuser', 'silence', 'seoulselection', 'osvaldo', 'oprah',
-    'menu', 'louisa', 'lesley', 'krista', 'killer', 'isaiah', 'irena', 'ifconfig',
-    'homer', 'gisela', 'easter', 'dbus', 'daphne', 'cookie', 'collin', 'armen',
-    'archivo', 'anamaria', 'analog', 'alvaro', 'aisha', 'wrestling', 'scarlett',
-    'rusticos', 'romania', 'ricardo', 'raimundo', 'radmin', 'qmailp', 'nellie',
-    'magda', 'lukasz', 'lorene', 'long', 'lion', 'lilly', 'kita', 'jang',
-    'instrume', 'hitler', 'hiperg', 'happy', 'ethereal', 'elizabet', 'devon',
-    'cash', 'burt', 'belinda', 'anunez', 'album', 'adria', 'zope', 'yamada',
-    'vermont', 'user5', 'trevor', 'timmy', 'team', 'stewart', 'sebastien',
-    'science', 'rtorres', 'roxane', 'rhonda', 'restart', 'poczta', 'peru', 'omar',
-    'livia', 'lina', 'laboratorio', 'kiana', 'jenni', 'invitado', 'hiroshi',
-    'geoffrey', 'frederic', 'francisco', 'evelina', 'disk', 'darcy', 'dank',
-    'dallas', 'corrie', 'cammie', 'bouncer', 'wallace', 'user01', 'testbox',
-    'susanna', 'signalhill', 'queen', 'petra', 'orlando', 'object', 'norma',
-    'neal', 'mitch', 'michaels', 'merry', 'ling', 'lena', 'katja', 'guest01',
-    'ellie', 'dust', 'donovan', 'cyndi', 'constantin', 'claudio', 'chun',
-    'charlot', 'cari', 'beatriz', 'zelda', 'zack', 'wyatt', 'wilkins', 'theodora',
-    'technology', 'studio', 'ricki', 'princess', 'operador', 'ocean', 'notused',
-    'mrtg', 'mortimer', 'milan', 'maura', 'madalina', 'lopez', 'lacey', 'karika',
-    'hwang', 'harriet', 'gerard', 'gayle', 'gabby', 'elliott', 'elijah',
-    'cvsadmin', 'charon', 'carshowguide', 'camellia', 'bennett', 'beginner',
-    'armando', 'arlene', 'alumno', 'aircode', 'adrianna', 'adora', 'user02',
-    'trudy', 'tivoli', 'telecom', 'sysmanager', 'sys_admin', 'suzanne', 'steph',
-    'sports', 'sigmund', 'salvatore', 'rafal', 'quagga', 'peewee', 'patsy', 'nike',
-    'maxwell', 'mauricio', 'marlin', 'mack', 'lost', 'latest', 'lala', 'kiss',
-    'jodi', 'ileana', 'hayley', 'gail', 'flores', 'erick', 'eliott', 'derick',
-    'caley', 'bugs', 'buddy', 'bane', 'arianne', 'areyes', 'araceli', 'aecpro',
-    'williamson', 'tokyo', 'ting', 'teodora', 'tads', 'supervisor', 'storm',
-    'sasaki', 'quentin', 'putty', 'miranda', 'mari', 'kaleb', 'jayme', 'grant',
-    'gabe', 'franz', 'fnet', 'fester', 'evelyne', 'elias', 'eileen', 'carsten',
-    'candie', 'camilla', 'bass', 'anka', 'adidas', 'zxin10', 'zorro', 'yasmine',
-    'tone', 'testes', 'svnadmin', 'source', 'skyrix', 'sharp', 'shania',
-    'serenity', 'next', 'mytest', 'malika', 'jude', 'hiroko', 'giselle',
-    'gabriela', 'faye', 'esteban', 'elyzabeth', 'duckie', 'demo1', 'darla',
-    'confixx', 'coleen', 'caryn', 'caron', 'carolin', 'calina', 'cady', 'apache1',
-    'alvarez', 'wwwuser', 'webportal', 'vince', 'veronique', 'velma', 'valas',
-    'union', 'terence', 'shelton', 'sabina', 'root0', 'payala', 'oracle123',
-    'marla', 'luther', 'lesly', 'lenore', 'kristal', 'jazz', 'haldaemon', 'gustav',
-    'guinness', 'eminem', 'electra', 'conrad', 'close', 'charlott', 'cati',
-    'carry', 'burgess', 'book', 'author', 'alberta', 'yvette', 'yura', 'young',
-    'yamaguchi', 'winona', 'trib', 'toby', 'sonya', 'shana', 'sendmail',
-    'sekretariat', 'schmidt', 'savanna', 'russel', 'robby', 'nori', 'mina',
-    'larissa', 'kramer', 'jaimie', 'inweb', 'hayashi', 'hara', 'gnome', 'fujita',
-    'finder', 'emerald', 'edmund', 'dulap', 'cola', 'choco', 'chad', 'cassidy',
-    'carlotta', 'bogus', 'blair', 'berliner', 'beach', 'banco', 'audi', 'annalisa',
-    'alonso', 'advertise', 'webserver', 'valentina', 'user7', 'thom', 'techit',
-    'simmons', 'senaka', 'sbin', 'sapdb', 'rivera', 'ramon', 'quin', 'picasso',
-    'panda', 'nova', 'nigel', 'msql', 'moshutzu', 'modem', 'miki', 'marianne',
-    'mambo', 'lori', 'leopold', 'ftp2', 'eliot', 'economist', 'dorothea', 'doreen',
-    'dolph', 'diskbook', 'developer', 'dancer', 'clinic', 'ciprian', 'celina',
-    'caprice', 'calista', 'builder', 'benedict', 'augustin', 'asha', 'ariane',
-    'aria', 'alejandro', 'agostino', 'zero', 'winter', 'wing', 'visa', 'vernon',
-    'verio', 'training', 'thursday', 'tester123', 'techno', 'soutec', 'saito',
-    'rossi', 'rona', 'romero', 'robson', 'roberts', 'rian', 'raphaela', 'pegasus',
-    'peaches', 'paris', 'murray', 'mindy', 'marilyn', 'manfred', 'khan', 'kali',
-    'jamie', 'jacuna', 'hong', 'gretchen', 'elton', 'ellis', 'dwight', 'duck',
-    'cool', 'cheese', 'cantor', 'bridge', 'barbie', 'angry', 'anastasia', 'alma',
-    'alessandro', 'abdul', 'year', 'waterboy', 'warner', 'virusalert', 'user8',
-    'user6', 'turbo', 'trey', 'tomaso', 'smbguest', 'shimada', 'samsung', 'safetp',
-    'retsu', 'rasika', 'puma', 'printul', 'norton', 'narcissa', 'nana', 'mozart',
-    'monroe', 'melinda', 'lizabeth', 'larisa', 'kinder', 'jocelyn', 'gruiz',
-    'frodo', 'francesca', 'exit', 'dumy', 'dona', 'didier', 'date', 'copier',
-    'chandler', 'chandimal', 'carlene', 'broadway', 'blanca', 'barnes', 'announce',
-    'Where', 'zoey', 'test02', 'tempo', 'none', 'muie', 'maximilian', 'manchester',
-    'madhuri', 'luciano', 'links', 'liang', 'kiki', 'kaylie', 'july', 'julianne',
-    'italy', 'iresha', 'ilene', 'gypsy', 'gretta', 'geraldine', 'galaxy', 'finger',
-    'dyndns', 'delgado', 'cluster', 'clarisa', 'castle', 'cardinal', 'bobi',
-    'berkeley', 'asterix', 'anything', 'alien', 'york', 'yasuda', 'yang', 'trish',
-    'tracker', 'titus', 'susana', 'seminar', 'sascha', 'santa', 'rosemary',
-    'roseanne', 'romanian', 'rocco', 'racquel', 'oxford', 'orion', 'neetha',
-    'nadine', 'mich', 'maia', 'loraine', 'lilia', 'less', 'lenny', 'leann',
-    'lahiru', 'kids', 'jason1', 'janine', 'irvin', 'investor', 'hana', 'gianni',
-    'generalmanager', 'friday', 'four', 'feliks', 'ernesto', 'driver', 'diablo',
-    'dacia', 'cserver', 'cornel', 'christophe', 'chocolate', 'cherry', 'chance',
-    'alissa', 'alisha', 'virgil', 'vinci', 'vicente', 'user9', 'renato',
-    'pentagon', 'nobuyuki', 'munin', 'mercury', 'lyle', 'lucinda', 'lcadmin',
-    'lambert', 'laboratory', 'kristy', 'kjayroe', 'keiko', 'jennan', 'heinz',
-    'hatton', 'hate', 'guard', 'gareth', 'flavia', 'five', 'estudiante', 'elite',
-    'edwina', 'easy', 'disc', 'darian', 'chicken', 'chem', 'cell', 'cata', 'cang',
-    'brendan', 'akiko', 'abcd', 'yuri', 'wilfred', 'web3', 'vasile', 'thelma',
-    'smecher', 'selena', 'select', 'scot', 'schulz', 'roxy', 'redmine', 'program',
-    'planet', 'montana', 'luisa', 'lucius', 'live', 'lincoln', 'liane', 'lady',
-    'karin', 'kara', 'kaitlin', 'kacey', 'jukebox', 'jmartin', 'jazmin', 'henri',
-    'haruki', 'hannes', 'goverment', 'garret', 'fotos', 'fisher', 'fire',
-    'finance', 'filippo', 'factoria', 'enya', 'doming', 'dina', 'devilsins',
-    'denys', 'debra', 'daan', 'crichard', 'condo', 'castro', 'calin', 'bong',
-    'andrey', 'ultra', 'tucker', 'trace', 'temp1', 'shuri', 'sham', 'samara',
-    'rocio', 'primaveras', 'porn', 'pool', 'pluto', 'paulina', 'pagina', 'oswald',
-    'nine', 'nameserver', 'manoj', 'mana', 'linuxtester2', 'koko', 'kerrie',
-    'huercal', 'guillaume', 'guadalupe', 'griffin', 'firebird', 'fauzi', 'fane',
-    'dolly', 'displays', 'dianne', 'carlota', 'brazil', 'berkly', 'berger', 'arch',
-    'amar', 'akira', 'adriane', 'adams', 'vincintz', 'tracey', 'tisha', 'tani',
-    'sugar', 'sparc', 'simulator', 'raquel', 'purchasing', 'nakao', 'murakami',
-    'marlene', 'katina', 'hunt', 'hoang', 'grep', 'forevermd', 'forest',
-    'football', 'ferdinand', 'faridah', 'desarrollo', 'criminal', 'cory',
-    'community', 'chess', 'chanel', 'boon', 'belmondo', 'acacia', 'Exit',
-    'xaviera', 'wynonna', 'tobias', 'thaiset', 'sonja', 'saturday', 'sakai',
-    'sabayon', 'rosana', 'ranger', 'rabbit', 'priscilla', 'plcmspip', 'pavila',
-    'patric', 'operations', 'omni', 'null', 'nelu', 'natasa', 'napoleon', 'moritz',
-    'member', 'marleth', 'marivic', 'marilena', 'manny', 'linuxtester',
-    'linuxtest', 'light', 'kristina', 'kristi', 'koba', 'keegan', 'joeflores',
-    'jnanchito', 'jiali', 'jatema', 'jarod', 'jacques', 'inna', 'hien', 'headers',
-    'ftphome', 'freeman', 'flor', 'fetchmail', 'erwin', 'eliane', 'dujoey',
-    'creation', 'cocolino', 'closas', 'clau', 'classic', 'cayuga', 'bumbling',
-    'betsy', 'belea', 'beauty', 'beatrix', 'bain', 'augusto', 'artificial',
-    'arbaiah', 'allotest', 'alexie', 'alanna', 'Test', 'yamamoto', 'whitehat',
-    'walt', 'vanesa', 'three', 'test111', 'tanaka', 'superuser', 'south',
-    'smbtest', 'shopping', 'sales1', 'romeo', 'rodica', 'roby', 'river', 'perez',
-    'peanut', 'partners', 'paintball', 'netbsd', 'moses', 'mkdir', 'mila', 'meteo',
-    'lindsay', 'leyla', 'kristie', 'knight', 'kitamura', 'katrin', 'junko',
-    'jules', 'jena', 'iosif', 'harmony', 'georgina', 'gate', 'firefox', 'fernie',
-    'express', 'evil', 'emile', 'eduis', 'dkauffman', 'db4web', 'cshrc',
-    'couscous', 'condom', 'collier', 'christmas', 'chrissie', 'chelsea',
-    'cascades', 'carissa', 'captain', 'birgit', 'bios', 'bicameral', 'betsie',
-    'benz', 'avdcodel', 'anke', 'akdcodel', 'accept', '11111', 'yves', 'xtra',
-    'webpage', 'valeria', 'universal', 'tracie', 'techsupport', 'semenov',
-    'seifer', 'sakurai', 'russell', 'rmgadmin', 'ranjith', 'ozzie', 'ophelia',
-    'october', 'myndy', 'membership', 'matthias', 'maka', 'maja', 'louie',
-    'lilian', 'leni', 'keaton', 'kaori', 'joao', 'jayce', 'hotels', 'hoai',
-    'helmut', 'google', 'gill', 'fallon', 'edea', 'drought', 'dorothee', 'donny',
-    'dominick', 'dial', 'deluge', 'defoe', 'dapper', 'dante', 'cretin', 'creosote',
-    'create', 'comrades', 'comrade', 'commrades', 'clusters', 'class2005',
-    'class2004', 'cerulean', 'celtics', 'carmela', 'benoit', 'army', 'arie',
-    'apollo', 'anabel', 'alogadmin', 'alaina', 'adelaide', 'accounting',
-    '1q2w3e4r', 'wwwadmin', 'thierry', 'stefano', 'song', 'skkb', 'shan',
-    'sanchez', 'samson', 'rugby', 'ronny', 'rezvie', 'raven', 'price', 'pearl',
-    'paulj', 'north', 'morita', 'mirror', 'marshal', 'marisa', 'madalin', 'lock',
-    'lian', 'lexus', 'leila', 'last', 'kubota', 'katy', 'jule', 'italia', 'irving',
-    'hugh', 'house', 'hamada', 'giulia', 'gisele', 'gianluca', 'gerrard', 'gerda',
-    'gabriele', 'frieda', 'forrest', 'florentina', 'eula', 'eternity', 'elvira',
-    'elmo', 'elmer', 'eight', 'dudley', 'dagmar', 'crcard', 'colman', 'coach',
-    'chipmast', 'chinese', 'caterina', 'cassia', 'cass', 'campani', 'callie',
-    'calbert', 'bytes', 'burrelli', 'budha', 'bonec', 'blond', 'blacks', 'bids',
-    'benedicta', 'bcampion', 'bayonne', 'baxter', 'atir', 'antoine', 'amdsa',
-    'allegra', 'zeke', 'wood', 'wendi', 'wednesday', 'rufus', 'rudolph', 'royal',
-    'rosario', 'profesor', 'privacy', 'pizza', 'pilar', 'percy', 'paypal',
-    'mischa', 'mieko', 'mayumi', 'maxim', 'makoto', 'kumiko', 'kerry', 'karim',
-    'ismael', 'isabell', 'hilde', 'guide', 'good', 'genius', 'ftpuser1',
-    'fredrick', 'fraser', 'feng', 'denisa', 'damien', 'contabil', 'coder',
-    'cathleen', 'career', 'cadi', 'cable', 'butthead', 'benita', 'ball', 'backups',
-    'arrow', 'ariadne', 'aoki', 'aldo', 'akia', 'abril', 'yuko', 'web5', 'unreal',
-    'tricia', 'trent', 'therese', 'success', 'ss2701', 'slut', 'siemens', 'reno',
-    'remove', 'razvan', 'rana', 'ramiro', 'prueba1', 'playboy', 'peace',
-    'patience', 'pace', 'pabla', 'owner', 'norbert', 'nishimura', 'mythtvmythtv',
-    'mihaela', 'laptop', 'kylix', 'kiran', 'julieta', 'joachim', 'ishikawa',
-    'humberto', 'giuseppe', 'gino', 'geography', 'ftpsecure', 'foobar', 'fishing',
-    'everett', 'east', 'dumitru', 'dixie', 'diet', 'desperate', 'davy', 'darius',
-    'crina', 'corrine', 'chicago', 'caitlyn', 'britta', 'best', 'becca', 'base',
-    'baldwin', 'alessandra', 'TeamSpeak', 'ykona', 'wong', 'webroot', 'wade',
-    'vhbackup', 'topic', 'tarui', 'stefanie', 'sherri', 'saturn', 'rrojas', 'rolf',
-    'remy', 'quinton', 'protect', 'parking', 'ohira', 'mpsoc', 'mohan',
-    'microsoft', 'melisa', 'marko', 'libuuid', 'kaethe', 'joseluis', 'jess',
-    'jericho', 'jerald', 'info123', 'hubert', 'heaven', 'hamilton', 'gilles',
-    'geffrey', 'franck', 'fitz', 'exploit', 'events', 'eustace', 'emilio', 'dudu',
-    'doria', 'document', 'dennise', 'dasusr', 'contabilitate', 'chucky', 'celeste',
-    'cecelia', 'carlton', 'bureau', 'bertrand', 'backup1', 'aurelio', 'arayan',
-    'albina', 'abcd1234', 'yoshi', 'wsmith', 'wally', 'venice', 'uploader', 'tomi',
-    'tomek', 'taras', 'tanja', 'taller', 'stupid', 'sloan', 'shimizu', 'server1',
-    'roux', 'rica', 'rainbow', 'president', 'precious', 'panasonic', 'octav',
-    'miura', 'matthieu', 'margot', 'march', 'lizard', 'lien', 'kirstin', 'kimi',
-    'karate', 'johnathan', 'jinji', 'humphrey', 'huey', 'horace', 'hieu', 'golden',
-    'fulton', 'edouard', 'earth', 'dragos', 'dorms', 'darkblue', 'customercare',
-    'costa', 'contacto', 'clients', 'christi', 'chaim', 'central', 'cashier',
-    'aura', 'annika', 'alphabet', 'ally', 'aliyah', 'alfreda', 'aimee', 'adrianne',
-    'admin01', '1q2w3e4r5t', '00000', '0000', 'workstation', 'tinydns', 'tear',
-    'susane', 'snoop', 'sherman', 'seba', 'roto', 'raisa', 'rachelle', 'psoft',
-    'postgre', 'papa', 'paco', 'osborn', 'office1', 'mori', 'mili', 'miho',
-    'meadow', 'mathias', 'market', 'margarita', 'luuk', 'kuri', 'kata', 'karolina',
-    'karie', 'kaiser', 'justin1', 'isis', 'higuchi', 'fernanda', 'edison',
-    'domingo', 'display', 'demetrio', 'daren', 'custserv', 'correo', 'consuelo',
-    'coleman', 'clay', 'ciro', 'christoph', 'cherie', 'chelsey', 'carmella',
-    'candida', 'calli', 'calhoun', 'bogart', 'biblioteca', 'belle', 'beate',
-    'babette', 'baba', 'arata', 'angus', 'analiese', 'amstelecom', 'ahmad',
-    'agencia', 'Robert', '1111', 'yasuko', 'wizard', 'water', 'warrior', 'vinnie',
-    'vickie', 'tudor', 'tito', 'tate', 'suga', 'submit', 'student2', 'silvester',
-    'sheldon', 'sheba', 'richie', 'rfmngr', 'ravi', 'prueba2', 'ppazmino',
-    'peggie', 'osbourne', 'osborne', 'octavius', 'newuser', 'nelly', 'nagata',
-    'marietta', 'lexi', 'kirsten', 'kerri', 'keri', 'kawai', 'kami', 'juliette',
-    'judi', 'jeremiah', 'jaqueline', 'janette', 'jamey', 'jacki', 'intel', 'herb',
-    'godfrey', 'garrett', 'garey', 'gambit', 'gallagher', 'forsale', 'ebony',
-    'earnest', 'eagle', 'dsantiago', 'dorine', 'doina', 'dnslog', 'distro',
-    'developers', 'customerservice', 'crond', 'claus', 'carmelita', 'carmel',
-    'calypso', 'cailin', 'buzz', 'butler', 'booking', 'bessie', 'benito', 'beata',
-    'batch', 'baptist', 'babe', 'arcadia', 'apache3', 'anette', 'anchor',
-    'aliases', 'adonia', 'adel', 'adamina', 'adame', 'Nicole', 'wireless', 'weed',
-    'web6', 'vova', 'usuario1', 'tori', 'testaccount', 'sysmail', 'suzan', 'sims',
-    'sherlock', 'serv', 'rodrique', 'ritchie', 'risa', 'reed', 'raluca', 'rack',
-    'quatrida', 'prudence', 'professor', 'private', 'phyllis', 'ogawa', 'noreen',
-    'nita', 'niki', 'muonline', 'mimi', 'mgomez', 'magazine', 'lyric', 'lorna',
-    'leroi', 'kurtis', 'klara', 'janie', 'ignacio', 'hsqldb', 'horse', 'hope',
-    'holiday', 'guestuser', 'guest4', 'gregorio', 'goddard', 'gena', 'fucker',
-    'faust', 'emely', 'editors', 'dodo', 'diaz', 'danut', 'daisuke', 'craigh',
-    'costin', 'cock', 'cleo', 'clarissa', 'clair', 'circulation', 'chile', 'caro',
-    'caimile', 'cailine', 'blake', 'bibi', 'bernice', 'bang', 'axfrdns', 'avril',
-    'armin', 'antje', 'antivirus', 'angerine', 'angelika', 'andromache', 'alva',
-    'aleksandr', 'alda', 'aileen', 'zhaowei', 'zander', 'yokoyama', 'worker',
-    'whois', 'watanabe', 'wangchen', 'vivianne', 'utilidades', 'utilidad',
-    'tyrell', 'toyota', 'spain', 'ruthie', 'romano', 'rodger', 'rishi', 'reynold',
-    'reyes', 'pula', 'privoxy', 'payment', 'paloma', 'oskar', 'november', 'norris',
-    'nocftp', 'nieves', 'nicola', 'nexus', 'ness', 'morales', 'milo', 'mgonzalez',
-    'messagebus', 'marylyn', 'mariko', 'manu', 'malcolm', 'loyd', 'liana',
-    'letters', 'keisha', 'karol', 'jsanchez', 'joby', 'jewel', 'jered', 'jens',
-    'jefferson', 'january', 'inquiry', 'hawaii', 'guinevre', 'georg', 'gast3',
-    'gast2', 'gast1', 'gaspar', 'florida', 'fernandez', 'eryn', 'enterprise',
-    'elephant', 'earleen', 'dorina', 'dedlogistica', 'danya', 'cristiana',
-    'consulting', 'condor', 'clio', 'cipri', 'choi', 'caitlen', 'bryn', 'bennie',
-    'barr', 'barber', 'atsushi', 'artur', 'ancuta', 'alana', 'acer', '87654321',
-    '4321', 'zumlot', 'vacation', 'truman', 'thad', 'svetlana', 'stone',
-    'stanford', 'sound', 'september', 'sensivity', 'schneider', 'royce', 'ricci',
-    'polarisnet', 'plesk', 'pastel', 'pass1234', 'pacific', 'oprisor1975', 'okada',
-    'naoki', 'moodle', 'meagan', 'maurta', 'marni', 'marin', 'marge', 'listserv',
-    'lillie', 'kira', 'kawano', 'jacqueline', 'irine', 'international', 'imail',
-    'ichikawa', 'hplip', 'hazel', 'hades', 'gilberto', 'gerencia', 'geena', 'fast',
-    'emech', 'droopy', 'down', 'darren', 'danutz', 'danna', 'curator', 'corrina',
-    'contactus', 'colby', 'clarice', 'chael', 'casie', 'caltech', 'caleigh',
-    'calantha', 'calandra', 'calan', 'cala', 'brittany', 'boxoffice', 'bobo',
-    'blaine', 'bitu', 'bianka', 'berg', 'beethoven', 'balan', 'azuma', 'augustus',
-    'articles', 'arcos', 'annabelle', 'ancutza', 'adm1', 'addison', 'Dakota',
-    'yasmin', 'xmember', 'webmasters', 'web4', 'vishnu', 'verona', 'user10',
-    'ulrike', 'thijs', 'thanks', 'tennis', 'sylvester', 'sunshine', 'sullivan',
-    'sherrie', 'shen', 'shelley', 'seymour', 'ryley', 'ryana', 'roxie', 'rowland',
-    'roscoe', 'rosaline', 'rosalin', 'rosaleen', 'rolph', 'roderic', 'rochelle',
-    'robot', 'ripley', 'ridley', 'rickey', 'realestate', 'q1w2e3', 'publicity',
-    'polkituser', 'patricio', 'noor', 'noaccess', 'muiemuie588524', 'moreno',
-    'miniroot', 'meta', 'mashad', 'masa', 'lotte', 'loren', 'loreen', 'lorainne',
-    'listproc', 'licensing', 'level', 'leanne', 'kunio', 'jhonny', 'jhonathan',
-    'jerrard', 'jensen', 'jeanna', 'jazmine', 'jasper', 'jannine', 'inquiries',
-    'ileen', 'humanresources', 'hellena', 'harriett', 'harmonie', 'gwenyth',
-    'ginnie', 'georges', 'gaynor', 'garden', 'freda', 'financiero', 'february',
-    'eustaces', 'engine', 'elle', 'dmitri', 'delphine', 'deepak', 'danilo',
-    'customersupport', 'cristy', 'corey', 'coral', 'copyright', 'consultoria',
-    'comments', 'classifieds', 'cirilo', 'chung', 'charissa', 'charis', 'cece',
-    'caroljean', 'carlie', 'capri', 'borris', 'bobbie',
-    )
+USERNAMES = LazyContent('usernames')
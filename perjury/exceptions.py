@@ -3,3 +3,31 @@ class UniqueValueTimeoutError(RuntimeError):
     Raised when a generator hangs for too long while trying to return a unique value.
     """
     pass
+
+
+class ValueSpaceExhaustedError(UniqueValueTimeoutError):
+    """
+    Raised when a unique generator over a finite set of values has already
+    returned every one of them.
+    """
+    pass
+
+
+class UniqueValueSaturatedError(UniqueValueTimeoutError):
+    """
+    Raised when a unique generator stops early because most of the values it
+    draws have already been returned.
+    """
+    def __init__(self, message, collision_rate=None, attempts=0, returned=0):
+        super(UniqueValueSaturatedError, self).__init__(message)
+        self.collision_rate = collision_rate
+        self.attempts = attempts
+        self.returned = returned
+
+
+class MarkovModelError(ValueError):
+    """
+    Raised when a compiled Markov model file is invalid or was built for a
+    different corpus or token size.
+    """
+    pass
@@ -0,0 +1,290 @@
+"""
+Streams generated rows to files without holding them all in memory.
+
+Rows are pulled from a generator, such as
+``ModelGenerator(MyModel).build_model_kwargs``, a chunk at a time and each
+chunk is written before the next is generated::
+
+    from perjury.export import export
+
+    generator = ModelGenerator(MyModel).build_model_kwargs
+    with open('rows.csv', 'wb') as f:
+        export(generator, f, format='csv', n=100000000)
+
+Rows may be dictionaries or sequences.  Three formats are supported:
+
+- ``csv``: one line per row, with a header line of field names.
+- ``jsonl``: one JSON object (or array, for sequence rows) per line.
+- ``columnar``: a binary format that stores each chunk a column at a time.
+  Integer, float and boolean columns are packed as fixed width binary
+  values and other values as UTF-8 strings.  Read it back with
+  :func:`read_columnar`.
+
+Dates, times and decimals are written in their ISO or ``str`` form.
+"""
+import csv
+import datetime
+import decimal
+import itertools
+import json
+import struct
+
+from perjury import util
+
+
+def chunked(iterable, chunk_size):
+    """
+    Yields lists of up to ``chunk_size`` items from ``iterable``.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def to_text(value):
+    """
+    Returns ``value`` as text, using ISO 8601 for dates and times.
+    """
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    elif isinstance(value, unicode):
+        return value
+    return unicode(value)
+
+
+def _json_default(value):
+    if isinstance(value, (datetime.date, datetime.time, decimal.Decimal)):
+        return to_text(value)
+    raise TypeError('{0!r} is not JSON serializable'.format(value))
+
+
+class RowWriter(object):
+    """
+    Base class for writers.  ``fields`` is the list of dictionary keys to
+    write, in order.  If it is not given, the sorted keys of the first row
+    are used, or, for sequence rows, no field names at all.
+    """
+    def __init__(self, f, fields=None):
+        self.f = f
+        self.fields = fields
+        self.started = False
+
+    def values(self, row):
+        if isinstance(row, dict):
+            return [row.get(field) for field in self.fields]
+        return list(row)
+
+    def write_chunk(self, rows):
+        if not rows:
+            return
+        if not self.started:
+            if self.fields is None and isinstance(rows[0], dict):
+                self.fields = sorted(rows[0])
+            self.start()
+            self.started = True
+        self.write_rows(rows)
+
+    def start(self):
+        pass
+
+    def write_rows(self, rows):
+        raise NotImplementedError('Writers must implement `write_rows`.')
+
+    def close(self):
+        if not self.started:
+            self.start()
+            self.started = True
+
+
+class CSVWriter(RowWriter):
+    def start(self):
+        self.writer = csv.writer(self.f)
+        if self.fields:
+            self.writer.writerow([field.encode('utf-8') for field in self.fields])
+
+    def write_rows(self, rows):
+        def encode(value):
+            if value is None:
+                return ''
+            return to_text(value).encode('utf-8')
+
+        self.writer.writerows(
+                [encode(value) for value in self.values(row)] for row in rows)
+
+
+class JSONLinesWriter(RowWriter):
+    def write_rows(self, rows):
+        dumps = json.JSONEncoder(default=_json_default).encode
+        lines = []
+        for row in rows:
+            if self.fields is not None and isinstance(row, dict):
+                row = dict(zip(self.fields, self.values(row)))
+            lines.append(dumps(row))
+        self.f.write('\n'.join(lines))
+        self.f.write('\n')
+
+
+# Columnar files are a header followed by row groups, one per chunk, and a
+# row count of zero to mark the end.
+#
+# header:    magic, version, column count, then each column name as a length
+#            prefixed UTF-8 string.
+# row group: row count, then for every column a type code, a null bitmap
+#            of ``ceil(rows / 8)`` bytes and the packed non-null values.
+#            Strings are packed as an array of byte lengths and the
+#            concatenated bytes.
+COLUMNAR_MAGIC = b'PJCL'
+COLUMNAR_VERSION = 1
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+def column_type(values):
+    """
+    Returns the columnar type code for the non-null ``values``: ``?`` for
+    booleans, ``q`` for 64 bit integers, ``d`` for floats and ``s`` for
+    anything else.
+    """
+    types = set(type(value) for value in values)
+    if not types or types == set([bool]):
+        return '?'
+    elif types <= set([int, long]) and \
+            all(INT64_MIN <= value <= INT64_MAX for value in values):
+        return 'q'
+    elif types <= set([int, long, float]) and bool not in types:
+        return 'd'
+    return 's'
+
+
+class ColumnarWriter(RowWriter):
+    def start(self):
+        fields = self.fields or []
+        self.f.write(struct.pack('<4sHI', COLUMNAR_MAGIC, COLUMNAR_VERSION, len(fields)))
+        for field in fields:
+            name = field.encode('utf-8')
+            self.f.write(struct.pack('<I', len(name)))
+            self.f.write(name)
+
+    def write_chunk(self, rows):
+        if rows and self.fields is None and not isinstance(rows[0], dict):
+            self.fields = [unicode(i) for i in xrange(len(rows[0]))]
+        super(ColumnarWriter, self).write_chunk(rows)
+
+    def write_rows(self, rows):
+        columns = zip(*[self.values(row) for row in rows])
+        write = self.f.write
+        write(struct.pack('<I', len(rows)))
+
+        for column in columns:
+            nulls = bytearray((len(rows) + 7) // 8)
+            values = []
+            for i, value in enumerate(column):
+                if value is None:
+                    nulls[i >> 3] |= 1 << (i & 7)
+                else:
+                    values.append(value)
+
+            code = column_type(values)
+            write(code)
+            write(bytes(nulls))
+
+            if code == 's':
+                encoded = [to_text(value).encode('utf-8') for value in values]
+                write(struct.pack('<{0}I'.format(len(encoded)), *map(len, encoded)))
+                write(b''.join(encoded))
+            else:
+                write(struct.pack('<{0}{1}'.format(len(values), code), *values))
+
+    def close(self):
+        super(ColumnarWriter, self).close()
+        self.f.write(struct.pack('<I', 0))
+
+
+WRITERS = {
+    'csv': CSVWriter,
+    'jsonl': JSONLinesWriter,
+    'columnar': ColumnarWriter,
+    }
+
+
+def export(fn, f, format='csv', n=None, chunk_size=10000, fields=None):
+    """
+    Writes ``n`` rows from the generator ``fn``, or rows forever if ``n`` is
+    ``None``, to the file ``f`` in ``format``.  Rows are generated and written
+    ``chunk_size`` at a time.  Returns the number of rows written.
+    """
+    try:
+        writer = WRITERS[format](f, fields)
+    except KeyError:
+        raise ValueError('Unknown export format: {0}'.format(format))
+
+    rows = util.forever(fn) if n is None else util.times(fn, n)
+    count = 0
+
+    for chunk in chunked(rows, chunk_size):
+        writer.write_chunk(chunk)
+        count += len(chunk)
+
+    writer.close()
+    return count
+
+
+def _read_exactly(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError('Truncated columnar file.')
+    return data
+
+
+def read_columnar(f):
+    """
+    Yields each row group of a columnar file as a dictionary of column name
+    goes to list of values.  String columns are returned as unicode.
+    """
+    magic, version, column_count = struct.unpack('<4sHI', _read_exactly(f, 10))
+    if magic != COLUMNAR_MAGIC:
+        raise ValueError('Not a columnar file.')
+    if version != COLUMNAR_VERSION:
+        raise ValueError('Unsupported columnar version {0}.'.format(version))
+
+    names = []
+    for i in xrange(column_count):
+        length, = struct.unpack('<I', _read_exactly(f, 4))
+        names.append(_read_exactly(f, length).decode('utf-8'))
+
+    while True:
+        row_count, = struct.unpack('<I', _read_exactly(f, 4))
+        if not row_count:
+            return
+
+        group = {}
+        for name in names:
+            code = _read_exactly(f, 1)
+            nulls = bytearray(_read_exactly(f, (row_count + 7) // 8))
+            null_count = sum(bin(byte).count('1') for byte in nulls)
+            value_count = row_count - null_count
+
+            if code == 's':
+                lengths = struct.unpack(
+                    '<{0}I'.format(value_count), _read_exactly(f, 4 * value_count))
+                blob = _read_exactly(f, sum(lengths))
+                values = []
+                start = 0
+                for length in lengths:
+                    values.append(blob[start:start + length].decode('utf-8'))
+                    start += length
+            else:
+                fmt = '<{0}{1}'.format(value_count, code)
+                values = list(struct.unpack(fmt, _read_exactly(f, struct.calcsize(fmt))))
+
+            values = iter(values)
+            group[name] = [
+                None if nulls[i >> 3] & (1 << (i & 7)) else next(values)
+                for i in xrange(row_count)
+                ]
+
+        yield group
@@ -1,32 +1,142 @@
-import random
+import copy
 import datetime
-from decimal import Decimal
+from decimal import Decimal, Context as DecimalContext
 import itertools
 import collections
+import string
+import threading
 from functools import partial
 
-from perjury.content import (LAST_NAMES, FIRST_NAMES, WORD_LIST, USERNAMES)
+from perjury import util
+from perjury.exceptions import ValueSpaceExhaustedError
+from perjury.stats import instrumented
+from perjury.content import (LazyContent, LAST_NAMES, FIRST_NAMES, WORD_LIST,
+        USERNAMES)
 from perjury.generators.datetime_generators import DatetimeGenerator
 
 from perjury.generators.base import * # NOQA
+from perjury.generators.template import Template
 
 
-class Generator(object):
-    pass
-
-
-# TODO: unique choice generator?  __unique__ magic method?
+@instrumented
 class Choice(Generator):
     """
     :class:`Choice` is a generator that is initialized with choices and will
     randomly return one of those choices when called.
     """
 
-    def __init__(self, choices):
-        self.choices = choices
+    def __init__(self, choices, rng=None):
+        # Content lists are loaded the first time they are drawn from rather
+        # than when the generator is defined.  Until then ``choices`` is left
+        # unset for :meth:`__getattr__` to fill in, so that once it is loaded
+        # every draw reads a plain attribute.
+        if isinstance(choices, LazyContent):
+            self._lazy_choices = choices
+        else:
+            self.choices = choices
+        if rng is not None:
+            self.rng = rng
+
+    def __getattr__(self, name):
+        lazy = self.__dict__.get('_lazy_choices')
+        if name != 'choices' or lazy is None:
+            raise AttributeError(name)
+        choices = self.choices = lazy.resolve()
+        return choices
 
     def __call__(self):
-        return random.choice(self.choices)
+        return self.rng.choice(self.choices)
+
+    def generate_many(self, n):
+        choices = self.choices
+        size = len(choices)
+        rand = self.rng.random
+        return [choices[int(rand() * size)] for i in xrange(n)]
+
+    def as_unique(self, **kwargs):
+        return UniqueChoice(self.choices, rng=self.rng,
+                thread_safe=kwargs.get('thread_safe', False))
+
+    def all_values(self):
+        return self.choices
+
+    def with_max_length(self, max_length):
+        """
+        Returns a generator of only the choices no longer than
+        ``max_length``, or this one if they all are.  If none of them are,
+        random letters are returned instead with :func:`letters_within`.
+        """
+        fitting = [choice for choice in self.choices if len(choice) <= max_length]
+        if len(fitting) == len(self.choices):
+            return self
+        elif not fitting:
+            return letters_within(max_length, rng=self.rng)
+        return Choice(fitting, rng=self.rng)
+
+
+@instrumented
+class UniqueChoice(Generator):
+    """
+    :class:`UniqueChoice` randomly returns each of the distinct ``choices``
+    exactly once, in the manner of a lazily evaluated Fisher-Yates shuffle.
+    Every call takes constant time no matter how many values have been
+    returned, and once all of them have been it raises
+    :class:`ValueSpaceExhaustedError`.  If ``thread_safe`` is set, calls
+    from several threads take turns.
+    """
+    def __init__(self, choices, rng=None, thread_safe=False):
+        if rng is not None:
+            self.rng = rng
+        self.lock = threading.Lock() if thread_safe else None
+
+        distinct = []
+        seen = set()
+        for choice in choices:
+            if choice not in seen:
+                seen.add(choice)
+                distinct.append(choice)
+
+        self.choices = distinct
+        self.remaining = len(distinct)
+        # Positions that have been swapped out of place, mapping position to
+        # the index of the choice that now occupies it.
+        self.swaps = {}
+
+    def __len__(self):
+        return self.remaining
+
+    def __call__(self):
+        if self.lock is None:
+            return self.next()
+        with self.lock:
+            return self.next()
+
+    def next(self):
+        if not self.remaining:
+            raise ValueSpaceExhaustedError(
+                'All {0} choices have been returned.'.format(len(self.choices)))
+
+        last = self.remaining - 1
+        position = int(self.rng.random() * self.remaining)
+        index = self.swaps.get(position, position)
+
+        if position == last:
+            self.swaps.pop(last, None)
+        else:
+            self.swaps[position] = self.swaps.pop(last, last)
+
+        self.remaining = last
+        return self.choices[index]
+
+    def with_rng(self, rng):
+        generator = super(UniqueChoice, self).with_rng(rng)
+        generator.swaps = dict(self.swaps)
+        if self.lock is not None:
+            generator.lock = threading.Lock()
+        return generator
+
+    def as_unique(self, **kwargs):
+        return self
 
 
 def weighted_choice(choices):
@@ -41,11 +151,90 @@ def weighted_choice(choices):
             })
 
 
-    Statistically speaking, you would get 1 True for every 3 Falses.
+    Statistically speaking, you would get 1 True for every 3 Falses.  Weights
+    may be floats, and only one entry is stored per distinct value.
     """
-    counter = collections.Counter(choices)
+    return WeightedChoice(collections.Counter(choices))
+
+
+@instrumented
+class WeightedChoice(Generator):
+    """
+    :class:`WeightedChoice` is initialized with a mapping of value goes to
+    weight and randomly returns one of the values with probability
+    proportional to its weight.  Values with a weight of zero or less are never
+    returned.
+
+    Sampling uses Vose's alias method, so each value is drawn in constant
+    time regardless of how many values or how skewed the weights are.
+    """
+    def __init__(self, weights, rng=None):
+        if rng is not None:
+            self.rng = rng
+
+        self.values = []
+        scaled = []
 
-    return Choice(choices=counter.elements())
+        for value, weight in weights.iteritems():
+            if weight > 0:
+                self.values.append(value)
+                scaled.append(float(weight))
+
+        if not self.values:
+            raise ValueError('At least one choice must have a positive weight.')
+
+        self.size = size = len(self.values)
+        total = sum(scaled)
+        scaled = [weight * size / total for weight in scaled]
+
+        self.probabilities = [1.0] * size
+        self.aliases = range(size)
+
+        small = [i for i, weight in enumerate(scaled) if weight < 1]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+
+            scaled[more] = (scaled[more] + scaled[less]) - 1
+            if scaled[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+    def __call__(self):
+        # The integer part of ``u`` picks a column, and the fractional part
+        # decides between the column's value and its alias.
+        u = self.rng.random() * self.size
+        i = int(u)
+        if u - i < self.probabilities[i]:
+            return self.values[i]
+        return self.values[self.aliases[i]]
+
+    def generate_many(self, n):
+        values = self.values
+        probabilities = self.probabilities
+        aliases = self.aliases
+        size = self.size
+        rand = self.rng.random
+
+        result = []
+        append = result.append
+        for _ in xrange(n):
+            u = rand() * size
+            i = int(u)
+            if u - i < probabilities[i]:
+                append(values[i])
+            else:
+                append(values[aliases[i]])
+        return result
+
+    def all_values(self):
+        return self.values
 
 
 # TODO: this is not a class, but it sort of acts like one.  Should it have a
@@ -54,12 +243,101 @@ def Repeat(value):
     return itertools.repeat(value).next
 
 
-def smallint():
-    return random.randint(1, 10)
+@instrumented
+class SmallIntGenerator(Generator):
+    """
+    Returns a random integer between 1 and 10 inclusive.
+    """
+    def __call__(self):
+        return self.rng.randint(1, 10)
+
+    def generate_many(self, n):
+        rand = self.rng.random
+        return [int(rand() * 10) + 1 for i in xrange(n)]
+
+    def all_values(self):
+        return range(1, 11)
+
+
+smallint = SmallIntGenerator()
+smallint.stats_name = 'smallint'
+
 
+@instrumented
+class IntegerGenerator(Generator):
+    """
+    Returns a random integer between ``low`` and ``high`` inclusive.
+    """
+    def __init__(self, low, high, rng=None):
+        if low > high:
+            raise ValueError('{0} is greater than {1}.'.format(low, high))
+        self.low = low
+        self.high = high
+        if rng is not None:
+            self.rng = rng
+
+    def __call__(self):
+        return self.rng.randint(self.low, self.high)
+
+    def generate_many(self, n):
+        low = self.low
+        size = self.high - low + 1
+        if size > 2 ** 53:
+            randint = self.rng.randint
+            return [randint(low, self.high) for i in xrange(n)]
+        rand = self.rng.random
+        return [low + int(rand() * size) for i in xrange(n)]
+
+    def all_values(self):
+        return xrange(self.low, self.high + 1)
+
+
+@instrumented
+class DecimalGenerator(Generator):
+    """
+    Returns a random decimal.  If ``max_digits`` is given, values have up to
+    that many digits, ``decimal_places`` of them after the decimal point, as
+    a ``DecimalField`` allows.
+    """
+    def __init__(self, max_digits=None, decimal_places=0):
+        self.max_digits = max_digits
+        self.decimal_places = decimal_places
+        if max_digits is not None:
+            self.context = DecimalContext(prec=max(max_digits, 28))
+
+    def __call__(self):
+        if self.max_digits is not None:
+            return self._generate_many(1)[0]
+        return Decimal(self.rng.randrange(1000) / 100)
+
+    def generate_many(self, n):
+        return self._generate_many(n)
+
+    def _generate_many(self, n):
+        rand = self.rng.random
+        if self.max_digits is None:
+            return [Decimal(int(rand() * 1000) / 100) for i in xrange(n)]
 
-def decimal():
-    return Decimal(random.randrange(1000) / 100)
+        size = 10 ** self.max_digits
+        exponent = -self.decimal_places
+        context = self.context
+        if size > 2 ** 53:
+            randrange = self.rng.randrange
+            return [Decimal(randrange(size)).scaleb(exponent, context) for i in xrange(n)]
+        return [Decimal(int(rand() * size)).scaleb(exponent, context) for i in xrange(n)]
+
+    def with_digits(self, max_digits, decimal_places=0):
+        """
+        Returns a copy of the generator for ``max_digits`` and
+        ``decimal_places``.
+        """
+        generator = DecimalGenerator(max_digits, decimal_places)
+        generator.rng = self.rng
+        return generator
+
+
+decimal = DecimalGenerator()
+decimal.stats_name = 'decimal'
 
 
 # TODO: timezone aware?
@@ -68,23 +346,294 @@ today = datetime.date.today
 timenow = datetime.time
 
 word = Choice(choices=WORD_LIST)
+word.stats_name = 'word'
 
 
-def words():
-    return ' '.join(word() for i in range(smallint()))
+@instrumented
+class WordsGenerator(Generator):
+    """
+    Returns a space separated string of words.  The number of words is drawn
+    from ``length`` and each word from ``word``.  Any generator of integers
+    can be used as ``length`` to change how many words there are, for
+    example ``weighted_choice({1: 5, 2: 3, 3: 1})``.
+
+    If ``max_length`` is set, values are never longer than it.  When ``word``
+    is a :class:`Choice`, each word is drawn from those that fit in what is
+    left of ``max_length``, so values are never cut short mid-word and no
+    draws are thrown away; the value ends early once no word fits.  Other
+    ``word`` generators end the value at the first word that does not fit.
+    If no word is short enough at all, :meth:`with_max_length` returns a
+    :class:`LettersGenerator` instead, so that values are never empty.
+    """
+    def __init__(self, word=word, length=smallint, max_length=None):
+        self.word = word
+        self.length = length
+        self.max_length = max_length
+        self._fitting = None
+
+    def __call__(self):
+        if self.max_length is not None:
+            return self._generate_many(1)[0]
+        return ' '.join(self.word() for i in range(self.length()))
+
+    def with_max_length(self, max_length):
+        """
+        Returns a copy of the generator whose values are no longer than
+        ``max_length``, or this one if its values can't be longer anyway.
+        """
+        longest = self.longest()
+        if longest is not None and longest <= max_length:
+            return self
+        elif isinstance(self.word, Choice) and 0 < max_length:
+            fits = self.fitting_words()[1]
+            if max_length < len(fits) and not fits[max_length]:
+                return letters_within(max_length, rng=self.word.rng)
+        generator = copy.copy(self)
+        generator.max_length = max_length
+        return generator
+
+    def longest(self):
+        """
+        Returns the length of the longest value the generator can return, or
+        ``None`` if that isn't known.
+        """
+        if self.max_length is not None:
+            return self.max_length
+        elif not isinstance(self.word, Choice) or \
+                not hasattr(self.length, 'all_values'):
+            return None
+        fits = self.fitting_words()[1]
+        return max(self.length.all_values()) * len(fits) - 1
+
+    def fitting_words(self):
+        """
+        Returns the words of a :class:`Choice` ``word`` sorted by length, and
+        a list whose item ``i`` is the number of words of length ``i`` or
+        less.  Words that fit in a budget are then a prefix of the sorted
+        words.
+        """
+        choices = self.word.choices
+        if self._fitting is None or self._fitting[0] is not choices:
+            ordered = sorted(choices, key=len)
+            fits = [0] * (len(ordered[-1]) + 1 if ordered else 1)
+            for value in ordered:
+                fits[len(value)] += 1
+            for i in xrange(1, len(fits)):
+                fits[i] += fits[i - 1]
+            self._fitting = (choices, ordered, fits)
+        return self._fitting[1:]
+
+    def generate_many(self, n):
+        return self._generate_many(n)
+
+    def _generate_many(self, n):
+        lengths = util.generate_many(self.length, n)
+        if self.max_length is not None:
+            if isinstance(self.word, Choice):
+                return self._generate_fitting(lengths)
+            return self._generate_truncated(lengths)
+
+        pool = util.generate_many(self.word, sum(lengths))
+        values = []
+        start = 0
+        for length in lengths:
+            end = start + length
+            values.append(' '.join(pool[start:end]))
+            start = end
+        return values
+
+    def _generate_fitting(self, lengths):
+        ordered, fits = self.fitting_words()
+        longest = len(fits) - 1
+        everything = fits[-1]
+        rand = self.word.rng.random
+        # Every word but the first costs a space too, which the first is
+        # given for free.
+        start_budget = self.max_length + 1
+
+        values = []
+        for length in lengths:
+            if length * (longest + 1) <= start_budget:
+                # Even the longest words would fit.
+                values.append(' '.join([
+                    ordered[int(rand() * everything)] for i in xrange(length)]))
+                continue
+
+            parts = []
+            budget = start_budget
+            for i in xrange(length):
+                available = budget - 1
+                if available >= longest:
+                    count = everything
+                elif available > 0:
+                    count = fits[available]
+                else:
+                    break
+                if not count:
+                    break
+                value = ordered[int(rand() * count)]
+                parts.append(value)
+                budget -= len(value) + 1
+            values.append(' '.join(parts))
+        return values
+
+    def _generate_truncated(self, lengths):
+        pool = iter(util.generate_many(self.word, sum(lengths)))
+        values = []
+        for length in lengths:
+            parts = []
+            budget = self.max_length + 1
+            for value in itertools.islice(pool, length):
+                budget -= len(value) + 1
+                if budget < 0:
+                    break
+                parts.append(value)
+            values.append(' '.join(parts))
+        return values
+
+    def with_rng(self, rng):
+        generator = super(WordsGenerator, self).with_rng(rng)
+        generator.word = util.with_rng(self.word, rng)
+        generator.length = util.with_rng(self.length, rng)
+        return generator
+
+
+words = WordsGenerator()
+words.stats_name = 'words'
+
+
+@instrumented
+class LettersGenerator(Generator):
+    """
+    Returns a string of between ``min_length`` and ``max_length`` random
+    lowercase letters, for fields too short for words.
+    """
+    letters = string.ascii_lowercase
+
+    def __init__(self, max_length, min_length=1, rng=None):
+        if not 0 < min_length <= max_length:
+            raise ValueError('Lengths must be positive and min_length no more '
+                    'than max_length.')
+        self.max_length = max_length
+        self.min_length = min_length
+        if rng is not None:
+            self.rng = rng
+
+    def __call__(self):
+        return self._generate_many(1)[0]
+
+    def generate_many(self, n):
+        return self._generate_many(n)
+
+    def _generate_many(self, n):
+        letters = self.letters
+        count = len(letters)
+        shortest = self.min_length
+        spread = self.max_length - shortest + 1
+        rand = self.rng.random
+        return [
+            ''.join([letters[int(rand() * count)]
+                     for i in xrange(shortest + int(rand() * spread))])
+            for j in xrange(n)
+            ]
+
+    def with_max_length(self, max_length):
+        if max_length >= self.max_length:
+            return self
+        elif max_length < self.min_length:
+            return letters_within(max_length, rng=self.rng)
+        generator = copy.copy(self)
+        generator.max_length = max_length
+        return generator
+
+    def all_values(self):
+        return [
+            ''.join(letters)
+            for length in xrange(self.min_length, self.max_length + 1)
+            for letters in itertools.product(self.letters, repeat=length)
+            ]
+
+
+def letters_within(max_length, rng=None):
+    """
+    Returns a generator for when nothing else is short enough: a
+    :class:`LettersGenerator` of values no longer than ``max_length``, or
+    one that only returns ``''`` if not even a single letter fits.
+    """
+    if max_length < 1:
+        return Choice(('',), rng=rng)
+    return LettersGenerator(max_length, rng=rng)
 
 
 first_name = Choice(choices=FIRST_NAMES)
+first_name.stats_name = 'first_name'
 last_name = Choice(choices=LAST_NAMES)
+last_name.stats_name = 'last_name'
 username = Choice(choices=USERNAMES)
+username.stats_name = 'username'
 
 
-def email():
-    return '{0}@example.com'.format(username())
+@instrumented
+class FormatGenerator(Generator):
+    """
+    Formats the value returned by ``source`` into ``template``.::
 
+        email = FormatGenerator('{0}@example.com', username)
+    """
+    def __init__(self, template, source):
+        self.template = template
+        self.source = source
 
-def url():
-    return 'http://{0}.com'.format(username())
+    def __call__(self):
+        return self.template.format(self.source())
+
+    def generate_many(self, n):
+        fmt = self.template.format
+        return [fmt(value) for value in util.generate_many(self.source, n)]
+
+    def with_rng(self, rng):
+        generator = super(FormatGenerator, self).with_rng(rng)
+        generator.source = util.with_rng(self.source, rng)
+        return generator
+
+    def as_unique(self, **kwargs):
+        # Formatting is injective, so unique sources give unique values.
+        return FormatGenerator(self.template, util.as_unique(self.source, **kwargs))
+
+    def with_max_length(self, max_length):
+        """
+        Returns a generator whose values are no longer than ``max_length``,
+        by limiting the length of the source's values, or this one if that
+        doesn't change anything.  If the template leaves no room for the
+        source at all, values are random letters from :func:`letters_within`
+        instead, which fit even though they don't follow the template.
+        """
+        overhead = len(self.template.format(''))
+        if max_length - overhead < 1:
+            return letters_within(
+                    max_length, rng=getattr(self.source, 'rng', self.rng))
+        source = util.with_max_length(self.source, max_length - overhead)
+        if source is self.source:
+            return self
+        generator = copy.copy(self)
+        generator.source = source
+        return generator
+
+    @property
+    def all_values(self):
+        # Only enumerable if the source is, otherwise the AttributeError
+        # tells :func:`perjury.util.unique` that it isn't.
+        source_values = self.source.all_values
+        return lambda: [self.template.format(value) for value in source_values()]
+
+
+domain = Choice(choices=('example.com', 'example.net', 'example.org'))
+domain.stats_name = 'domain'
+
+email = FormatGenerator('{0}@example.com', username)
+email.stats_name = 'email'
+url = FormatGenerator('http://{0}.com', username)
+url.stats_name = 'url'
 
 
 # How do we allow users to determine their own now function
@@ -96,9 +645,15 @@ class CurrentDatetimeGenerator(DatetimeGenerator):
     def start_at(self):
         return datetime.datetime.now() - datetime.timedelta(30)
 
+    def range(self):
+        now = datetime.datetime.now()
+        return now - datetime.timedelta(30), now + datetime.timedelta(30)
+
 
 current_datetime = CurrentDatetimeGenerator()
+current_datetime.stats_name = 'current_datetime'
 datetime_generator = DatetimeGenerator()
+datetime_generator.stats_name = 'datetime_generator'
 
 
 def sequence(start=1, incr=1):
@@ -110,9 +665,21 @@ def sequence(start=1, incr=1):
         start += incr
 
 
-def consumer(iterable):
+def consumer(iterable, thread_safe=False):
     """
     Takes a Python iterable and returns a perjury generator that
-    will spit out an iteration every time called.
+    will spit out an iteration every time called.  If ``thread_safe`` is set,
+    it can be called from several threads at once, which a Python generator
+    can't.
     """
-    return partial(next, iter(iterable))
+    if not thread_safe:
+        return partial(next, iter(iterable))
+
+    iterator = iter(iterable)
+    lock = threading.Lock()
+
+    def locked():
+        with lock:
+            return next(iterator)
+
+    return locked
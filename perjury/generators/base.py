@@ -1,7 +1,62 @@
-from perjury import util
+import copy
+import random
 
+from perjury import stats, util
 
-class BaseGenerator(object):
+
+class Generator(object):
+    """
+    Base class for class-based generators.  Subclasses implement ``__call__``
+    and may override :meth:`generate_many` with a faster batch path.
+
+    Generators draw random numbers from ``rng``, which defaults to the global
+    :mod:`random` module.  Use :meth:`with_rng` or :meth:`seeded` to give a
+    generator a stream of its own.
+
+    Decorate a subclass with :func:`perjury.stats.instrumented` to have its
+    ``__call__`` and :meth:`generate_many` recorded by :mod:`perjury.stats`.
+    """
+    rng = random
+
+    def with_rng(self, rng):
+        """
+        Returns a copy of the generator that draws from ``rng``, an instance
+        of :class:`random.Random`.  Generators built from other generators
+        pass ``rng`` on to copies of them too.
+        """
+        generator = copy.copy(self)
+        generator.rng = rng
+        return generator
+
+    def seeded(self, seed):
+        """
+        Returns a copy of the generator with its own :class:`random.Random`
+        seeded with ``seed``.
+        """
+        return self.with_rng(random.Random(seed))
+
+    def generate_many(self, n):
+        """
+        Returns a list of ``n`` generated values.
+        """
+        return [self() for i in xrange(n)]
+
+    def as_unique(self, **kwargs):
+        """
+        Returns a generator that never repeats a value.  By default this wraps
+        the generator with :func:`perjury.util.unique`, which is passed
+        ``kwargs``.  Generators over a finite set of values override it to
+        sample without replacement.
+        """
+        return util.unique(self, **kwargs)
+
+    # Generators over a finite set of values may define ``all_values``,
+    # returning every value they can generate, so that :func:`util.unique`
+    # can hand out the values it has not yet returned once repeats become
+    # common.
+
+
+class BaseGenerator(Generator):
     """
     Base class for all foundry generator classes.
     """
@@ -9,6 +64,7 @@ class BaseGenerator(object):
     unique = True
     key_fn = None
     seen = None
+    thread_safe = False
 
     def __init__(self):
         if self.unique:
@@ -17,10 +73,22 @@ class BaseGenerator(object):
                     depth_limit=self.depth_limit,
                     key_fn=self.key_fn,
                     seen=self.seen,
+                    thread_safe=self.thread_safe,
                     )
 
     def __call__(self):
-        return self.generator()
+        if stats.active is None:
+            return self.generator()
+        return stats.timed(stats.active, stats.name_of(self), self.generator)
+
+    def with_rng(self, rng):
+        generator = super(BaseGenerator, self).with_rng(rng)
+        if self.unique:
+            # The unique wrapper is bound to the original instance, so the
+            # copy gets its own, along with its own store of seen values.
+            del generator.generator
+            BaseGenerator.__init__(generator)
+        return generator
 
     def generator(self):
         raise NotImplementedError('Generator classes must implement their own'
@@ -3,26 +3,136 @@ import random
 import datetime
 
 from perjury.generators.base import BaseGenerator
+from perjury.stats import instrumented
+
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+# Number of units per second for each supported resolution.
+RESOLUTIONS = {
+    'seconds': 1,
+    'microseconds': 10 ** 6,
+    }
+
+# Spans wider than this can't be drawn as ``int(random() * span)`` without
+# losing precision, since a float only has 53 bits of mantissa.
+MAX_FLOAT_SPAN = 2 ** 53
+
+# Most date prefixes ``generate_isoformat`` keeps before starting over.
+MAX_CACHED_DAYS = 100000
+
+
+class UTC(datetime.tzinfo):
+    """
+    The UTC timezone, for making timezone aware datetimes without pytz.
+    """
+    def utcoffset(self, dt):
+        return datetime.timedelta(0)
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
+
+    def tzname(self, dt):
+        return 'UTC'
+
+    def __repr__(self):
+        return 'UTC'
+
+
+utc = UTC()
 
 
 def total_seconds(td):
     return (td.microseconds + (td.seconds + td.days * 24 * 3600) * 10 ** 6) / 10 ** 6
 
 
-def datetime_in_range(start_at, end_at):
+def total_units(td, resolution='seconds'):
+    """
+    Returns the whole number of ``resolution`` units in a timedelta.
+    """
+    seconds = td.days * 86400 + td.seconds
+    if resolution == 'seconds':
+        return seconds
+    return seconds * 10 ** 6 + td.microseconds
+
+
+def units_delta(units, resolution='seconds'):
+    """
+    Returns a timedelta of ``units`` ``resolution`` units.
+    """
+    if resolution == 'seconds':
+        return datetime.timedelta(0, units)
+    return datetime.timedelta(0, 0, units)
+
+
+def to_epoch(value, resolution='seconds'):
+    """
+    Returns a datetime as whole ``resolution`` units since the Unix epoch.
+    Timezone aware datetimes are converted to UTC first, naive ones are taken
+    to already be in UTC.
+    """
+    offset = value.utcoffset()
+    if offset is not None:
+        value = value.replace(tzinfo=None) - offset
+    return total_units(value - EPOCH, resolution)
+
+
+def random_offsets(rng, span, n):
     """
-    Generates a random datetime between start and end datetime values.
+    Returns ``n`` random integers in ``[0, span)`` drawn from ``rng``.
     """
-    td = end_at - start_at
-    seconds = int(total_seconds(td))
-    return start_at + datetime.timedelta(seconds=random.randrange(seconds))
+    if span <= MAX_FLOAT_SPAN:
+        rand = rng.random
+        return [int(rand() * span) for i in xrange(n)]
+    randrange = rng.randrange
+    return [randrange(span) for i in xrange(n)]
 
 
+def sorted_offsets(rng, span, n):
+    """
+    Yields ``n`` random integers in ``[0, span)`` in non-decreasing order,
+    using constant memory.  Each value is drawn as the next order statistic
+    of ``n`` uniform draws given the one before it.
+    """
+    random = rng.random
+    position = 0.0
+    for remaining in xrange(n, 0, -1):
+        position = 1.0 - (1.0 - position) * (1.0 - random()) ** (1.0 / remaining)
+        yield min(int(position * span), span - 1)
+
+
+def arrival_offsets(rng, rate, span):
+    """
+    Yields the arrival times of a Poisson process with ``rate`` arrivals per
+    unit as integer offsets in ``[0, span)``, in non-decreasing order.
+    """
+    expovariate = rng.expovariate
+    position = expovariate(rate)
+    while position < span:
+        yield int(position)
+        position += expovariate(rate)
+
+
+def datetime_in_range(start_at, end_at, rng=random, resolution='seconds'):
+    """
+    Generates a random datetime between start and end datetime values, drawn
+    from ``rng``, to the nearest ``resolution``.
+    """
+    span = total_units(end_at - start_at, resolution)
+    return start_at + units_delta(rng.randrange(span), resolution)
+
+
+@instrumented
 class DatetimeGenerator(BaseGenerator):
     """
     Class-based generator for generating random datetime values.
+
+    Values are drawn to the nearest ``resolution``, either ``'seconds'`` or
+    ``'microseconds'``.  Timezone aware ``start_at`` and ``end_at`` values
+    give timezone aware results in the timezone of ``start_at``.
     """
     unique = False
+    resolution = 'seconds'
 
     def start_at(self):
         return datetime.datetime.min
@@ -30,5 +140,112 @@ class DatetimeGenerator(BaseGenerator):
     def end_at(self):
         return datetime.datetime.max
 
+    def range(self):
+        """
+        Returns the ``(start_at, end_at)`` pair to draw from.  Batches call
+        this once rather than once per value.
+        """
+        return self.start_at(), self.end_at()
+
     def generator(self):
-        return datetime_in_range(self.start_at(), self.end_at())
+        start_at, end_at = self.range()
+        return datetime_in_range(start_at, end_at, self.rng, self.resolution)
+
+    def _offsets(self, n):
+        start_at, end_at = self.range()
+        span = total_units(end_at - start_at, self.resolution)
+        return start_at, random_offsets(self.rng, span, n)
+
+    def generate_many(self, n):
+        """
+        Returns a list of ``n`` datetimes.  The range is computed once for the
+        whole batch rather than once per value.
+        """
+        if self.unique:
+            generator = self.generator
+            return [generator() for i in xrange(n)]
+
+        start_at, offsets = self._offsets(n)
+        if self.resolution == 'seconds':
+            return [start_at + datetime.timedelta(0, offset) for offset in offsets]
+        return [start_at + datetime.timedelta(0, 0, offset) for offset in offsets]
+
+    def _stream(self, start_at, offsets):
+        delta = units_delta
+        resolution = self.resolution
+        for offset in offsets:
+            yield start_at + delta(offset, resolution)
+
+    def sorted_stream(self, n):
+        """
+        Returns a Python generator of ``n`` random datetimes in non-decreasing
+        order.  The values are distributed as ``n`` independent draws would
+        be once sorted, but are produced one at a time in constant memory.
+        """
+        start_at, end_at = self.range()
+        span = total_units(end_at - start_at, self.resolution)
+        return self._stream(start_at, sorted_offsets(self.rng, span, n))
+
+    def arrivals(self, rate):
+        """
+        Returns a Python generator of non-decreasing datetimes arriving as a
+        Poisson process at an average of ``rate`` per second, from
+        ``start_at`` until ``end_at``.
+        """
+        start_at, end_at = self.range()
+        span = total_units(end_at - start_at, self.resolution)
+        rate = rate / RESOLUTIONS[self.resolution]
+        return self._stream(start_at, arrival_offsets(self.rng, rate, span))
+
+    def generate_epochs(self, n):
+        """
+        Returns a list of ``n`` values as integers of ``resolution`` units
+        since the Unix epoch, without creating datetime objects.
+        """
+        if self.unique:
+            return [to_epoch(value, self.resolution) for value in self.generate_many(n)]
+
+        start_at, offsets = self._offsets(n)
+        start = to_epoch(start_at, self.resolution)
+        return [start + offset for offset in offsets]
+
+    def generate_isoformat(self, n):
+        """
+        Returns a list of ``n`` values as ISO 8601 strings, identical to
+        ``datetime.isoformat()``, without creating a datetime object per
+        value.  Aware values use the UTC offset of ``start_at`` throughout.
+        """
+        if self.unique:
+            return [value.isoformat() for value in self.generate_many(n)]
+
+        start_at, offsets = self._offsets(n)
+        offset = start_at.utcoffset()
+        suffix = '' if offset is None else start_at.isoformat()[-6:]
+
+        # Offsets are counted from the start of the day ``start_at`` falls
+        # on, so the day and the time of day come straight out of divmod.
+        midnight = datetime.datetime.combine(start_at.date(), datetime.time())
+        scale = RESOLUTIONS[self.resolution]
+        base = total_units(start_at.replace(tzinfo=None) - midnight, self.resolution)
+        units_per_day = 86400 * scale
+
+        days = {}
+        values = []
+        append = values.append
+        for offset in offsets:
+            day, units = divmod(base + offset, units_per_day)
+            try:
+                date = days[day]
+            except KeyError:
+                if len(days) > MAX_CACHED_DAYS:
+                    days.clear()
+                date = days[day] = (midnight + datetime.timedelta(day)).date().isoformat() + 'T'
+            seconds, microseconds = divmod(units, scale)
+            minutes, second = divmod(seconds, 60)
+            hour, minute = divmod(minutes, 60)
+            if microseconds:
+                append('%s%02d:%02d:%02d.%06d%s' % (
+                    date, hour, minute, second, microseconds, suffix))
+            else:
+                append('%s%02d:%02d:%02d%s' % (date, hour, minute, second, suffix))
+        return values
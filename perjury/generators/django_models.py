@@ -1,57 +1,164 @@
-from django.db import models
+import copy
+import fnmatch
+import math
+import re
+
+from django.core import validators
+from django.core.management.color import no_style
+from django.db import connections, models, router, transaction
 
 from perjury import generators as g
+from perjury import stats, util
 
 
 IGNORED_FIELDS = (models.AutoField, models.OneToOneField)
 
 
+# Field class goes to the generator for fields of that class.  Subclasses of
+# these fields use the generator of their nearest listed ancestor.
+# ``ForeignKey`` is added below, once :class:`ForeignKeyGenerator` exists.
+FIELD_CLASS_GENERATORS = {
+        models.CharField: g.words,
+        models.DateField: g.today,
+        models.DateTimeField: g.now,
+        models.DecimalField: g.decimal,
+        models.EmailField: g.email,
+        models.IntegerField: g.smallint,
+        models.TextField: g.words,
+        models.TimeField: g.timenow,
+        models.URLField: g.url,
+        }
+
+# Memoized results of :func:`get_generator_for_class`.
+_class_generator_cache = {}
+
+
 def get_generator_for_class(cls):
     """
-    Recurses through the ``__bases__`` of a class to find the generator that
-    corresponds with the field type.  If it finds none, it will raise an
-    :class:`IndexError`.
-    """
-    # TODO: make this extensible???
-    class2generator_map = {
-            models.CharField: g.words,
-            models.DateField: g.today,
-            models.DateTimeField: g.now,
-            models.DecimalField: g.decimal,
-            models.EmailField: g.email,
-            models.ForeignKey: ForeignKeyGenerator,
-            models.IntegerField: g.smallint,
-            models.TextField: g.words,
-            models.TimeField: g.timenow,
-            models.URLField: g.url,
-            }
-
+    Walks the MRO of a class to find the generator that corresponds with the
+    field type.  If it finds none, it will raise an :class:`IndexError`.
+    Results are memoized per class.
+    """
     try:
-        return class2generator_map[cls]
+        return _class_generator_cache[cls]
     except KeyError:
-        return get_generator_for_class(cls.__bases__[0])
+        pass
+
+    for base in cls.__mro__:
+        if base in FIELD_CLASS_GENERATORS:
+            generator = _class_generator_cache[cls] = FIELD_CLASS_GENERATORS[base]
+            return generator
+
+    raise IndexError('No generator for field class: {0}'.format(cls))
+
+
+# Exact field name goes to the generator for fields with that name.
+NAME_GENERATORS = {
+        'first_name': g.first_name,
+        'last_name': g.last_name,
+        'username': g.username,
+        }
+
+# (compiled pattern, generator) pairs for field names that are matched by
+# pattern.  Later registrations are tried first.
+NAME_PATTERN_GENERATORS = []
+
+# Memoized results of :func:`guess_generator_by_name`, with ``None`` for
+# names that have no generator.
+_name_generator_cache = {}
 
 
 def guess_generator_by_name(name):
     """
-    Tries to intelligently guess a generator based on a name.  If it cannot, it
-    will raise a :class:`KeyError`.
+    Tries to intelligently guess a generator based on a name.  Exact names in
+    ``NAME_GENERATORS`` are tried before the patterns in
+    ``NAME_PATTERN_GENERATORS``.  If it cannot, it will raise a
+    :class:`KeyError`.
+    """
+    try:
+        generator = _name_generator_cache[name]
+    except KeyError:
+        generator = NAME_GENERATORS.get(name)
+        if generator is None:
+            for pattern, candidate in reversed(NAME_PATTERN_GENERATORS):
+                if pattern.match(name):
+                    generator = candidate
+                    break
+        _name_generator_cache[name] = generator
+
+    if generator is None:
+        raise KeyError(name)
+    return generator
+
+
+def _compile_name_pattern(pattern):
+    if hasattr(pattern, 'match'):
+        return pattern
+    return re.compile(fnmatch.translate(pattern))
+
+
+def register_field_generator(field_class, generator):
     """
-    # TODO: make this extensible???
-    name2generator_map = {
-            'first_name': g.first_name,
-            'last_name': g.last_name,
-            'username': g.username,
-            }
+    Uses ``generator`` for fields of ``field_class`` and its subclasses,
+    unless a subclass has a generator of its own.  ``generator`` may be a
+    :class:`FieldGenerator` subclass, which is instantiated with the field.::
 
-    return name2generator_map[name]
+        register_field_generator(MoneyField, money_generator)
+    """
+    FIELD_CLASS_GENERATORS[field_class] = generator
+    clear_introspection_cache()
+
+
+def unregister_field_generator(field_class):
+    """
+    Removes the generator registered for ``field_class``.
+    """
+    del FIELD_CLASS_GENERATORS[field_class]
+    clear_introspection_cache()
+
+
+def register_name_generator(pattern, generator):
+    """
+    Uses ``generator`` for fields whose name matches ``pattern``, regardless
+    of the field's class.  ``pattern`` is an exact name, a shell style
+    pattern such as ``'*_email'`` or a compiled regular expression.::
+
+        register_name_generator('*_email', g.email)
+        register_name_generator(re.compile(r'^(home|work)_phone$'), phone)
+    """
+    if isinstance(pattern, basestring) and not set('*?[') & set(pattern):
+        NAME_GENERATORS[pattern] = generator
+    else:
+        NAME_PATTERN_GENERATORS.append((_compile_name_pattern(pattern), generator))
+    clear_introspection_cache()
+
+
+def unregister_name_generator(pattern):
+    """
+    Removes the generator registered for ``pattern``.
+    """
+    if isinstance(pattern, basestring) and pattern in NAME_GENERATORS:
+        del NAME_GENERATORS[pattern]
+    else:
+        compiled = _compile_name_pattern(pattern)
+        NAME_PATTERN_GENERATORS[:] = [
+            (candidate, generator)
+            for candidate, generator in NAME_PATTERN_GENERATORS
+            if candidate.pattern != compiled.pattern
+            ]
+    clear_introspection_cache()
 
 
 def get_generator_for_field(field):
     """
     Tries to figure out which generator to based on a Field instance.  If it
-    cannot, it will raise a :class:`NotImplementedError`.
+    cannot, it will raise a :class:`NotImplementedError`.  The generator is
+    adjusted to the field's constraints with :func:`constrain_generator`.
     """
+    return constrain_generator(_get_generator_for_field(field), field)
+
+
+def _get_generator_for_field(field):
     if field.choices:
         cls = g.Choice([choice[0] for choice in field.choices])
     else:
@@ -64,6 +171,8 @@ def get_generator_for_field(field):
                 raise NotImplementedError('Unknown field type: {0}'.format(field))
 
         try:
+            if issubclass(cls, ForeignKeyGenerator) and is_cyclic(field):
+                cls = CyclicForeignKeyGenerator
             if issubclass(cls, FieldGenerator):
                 return cls(field)
         except TypeError:
@@ -72,6 +181,103 @@ def get_generator_for_field(field):
     return cls
 
 
+def integer_bounds(field):
+    """
+    Returns the ``(low, high)`` bounds that the ``MinValueValidator`` and
+    ``MaxValueValidator`` validators of ``field`` allow, with ``None`` for
+    either if it is unbounded.
+    """
+    low = high = None
+
+    for validator in field.validators:
+        if isinstance(validator, validators.MinValueValidator):
+            low = validator.limit_value if low is None else max(low, validator.limit_value)
+        elif isinstance(validator, validators.MaxValueValidator):
+            high = validator.limit_value if high is None else min(high, validator.limit_value)
+
+    return low, high
+
+
+def integer_field_max(field):
+    """
+    Returns the largest value the database column of the integer ``field``
+    holds on every backend.
+    """
+    if isinstance(field, (models.SmallIntegerField,
+                          models.PositiveSmallIntegerField)):
+        return 32767
+    return 2147483647
+
+
+def constrain_generator(generator, field):
+    """
+    Returns a version of ``generator`` whose values ``field`` accepts, so
+    that rows are valid as generated rather than failing on save:
+
+    - values are no longer than ``max_length``, for generators that support
+      :func:`perjury.util.with_max_length`.
+    - the default decimal generator has the ``max_digits`` and
+      ``decimal_places`` of a ``DecimalField``.
+    - the default integer generator stays within the bounds of any
+      ``MinValueValidator`` and ``MaxValueValidator``.  For ``unique``
+      fields it draws from every value the column holds within those bounds,
+      rather than running out after ten.
+
+    :class:`FieldGenerator` instances are returned as they are.  Values of
+    ``unique`` fields are kept from repeating by :class:`ModelGenerator`
+    rather than here, since introspection is cached and shared.
+    """
+    if isinstance(generator, FieldGenerator):
+        return generator
+
+    if field.max_length and not field.choices:
+        generator = util.with_max_length(generator, field.max_length)
+
+    if isinstance(field, models.DecimalField) and \
+            isinstance(generator, g.DecimalGenerator):
+        generator = generator.with_digits(field.max_digits, field.decimal_places)
+
+    if generator is g.smallint:
+        low, high = integer_bounds(field)
+        if is_unique(field):
+            maximum = integer_field_max(field)
+            if low is None:
+                low = 1 if high is None or high >= 1 else high - maximum
+            if high is None:
+                high = max(low, maximum)
+            generator = g.IntegerGenerator(low, high)
+        elif (low is not None and low > 1) or (high is not None and high < 10):
+            if low is None:
+                low = min(1, high)
+            if high is None:
+                high = low + 9
+            generator = g.IntegerGenerator(low, high)
+
+    return generator
+
+
+def is_unique(field):
+    """
+    Returns whether values generated for ``field`` must not repeat.
+    """
+    return field.unique and not field.primary_key
+
+
+def unique_generator(generator):
+    """
+    Returns a version of ``generator`` that never repeats a value, for a
+    ``unique`` field.  Generators that know their values sample them without
+    replacement with :func:`perjury.util.as_unique`.  When
+    :data:`perjury.util.default_seen` makes stores marked as ``shared``
+    between processes, as in the workers of
+    :func:`perjury.parallel.generate_parallel`, :func:`perjury.util.unique`
+    is used instead so that every value goes through such a store.
+    """
+    if getattr(util.default_seen, 'shared', False):
+        return util.unique(generator)
+    return util.as_unique(generator)
+
+
 def introspect_fields(fields):
     """
     For every field passed in, figure out the appropriate dictionary and return
@@ -85,6 +291,124 @@ def introspect_fields(fields):
     return generators
 
 
+def is_generated_by_default(field, exclude=tuple()):
+    """
+    Returns whether :class:`ModelGenerator` generates ``field`` when it is
+    not given a list of ``fields``.
+    """
+    if field.name in exclude:
+        return False
+    elif isinstance(field, IGNORED_FIELDS) or \
+         field.blank or \
+         field.null:
+        return False
+    return True
+
+
+def required_foreign_keys(model):
+    """
+    Returns the foreign key fields of ``model`` that are generated by default.
+    """
+    return [
+        field for field in model._meta.fields
+        if isinstance(field, models.ForeignKey) and is_generated_by_default(field)
+        ]
+
+
+def is_cyclic(field):
+    """
+    Returns whether the foreign key ``field`` leads back to its own model
+    through required foreign keys, as a self-referential key does.  A new
+    parent for such a key would need a parent of its own, forever.
+    """
+    stack = [field.rel.to]
+    visited = set()
+
+    while stack:
+        model = stack.pop()
+        if model is field.model:
+            return True
+        if model not in visited:
+            visited.add(model)
+            stack.extend(fk.rel.to for fk in required_foreign_keys(model))
+
+    return False
+
+
+def dependency_order(model_list):
+    """
+    Returns ``model_list`` sorted so that each model comes after the models
+    its required foreign keys point at.  Self-referential keys are ignored,
+    and any other cycle raises a :class:`ValueError`.
+    """
+    included = set(model_list)
+    ordered = []
+    state = {}
+
+    def visit(model, path):
+        if state.get(model) == 'done':
+            return
+        elif state.get(model) == 'visiting':
+            raise ValueError('Foreign key cycle: {0}'.format(
+                ' -> '.join(m.__name__ for m in path + [model])))
+
+        state[model] = 'visiting'
+        for field in required_foreign_keys(model):
+            target = field.rel.to
+            if target is not model and target in included:
+                visit(target, path + [model])
+        state[model] = 'done'
+        ordered.append(model)
+
+    for model in model_list:
+        visit(model, [])
+
+    return ordered
+
+
+# (model, fields, exclude) goes to the result of :func:`introspect_fields`
+# for the fields of ``model`` that :class:`ModelGenerator` would select.
+_introspection_cache = {}
+
+
+def introspect_model(model, fields=None, exclude=tuple()):
+    """
+    Returns a new dictionary of field name goes to generator for the fields
+    of ``model`` selected by ``fields`` and ``exclude``, as described on
+    :class:`ModelGenerator`.  The introspection is cached per model and
+    arguments, so only the first call for a model walks its fields.
+    """
+    key = (model, tuple(fields) if fields else None, tuple(exclude))
+
+    try:
+        return dict(_introspection_cache[key])
+    except KeyError:
+        pass
+
+    # Limit fields to those that were specified.  ``fields`` is a list of
+    # strings, we need to get the fields that correspond to those strings.
+    if fields:
+        def check(field):
+            return field.name in fields
+    else:
+        def check(field): # NOQA
+            return is_generated_by_default(field, exclude)
+
+    generators = introspect_fields(filter(check, model._meta.fields))
+    _introspection_cache[key] = generators
+    return dict(generators)
+
+
+def clear_introspection_cache():
+    """
+    Forgets all cached introspection.  The register functions call this for
+    you.
+    """
+    _class_generator_cache.clear()
+    _name_generator_cache.clear()
+    _introspection_cache.clear()
+
+
 class ModelGenerator(g.Generator):
     """
     Takes a model and creates a generator that will return instances of the
@@ -148,29 +472,52 @@ class ModelGenerator(g.Generator):
     def __init__(self, model, generators=None, fields=None, exclude=tuple()):
         self.model = model
 
-        fields_to_be_introspected = model._meta.fields
-
-        # Limit fields to those that were specified.  ``fields`` is a list of
-        # strings, we need to get the fields that correspond to those strings.
-        if fields:
-            def check(field):
-                return field.name in fields
-        else:
-            def check(field): # NOQA
-                if field.name in exclude:
-                    return False
-                elif isinstance(field, IGNORED_FIELDS) or \
-                     field.blank or \
-                     field.null:
-                    return False
-                return True
+        self.generators = introspect_model(model, fields, exclude)
 
-        fields_to_be_introspected = filter(check, fields_to_be_introspected)
+        # Introspection is shared between generators, but the rows loaded
+        # into a cyclic key's pool and the values used by a parent's unique
+        # fields are not, so foreign keys get generators of their own.
+        for key, generator in self.generators.items():
+            if isinstance(generator, (ForeignKeyGenerator, CyclicForeignKeyGenerator)):
+                self.generators[key] = type(generator)(generator.field)
 
-        self.generators = introspect_fields(fields_to_be_introspected)
+        # Each generator keeps the values it has used for unique fields to
+        # itself, so they are made unique here rather than when introspecting.
+        self.unique_sources = dict(
+            (key, generator) for key, generator in self.generators.iteritems()
+            if not isinstance(generator, FieldGenerator) and
+            is_unique(model._meta.get_field(key))
+            )
 
         if generators:
             self.generators.update(generators)
+            for key in generators:
+                self.unique_sources.pop(key, None)
+
+        self._make_unique()
+
+    def _make_unique(self):
+        # Shared stores are handed out in the order generators are made, so
+        # every process must make them in the same order.
+        for key in sorted(self.unique_sources):
+            self.generators[key] = unique_generator(self.unique_sources[key])
+
+    def with_rng(self, rng):
+        """
+        Returns a copy of the generator whose field generators, and those of
+        any parents it creates, draw from ``rng``.  Unique fields start over
+        without any used values.  Plain callables such as ``g.now`` can't be
+        rebound and keep their values unseeded.
+        """
+        generator = super(ModelGenerator, self).with_rng(rng)
+        generator.generators = dict(
+            (key, util.with_rng(field_generator, rng))
+            for key, field_generator in self.generators.iteritems())
+        generator.unique_sources = dict(
+            (key, util.with_rng(source, rng))
+            for key, source in self.unique_sources.iteritems())
+        generator._make_unique()
+        return generator
 
     def __call__(self, commit=False):
         """
@@ -184,15 +531,177 @@ class ModelGenerator(g.Generator):
 
         return instance
 
+    def create_many(self, n, batch_size=500):
+        """
+        Creates ``n`` instances and saves them with ``bulk_create``.  Instances
+        are built and inserted in chunks of ``batch_size`` so that only one
+        chunk is held in memory at a time.  Parents for any
+        :class:`ForeignKeyGenerator` fields are bulk created first.
+
+        ``bulk_create`` does not set auto-increment primary keys, so they are
+        allocated up front from the current maximum.  This is not safe if
+        other connections are inserting into the same table concurrently.
+        Databases with sequences, such as PostgreSQL, have the table's
+        sequence reset afterwards so that rows saved later don't reuse the
+        allocated keys.  Returns the list of created instances.
+        """
+        instances = []
+        allocated = False
+
+        try:
+            for start in xrange(0, n, batch_size):
+                count = min(batch_size, n - start)
+                batch = self.build_many(count)
+                allocated = self._allocate_pks(batch) or allocated
+                self._assign_self_references(batch)
+                self.model._default_manager.bulk_create(batch, batch_size=batch_size)
+                for key in self._self_references():
+                    self.generators[key].add(batch)
+                instances.extend(batch)
+        finally:
+            if allocated:
+                self._reset_sequences()
+
+        return instances
+
+    def with_parent_pools(self, fan_out=10, existing=False):
+        """
+        Returns a copy of the generator whose :class:`ForeignKeyGenerator`
+        fields draw from a :class:`ParentPool` instead of creating a new
+        parent for every row, so that on average ``fan_out`` rows share each
+        parent.  If ``existing`` is set, rows already in the database are
+        reused too.  Parents get parent pools of their own, all the way up.
+        """
+        generator = copy.copy(self)
+        generator.generators = dict(self.generators)
+
+        for key, field_generator in self.generators.iteritems():
+            if isinstance(field_generator, ForeignKeyGenerator):
+                generator.generators[key] = ParentPool(
+                        field_generator.model,
+                        field_generator.with_parent_pools(fan_out, existing),
+                        fan_out=fan_out,
+                        existing=existing,
+                        )
+
+        return generator
+
+    def build_many(self, n):
+        """
+        Builds ``n`` unsaved instances.  Values are generated a column at a
+        time so generators with a batch ``generate_many`` path can use it.
+        :class:`ForeignKeyGenerator` parents are saved with
+        :meth:`create_many` so that the children can reference them.
+        Self-referential keys are left empty for :meth:`create_many` to fill
+        in once primary keys have been allocated.
+        """
+        columns = {}
+        collecting = stats.active
+
+        self_references = self._self_references()
+
+        for key, generator in self.generators.iteritems():
+            if key in self_references:
+                continue
+            start = stats.timer()
+            if isinstance(generator, ForeignKeyGenerator):
+                columns[key] = generator.create_many(n)
+            else:
+                columns[key] = util.generate_many(generator, n)
+            if collecting is not None:
+                collecting.record_call('{0}.{1}'.format(self.model.__name__, key),
+                        stats.timer() - start, n)
+
+        if not columns:
+            return [self.model() for i in xrange(n)]
+
+        keys = columns.keys()
+        rows = zip(*[columns[key] for key in keys])
+
+        return [self.model(**dict(zip(keys, row))) for row in rows]
+
+    def _allocate_pks(self, instances):
+        """
+        Gives ``instances`` without a primary key one, and returns whether
+        any needed one.
+        """
+        pk = self.model._meta.pk
+
+        if not isinstance(pk, models.AutoField):
+            return False
+
+        pending = [instance for instance in instances if instance.pk is None]
+
+        if not pending:
+            return False
+
+        current = self.model._default_manager.aggregate(
+                max_pk=models.Max(pk.name))['max_pk'] or 0
+
+        for i, instance in enumerate(pending, start=current + 1):
+            instance.pk = i
+
+        return True
+
+    def _reset_sequences(self):
+        """
+        Moves the primary key sequence of the model's table past the keys
+        allocated by :meth:`_allocate_pks`.
+        """
+        using = router.db_for_write(self.model)
+        connection = connections[using]
+        statements = connection.ops.sequence_reset_sql(no_style(), [self.model])
+
+        if statements:
+            cursor = connection.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            transaction.commit_unless_managed(using=using)
+
+    def _self_references(self):
+        return [
+            key for key, generator in self.generators.iteritems()
+            if isinstance(generator, CyclicForeignKeyGenerator) and
+            generator.model is self.model
+            ]
+
+    def _assign_self_references(self, batch):
+        """
+        Points the self-referential keys of each instance in ``batch`` at an
+        existing row, an earlier instance in the batch, or itself, so the
+        first rows of a self-referential table can be created.
+        """
+        rand = self.rng.random
+
+        for key in self._self_references():
+            pool = self.generators[key]
+            pool.load()
+            existing = pool.instances
+            attname = self.model._meta.get_field(key).attname
+
+            for i, instance in enumerate(batch):
+                j = int(rand() * (len(existing) + i + 1))
+                parent = existing[j] if j < len(existing) else batch[j - len(existing)]
+                setattr(instance, attname, parent.pk)
+
     def build_model_kwargs(self):
         """
         Builds a dictionary of field name goes to generated datum.  Exposed in
         case you need it for other purposes.
         """
         kwargs = {}
+        collecting = stats.active
 
+        if collecting is None:
+            for key, generator in self.generators.iteritems():
+                kwargs[key] = generator()
+            return kwargs
+
+        start = stats.timer()
+        name = self.model.__name__
         for key, generator in self.generators.iteritems():
-            kwargs[key] = generator()
+            kwargs[key] = stats.timed(collecting, '{0}.{1}'.format(name, key), generator)
+        collecting.record_call(name, stats.timer() - start)
 
         return kwargs
 
@@ -207,6 +716,124 @@ class FieldGenerator(g.Generator):
 
 class ForeignKeyGenerator(ModelGenerator, FieldGenerator):
     def __init__(self, field, *args, **kwargs):
+        self.field = field
         model = field.rel.to
 
         super(ForeignKeyGenerator, self).__init__(model, *args, **kwargs)
+
+
+class ParentPool(g.Generator):
+    """
+    Hands out saved instances of ``model`` to use as foreign key parents, so
+    that many children share each parent rather than every child getting a
+    brand new one.
+
+    The pool grows lazily: whenever fewer than one parent exists per
+    ``fan_out`` draws, the missing parents are bulk created with
+    ``generator``.  Each draw picks a parent from the pool at random.  If
+    ``existing`` is set, or there is no ``generator``, the pool starts with
+    the rows already in the database, loaded by primary key only.
+    ``instances`` seeds the pool with parents created elsewhere.
+    """
+    def __init__(self, model, generator=None, fan_out=10, existing=False,
+                 instances=None):
+        self.model = model
+        self.generator = generator
+        self.fan_out = fan_out
+        self.instances = list(instances or [])
+        self.drawn = 0
+        self.loaded = not existing and (
+            generator is not None or instances is not None)
+
+    def load(self):
+        """
+        Adds the rows already in the database to the pool, once.
+        """
+        if not self.loaded:
+            known = set(instance.pk for instance in self.instances)
+            self.instances.extend(
+                self.model(pk=pk)
+                for pk in self.model._default_manager.values_list('pk', flat=True)
+                if pk not in known)
+            self.loaded = True
+
+    def add(self, instances):
+        """
+        Adds saved ``instances`` to the pool.
+        """
+        self.instances.extend(instances)
+
+    def with_rng(self, rng):
+        generator = super(ParentPool, self).with_rng(rng)
+        generator.instances = list(self.instances)
+        generator.generator = util.with_rng(self.generator, rng)
+        return generator
+
+    def _reserve(self, n):
+        self.load()
+        self.drawn += n
+
+        if self.generator is not None and self.fan_out:
+            missing = int(math.ceil(self.drawn / float(self.fan_out))) - \
+                len(self.instances)
+            if missing > 0:
+                self.instances.extend(self.generator.create_many(missing))
+
+        if not self.instances:
+            raise ValueError('There are no {0} rows to use as parents.'.format(
+                self.model.__name__))
+
+    def __call__(self):
+        self._reserve(1)
+        return self.rng.choice(self.instances)
+
+    def generate_many(self, n):
+        self._reserve(n)
+        instances = self.instances
+        size = len(instances)
+        rand = self.rng.random
+        return [instances[int(rand() * size)] for i in xrange(n)]
+
+
+class CyclicForeignKeyGenerator(ParentPool, FieldGenerator):
+    """
+    Generator for a required foreign key that leads back to its own model,
+    such as a self-referential key.  Creating a new parent for it would never
+    end, so parents are drawn from the rows that already exist.
+    :meth:`ModelGenerator.create_many` also lets the rows of a
+    self-referential model point at rows earlier in the same batch.
+    """
+    def __init__(self, field):
+        self.field = field
+        super(CyclicForeignKeyGenerator, self).__init__(field.rel.to)
+
+
+def create_all(generators, batch_size=500):
+    """
+    Bulk creates the rows for several models.  ``generators`` is a list of
+    ``(ModelGenerator, n)`` pairs.  Models are created in
+    :func:`dependency_order`, and foreign keys to another listed model draw
+    from the rows created for it instead of creating new parents.  Returns a
+    dictionary of model goes to created instances.
+    """
+    by_model = dict((generator.model, (generator, n)) for generator, n in generators)
+    created = {}
+
+    for model in dependency_order([generator.model for generator, n in generators]):
+        generator, n = by_model[model]
+        generator = copy.copy(generator)
+        generator.generators = dict(generator.generators)
+
+        for key, field_generator in generator.generators.iteritems():
+            if isinstance(field_generator, ForeignKeyGenerator) and \
+                    field_generator.model in created:
+                generator.generators[key] = ParentPool(
+                        field_generator.model,
+                        instances=created[field_generator.model])
+
+        created[model] = generator.create_many(n, batch_size=batch_size)
+
+    return created
+
+
+FIELD_CLASS_GENERATORS[models.ForeignKey] = ForeignKeyGenerator
@@ -1,7 +1,19 @@
+from array import array
 from collections import defaultdict
+import bisect
+import hashlib
+import itertools
+import multiprocessing
+import os
+import os.path
 import random
 import re
-import os.path
+import struct
+import sys
+import tempfile
+import threading
+
+from perjury.exceptions import MarkovModelError
 
 
 def clean_punctuation(string):
@@ -14,31 +26,322 @@ def clean_punctuation(string):
     return re.sub(r' ([,\.\?;:!])(?: [,\.\?;:!])?', r'\1', string)
 
 
-class MarkovGenerator(object):
-    def __init__(self, corpus, token_size=2):
-        self.current = tuple()
+STATE_KEY_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def state_key(ids):
+    """
+    Hashes a sequence of token ids to a 64 bit integer.  Unlike :func:`hash`
+    this is stable across platforms, so keys can be stored in model files.
+    """
+    key = 0
+    for i in ids:
+        key = ((key * 1000003) ^ (i + 1)) & STATE_KEY_MASK
+    return key
+
+
+class MarkovModel(object):
+    """
+    Compact transition graph of a Markov chain over tokens.
+
+    Tokens are interned to integer ids in ``vocabulary`` and each state, the
+    ids of the preceding ``token_size`` tokens, is hashed with
+    :func:`state_key`.  ``states`` maps a state key to its index.  The
+    transitions of state ``i`` are ``successors[offsets[i]:offsets[i + 1]]``,
+    one entry per distinct successor, with the running total of their counts
+    in ``cumulative`` so that a successor can be drawn with :func:`bisect`.
+    The ``unigram_*`` arrays hold the overall token distribution, used when a
+    state has no recorded transitions.
+    """
+    def __init__(self, vocabulary, token_size, keys, offsets, successors,
+                 cumulative, unigram_ids, unigram_cumulative):
+        self.vocabulary = vocabulary
         self.token_size = token_size
+        self.keys = keys
+        self.states = dict(itertools.izip(keys, xrange(len(keys))))
+        self.offsets = offsets
+        self.successors = successors
+        self.cumulative = cumulative
+        self.unigram_ids = unigram_ids
+        self.unigram_cumulative = unigram_cumulative
 
-        self.tokens = self.tokenize(corpus)
-        self.graph = self.analyze(self.tokens)
+    @classmethod
+    def from_counts(cls, vocabulary, token_size, counts):
+        """
+        Builds a model from ``counts``, a mapping of state key goes to a
+        mapping of successor token id goes to count.
+        """
+        keys = []
+        offsets = array('I', [0])
+        successors = array('i')
+        cumulative = array('I')
+        unigram = defaultdict(int)
 
-    def analyze(self, tokens):
-        graph = defaultdict(list)
+        for key, transitions in counts.iteritems():
+            keys.append(key)
+            total = 0
+            for token_id, count in transitions.iteritems():
+                total += count
+                successors.append(token_id)
+                cumulative.append(total)
+                unigram[token_id] += count
+            offsets.append(len(successors))
+
+        unigram_ids = array('i')
+        unigram_cumulative = array('I')
+        total = 0
+        for token_id, count in unigram.iteritems():
+            total += count
+            unigram_ids.append(token_id)
+            unigram_cumulative.append(total)
+
+        return cls(vocabulary, token_size, keys, offsets, successors,
+                   cumulative, unigram_ids, unigram_cumulative)
+
+    def transitions(self, state):
+        """
+        Returns a dictionary of successor token goes to count for the state
+        made of the token ids ``state``.
+        """
+        try:
+            index = self.states[state_key(state)]
+        except KeyError:
+            return {}
+
+        result = {}
+        previous = 0
+        for i in xrange(self.offsets[index], self.offsets[index + 1]):
+            result[self.vocabulary[self.successors[i]]] = self.cumulative[i] - previous
+            previous = self.cumulative[i]
+        return result
+
+    def sample(self, state, rng=random):
+        """
+        Returns a random successor token id of the state made of the token ids
+        ``state``, drawn from ``rng``.
+        """
+        index = self.states.get(state_key(state))
+
+        if index is None:
+            ids, cumulative = self.unigram_ids, self.unigram_cumulative
+            low, high = 0, len(ids)
+        else:
+            ids, cumulative = self.successors, self.cumulative
+            low, high = self.offsets[index], self.offsets[index + 1]
+
+        # Running totals restart at every state, so the last one in the
+        # state's slice is its total count.
+        target = int(rng.random() * cumulative[high - 1])
+        return ids[bisect.bisect_right(cumulative, target, low, high)]
+
+
+class MarkovTrainer(object):
+    """
+    Builds a :class:`MarkovModel` incrementally, so that corpora too large to
+    hold in memory can be streamed through it::
+
+        trainer = MarkovTrainer(token_size=3)
+        with open('dump.txt') as f:
+            trainer.feed(f)
+        generator = trainer.generator()
+
+    Text is split into tokens on ``separator`` exactly as if all of it had
+    been joined into one string, even when a chunk ends part way through a
+    token.  Trainers built separately, for example over shards of a corpus in
+    worker processes, can be combined with :meth:`merge`.  The state is
+    reset at the start of each trainer, so transitions that span two shards
+    are not counted.
+    """
+    def __init__(self, token_size=2, separator=' '):
+        self.token_size = token_size
+        self.separator = separator
+        self.ids = {}
+        self.vocabulary = []
+        # State, as a tuple of token ids, goes to successor id goes to count.
+        self.counts = {}
+        self.state = ()
+        self.remainder = ''
+
+    def intern(self, token):
+        try:
+            return self.ids[token]
+        except KeyError:
+            token_id = self.ids[token] = len(self.vocabulary)
+            self.vocabulary.append(token)
+            return token_id
+
+    def feed_tokens(self, tokens):
+        """
+        Counts the transitions of an iterable of already split tokens.
+        """
+        counts = self.counts
+        intern = self.intern
+        token_size = self.token_size
+        state = self.state
+
+        for token in tokens:
+            token_id = intern(token)
+
+            try:
+                transitions = counts[state]
+            except KeyError:
+                transitions = counts[state] = defaultdict(int)
+            transitions[token_id] += 1
+
+            state = (state + (token_id,))[-token_size:]
+
+        self.state = state
+
+    def feed(self, chunks):
+        """
+        Counts the transitions in an iterable of text chunks, such as the
+        lines of a file.  The text after the last separator is held back
+        until more text or :meth:`finish` arrives.
+        """
+        separator = self.separator
+        for chunk in chunks:
+            tokens = (self.remainder + chunk).split(separator)
+            self.remainder = tokens.pop()
+            self.feed_tokens(tokens)
+
+    def feed_file(self, path, chunk_size=1024 * 1024):
+        """
+        Counts the transitions in the file at ``path``, read ``chunk_size``
+        bytes at a time.
+        """
+        with open(path) as f:
+            self.feed(iter(lambda: f.read(chunk_size), ''))
+
+    def finish(self):
+        """
+        Counts any held back text as the final token.
+        """
+        if self.remainder:
+            self.feed_tokens([self.remainder])
+            self.remainder = ''
+
+    def merge(self, other):
+        """
+        Adds the counts of another trainer with the same ``token_size`` to
+        this one.  Any text ``other`` is holding back is finished first.
+        """
+        if other.token_size != self.token_size:
+            raise ValueError('Cannot merge trainers with different token sizes.')
+
+        other.finish()
+        remap = [self.intern(token) for token in other.vocabulary]
+
+        for state, transitions in other.counts.iteritems():
+            state = tuple(remap[i] for i in state)
+            try:
+                merged = self.counts[state]
+            except KeyError:
+                merged = self.counts[state] = defaultdict(int)
+            for token_id, count in transitions.iteritems():
+                merged[remap[token_id]] += count
+
+    def model(self):
+        """
+        Returns a :class:`MarkovModel` of everything fed so far.
+        """
+        self.finish()
+        counts = dict(
+                (state_key(state), transitions)
+                for state, transitions in self.counts.iteritems())
+        return MarkovModel.from_counts(
+                list(self.vocabulary), self.token_size, counts)
+
+    def generator(self):
+        """
+        Returns a :class:`MarkovGenerator` of everything fed so far.
+        """
+        return MarkovGenerator.from_model(self.model())
+
+
+def _train_file(args):
+    path, token_size, separator = args
+    trainer = MarkovTrainer(token_size, separator)
+    trainer.feed_file(path)
+    trainer.finish()
+    return trainer
+
+
+def train_files(paths, token_size=2, separator=' ', processes=None):
+    """
+    Trains one :class:`MarkovTrainer` per file in a pool of ``processes``
+    worker processes and returns them merged into one.
+    """
+    pool = multiprocessing.Pool(processes)
+    try:
+        trainers = pool.map(
+                _train_file, [(path, token_size, separator) for path in paths])
+    finally:
+        pool.close()
+        pool.join()
+
+    trainer = MarkovTrainer(token_size, separator)
+    for other in trainers:
+        trainer.merge(other)
+    return trainer
+
+
+class MarkovGenerator(object):
+    """
+    Generates words and sentences from a Markov chain of the tokens in
+    ``corpus``.  Each thread walks the chain from a state of its own, so
+    threads can share a generator without locking.
+    """
+    rng = random
+
+    def __init__(self, corpus, token_size=2, rng=None):
+        self._local = threading.local()
+        self.token_size = token_size
+        if rng is not None:
+            self.rng = rng
 
-        for i, token in enumerate(tokens):
-            graph[tuple(tokens[i - self.token_size:i])].append(token)
+        self.model = self.analyze(self.tokenize(corpus))
 
-        return graph
+    @classmethod
+    def from_model(cls, model, rng=None):
+        """
+        Returns a generator for an already analyzed corpus, as loaded by
+        :func:`load_model`.
+        """
+        generator = cls.__new__(cls)
+        generator._local = threading.local()
+        generator.token_size = model.token_size
+        generator.model = model
+        if rng is not None:
+            generator.rng = rng
+        return generator
+
+    def analyze(self, tokens):
+        """
+        Returns a :class:`MarkovModel` of ``tokens``.  At the start of the
+        corpus the states are the shorter runs of tokens seen so far.
+        """
+        trainer = MarkovTrainer(self.token_size)
+        trainer.feed_tokens(tokens)
+        return trainer.model()
 
     def tokenize(self, corpus):
         return corpus.split(' ')
 
+    @property
+    def current(self):
+        return getattr(self._local, 'current', ())
+
+    @current.setter
+    def current(self, value):
+        self._local.current = value
+
     def word(self):
-        self.current = self.current[1:], random.choice(
-            self.graph.get(self.current, self.tokens)
-        )
+        local = self._local
+        current = getattr(local, 'current', ())
+        token_id = self.model.sample(current, self.rng)
+        local.current = (current + (token_id,))[-self.token_size:]
 
-        return self.current[-1]
+        return self.model.vocabulary[token_id]
 
     def sentence(self):
         current = None
@@ -51,7 +354,222 @@ class MarkovGenerator(object):
         return clean_punctuation(' '.join(words))
 
 
+# Compiled model files start with a fixed header, followed by the vocabulary
+# (token byte lengths then the concatenated token bytes) and the arrays of a
+# :class:`MarkovModel`.  State keys are stored as pairs of high and low 32 bit
+# words so that the format does not depend on the size of a C long.
+MODEL_MAGIC = b'PJMK'
+MODEL_VERSION = 2
+MODEL_HEADER = struct.Struct('<4sHHBB40sQQQQQ')
+
+
+def corpus_digest(corpus):
+    """
+    Returns the hex digest used to key compiled models to their corpus.
+    """
+    if isinstance(corpus, unicode):
+        corpus = corpus.encode('utf-8')
+    return hashlib.sha1(corpus).hexdigest()
+
+
+def save_model(generator, path, digest=''):
+    """
+    Writes the :class:`MarkovModel` of ``generator`` to ``path`` in the binary
+    format read by :func:`load_model`.  ``digest`` records which corpus the
+    model was built from.
+    """
+    model = generator.model
+    vocabulary = model.vocabulary
+
+    is_unicode = any(isinstance(token, unicode) for token in vocabulary)
+    if is_unicode:
+        vocabulary = [token.encode('utf-8') for token in vocabulary]
+    lengths = array('I', (len(token) for token in vocabulary))
+    blob = b''.join(vocabulary)
+
+    keys = array('I')
+    for key in model.keys:
+        keys.append(key >> 32)
+        keys.append(key & 0xFFFFFFFF)
+
+    header = MODEL_HEADER.pack(
+            MODEL_MAGIC,
+            MODEL_VERSION,
+            model.token_size,
+            is_unicode,
+            sys.byteorder == 'little',
+            digest.encode('ascii'),
+            len(vocabulary),
+            len(blob),
+            len(model.keys),
+            len(model.successors),
+            len(model.unigram_ids),
+            )
+
+    # Write to a temporary file first so that a reader never sees a partially
+    # written model.
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            lengths.tofile(f)
+            f.write(blob)
+            keys.tofile(f)
+            model.offsets.tofile(f)
+            model.successors.tofile(f)
+            model.cumulative.tofile(f)
+            model.unigram_ids.tofile(f)
+            model.unigram_cumulative.tofile(f)
+        os.rename(temp_path, path)
+    except:
+        os.remove(temp_path)
+        raise
+
+
+def read_model_header(f):
+    data = f.read(MODEL_HEADER.size)
+    if len(data) != MODEL_HEADER.size:
+        raise MarkovModelError('Truncated model header.')
+
+    header = MODEL_HEADER.unpack(data)
+    if header[0] != MODEL_MAGIC:
+        raise MarkovModelError('Not a compiled Markov model.')
+    if header[1] != MODEL_VERSION:
+        raise MarkovModelError('Unsupported model version {0}.'.format(header[1]))
+
+    return header
+
+
+def _read_array(f, typecode, count, swap):
+    values = array(typecode)
+    try:
+        values.fromfile(f, count)
+    except EOFError:
+        raise MarkovModelError('Truncated model file.')
+    if swap:
+        values.byteswap()
+    return values
+
+
+def load_model(path, digest=None, token_size=None):
+    """
+    Loads a generator saved with :func:`save_model`.  If ``digest`` or
+    ``token_size`` are given and do not match the model,
+    :class:`MarkovModelError` is raised.
+    """
+    with open(path, 'rb') as f:
+        (_, _, model_token_size, is_unicode, little_endian, model_digest,
+         vocabulary_size, blob_size, state_count, transition_count,
+         unigram_count) = read_model_header(f)
+
+        model_digest = model_digest.rstrip(b'\x00').decode('ascii')
+        if digest is not None and digest != model_digest:
+            raise MarkovModelError('Model was built from a different corpus.')
+        if token_size is not None and token_size != model_token_size:
+            raise MarkovModelError('Model was built with a different token size.')
+
+        swap = little_endian != (sys.byteorder == 'little')
+
+        lengths = _read_array(f, 'I', vocabulary_size, swap)
+        blob = f.read(blob_size)
+        if len(blob) != blob_size:
+            raise MarkovModelError('Truncated model file.')
+        keys = _read_array(f, 'I', state_count * 2, swap)
+        offsets = _read_array(f, 'I', state_count + 1, swap)
+        successors = _read_array(f, 'i', transition_count, swap)
+        cumulative = _read_array(f, 'I', transition_count, swap)
+        unigram_ids = _read_array(f, 'i', unigram_count, swap)
+        unigram_cumulative = _read_array(f, 'I', unigram_count, swap)
+
+    vocabulary = []
+    start = 0
+    for length in lengths:
+        token = blob[start:start + length]
+        vocabulary.append(token.decode('utf-8') if is_unicode else token)
+        start += length
+
+    keys = [(keys[i] << 32) | keys[i + 1] for i in xrange(0, len(keys), 2)]
+
+    return MarkovGenerator.from_model(MarkovModel(
+            vocabulary, model_token_size, keys, offsets, successors,
+            cumulative, unigram_ids, unigram_cumulative))
+
+
+def default_cache_dir():
+    """
+    Returns the directory compiled models are cached in, taken from the
+    ``PERJURY_CACHE_DIR`` environment variable or ``~/.cache/perjury``.
+    """
+    return os.environ.get('PERJURY_CACHE_DIR') or \
+        os.path.join(os.path.expanduser('~'), '.cache', 'perjury')
+
+
+def load_cached(corpus, token_size=2, cache_dir=None):
+    """
+    Returns a :class:`MarkovGenerator` for ``corpus``, loading the compiled
+    model from ``cache_dir`` if the same corpus has been analyzed with the same
+    ``token_size`` before.  Otherwise the corpus is analyzed and the model is
+    saved for next time.  Failing to write the cache is not an error.
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+
+    digest = corpus_digest(corpus)
+    path = os.path.join(cache_dir, 'markov-{0}-{1}.model'.format(digest, token_size))
+
+    try:
+        return load_model(path, digest=digest, token_size=token_size)
+    except (IOError, MarkovModelError):
+        pass
+
+    generator = MarkovGenerator(corpus, token_size)
+
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        save_model(generator, path, digest=digest)
+    except (IOError, OSError):
+        pass
+
+    return generator
+
+
+class LazyMarkovGenerator(object):
+    """
+    Stands in for a :class:`MarkovGenerator` trained on the corpus at ``path``.
+    The corpus is read and analyzed the first time the generator is used
+    rather than at import time.  If ``cache_dir`` is given, the compiled
+    model is cached there with :func:`load_cached`.
+    """
+    def __init__(self, path, token_size=2, cache_dir=None):
+        self.path = path
+        self.token_size = token_size
+        self.cache_dir = cache_dir
+        self._generator = None
+        self._lock = threading.Lock()
+
+    @property
+    def generator(self):
+        if self._generator is None:
+            # Threads that get here at once wait for a single load.
+            with self._lock:
+                if self._generator is None:
+                    self._generator = self._load()
+        return self._generator
+
+    def _load(self):
+        with open(self.path) as f:
+            corpus = f.read()
+
+        if self.cache_dir is None:
+            return MarkovGenerator(corpus, self.token_size)
+        return load_cached(corpus, self.token_size, cache_dir=self.cache_dir)
+
+    def __getattr__(self, name):
+        return getattr(self.generator, name)
+
+
 shakespeare_path = os.path.join(os.path.dirname(__file__), '..', 'content', 'shakespeare.txt')
 
-with open(shakespeare_path) as f:
-    shakespeare = MarkovGenerator(f.read(), 7)
+shakespeare = LazyMarkovGenerator(shakespeare_path, 7, cache_dir=default_cache_dir())
@@ -0,0 +1,160 @@
+"""
+Composite generators built from a format string::
+
+    from perjury.generators.template import Template
+
+    email = Template('{first_name}.{last_name}{int:2}@{domain}')
+
+The template is parsed once.  Each ``{name}`` field is bound to a generator
+when the template is created and the values are put together with a single
+``str.format`` call, so a template costs little more than its parts.  Batch
+generation draws each field a column at a time using the fields'
+``generate_many``.
+
+Fields are looked up in the keyword arguments given to :class:`Template`
+and then in :mod:`perjury.generators`.  A field may also be one of:
+
+- ``{int:N}``: an ``N`` digit number, zero padded.
+- ``{int:LOW-HIGH}``: a number between ``LOW`` and ``HIGH`` inclusive.
+
+Any other format spec or conversion is applied to the value as
+``str.format`` would.  Literal braces are written ``{{`` and ``}}``.
+"""
+import itertools
+import re
+import string
+
+from perjury import util
+from perjury.generators.base import Generator
+from perjury.stats import instrumented
+
+
+INT_DIGITS = re.compile(r'^(\d+)$')
+INT_RANGE = re.compile(r'^(-?\d+)-(-?\d+)$')
+
+
+def cardinality(fn):
+    """
+    Returns the number of distinct values ``fn`` can generate, or ``None`` if
+    that isn't known.
+    """
+    try:
+        return fn.cardinality
+    except AttributeError:
+        pass
+
+    try:
+        values = fn.all_values()
+    except AttributeError:
+        return None
+
+    if isinstance(values, xrange):
+        return len(values)
+    return len(set(values))
+
+
+def _escape(literal):
+    return literal.replace('{', '{{').replace('}', '}}')
+
+
+@instrumented
+class Template(Generator):
+    """
+    Formats values from several generators into ``template``.  ``generators``
+    are the generators for fields by name, on top of those in
+    :mod:`perjury.generators`.
+    """
+    def __init__(self, template, **generators):
+        from perjury.generators import IntegerGenerator
+
+        self.template = template
+        self.samplers = []
+        self.names = []
+        parts = []
+
+        for literal, name, spec, conversion in string.Formatter().parse(template):
+            parts.append(_escape(literal))
+            if name is None:
+                continue
+
+            field = '{{{0}'.format(len(self.samplers))
+            if conversion:
+                field += '!' + conversion
+
+            if name == 'int':
+                digits = INT_DIGITS.match(spec or '')
+                bounds = INT_RANGE.match(spec or '')
+                if digits:
+                    width = int(digits.group(1))
+                    sampler = IntegerGenerator(0, 10 ** width - 1)
+                    spec = '0{0}d'.format(width)
+                elif bounds:
+                    sampler = IntegerGenerator(
+                            int(bounds.group(1)), int(bounds.group(2)))
+                    spec = ''
+                else:
+                    raise ValueError('Invalid int field: {{int:{0}}}'.format(spec))
+            else:
+                sampler = self.lookup(name, generators)
+
+            if spec:
+                field += ':' + spec
+            parts.append(field + '}')
+            self.samplers.append(sampler)
+            self.names.append(name)
+
+        self.format = ''.join(parts).format
+
+    def lookup(self, name, generators):
+        if name in generators:
+            return generators[name]
+
+        from perjury import generators as g
+        generator = getattr(g, name, None)
+        if generator is None or not callable(generator) or isinstance(generator, type):
+            raise ValueError('No generator named {0!r} in {1!r}'.format(
+                name, self.template))
+        return generator
+
+    def __call__(self):
+        return self.format(*[sampler() for sampler in self.samplers])
+
+    def generate_many(self, n):
+        fmt = self.format
+        if not self.samplers:
+            return [fmt() for i in xrange(n)]
+        columns = [util.generate_many(sampler, n) for sampler in self.samplers]
+        return [fmt(*row) for row in itertools.izip(*columns)]
+
+    def with_rng(self, rng):
+        generator = super(Template, self).with_rng(rng)
+        generator.samplers = [util.with_rng(sampler, rng) for sampler in self.samplers]
+        return generator
+
+    @property
+    def cardinality(self):
+        """
+        The number of combinations of field values, which is the most distinct
+        values the template can generate, or ``None`` if any field's number
+        of values isn't known.  Check it before asking for that many unique
+        values.
+        """
+        total = 1
+        for sampler in self.samplers:
+            count = cardinality(sampler)
+            if count is None:
+                return None
+            total *= count
+        return total
+
+    @property
+    def all_values(self):
+        """
+        Returns every combination of field values formatted, for
+        :func:`perjury.util.unique` to enumerate.  Only available when every
+        field's values are, otherwise the AttributeError says it isn't.
+        """
+        sources = [sampler.all_values for sampler in self.samplers]
+        fmt = self.format
+        return lambda: [fmt(*row) for row in itertools.product(
+            *[values() for values in sources])]
@@ -0,0 +1,130 @@
+"""
+Generates values in several processes at once.
+
+Each shard of the work runs in a worker process with the global
+:mod:`random` module seeded from a seed derived from the run's ``seed`` and
+the shard number, so a run can be reproduced exactly, unique values
+included.  Generators can't be sent to other processes, so workers are given
+a ``factory``, a picklable function that builds the generator::
+
+    from perjury.generators.django_models import ModelGenerator
+    from perjury.parallel import generate_parallel
+
+    def user_kwargs():
+        return ModelGenerator(User).build_model_kwargs
+
+    rows = generate_parallel(user_kwargs, 1000000, seed=42)
+
+Rather than sending every value back to the parent process, a ``handler`` can
+consume each chunk of values in the worker, for example writing them to the
+database or to a file of its own::
+
+    def save_users(shard, rows):
+        User.objects.bulk_create([User(**kwargs) for kwargs in rows])
+
+    generate_parallel(user_kwargs, 1000000, seed=42, handler=save_users)
+"""
+import multiprocessing
+import random
+
+from perjury import util
+from perjury.util import derive_seed
+from perjury.seen import ShardSet
+
+
+def split(n, shards):
+    """
+    Returns the number of values each of ``shards`` shards generates so that
+    they add up to ``n``.
+    """
+    size, extra = divmod(n, shards)
+    return [size + 1 if shard < extra else size for shard in xrange(shards)]
+
+
+class ShardSeen(object):
+    """
+    Factory for the :func:`perjury.util.unique` seen stores of shard
+    ``shard`` of ``shards``.  Each store is a :class:`~perjury.seen.ShardSet`,
+    which only accepts the keys belonging to its shard, so every generator's
+    values are unique across all of the shards without the workers having
+    to talk to each other.
+    """
+    # Tells :func:`perjury.generators.django_models.unique_generator` that
+    # values must go through the store to be unique.
+    shared = True
+
+    def __init__(self, shard, shards):
+        self.shard = shard
+        self.shards = shards
+
+    def __call__(self):
+        return ShardSet(self.shard, self.shards)
+
+
+def _run_shard(args):
+    factory, shard, shards, count, seed, shared_unique, handler, chunk_size = args
+
+    random.seed(derive_seed(seed, shard))
+    if shared_unique:
+        util.default_seen = ShardSeen(shard, shards)
+
+    generator = factory()
+
+    if handler is None:
+        return util.generate_many(generator, count)
+
+    for start in xrange(0, count, chunk_size):
+        handler(shard, util.generate_many(generator, min(chunk_size, count - start)))
+
+
+def generate_parallel(factory, n, seed=None, processes=None, shards=None,
+                      handler=None, chunk_size=10000, shared_unique=True):
+    """
+    Generates ``n`` values from the generator returned by ``factory`` across
+    a pool of ``processes`` worker processes, split into ``shards`` shards
+    (one per process by default).
+
+    If ``handler`` is ``None`` the values are returned in one list, in shard
+    order.  Otherwise ``handler(shard, values)`` is called in the worker for
+    every ``chunk_size`` values and nothing is returned.  ``factory`` and
+    ``handler`` must be picklable, which means defined at the top level of a
+    module.
+
+    When ``shared_unique`` is set, every :func:`perjury.util.unique`
+    generator that ``factory`` builds without an explicit ``seen`` store
+    only returns the values belonging to its shard, by a hash of the value,
+    using a :class:`ShardSeen` store.  Uniqueness then holds across shards
+    while each shard's values still only depend on its seed, so the run
+    stays reproducible.  This includes the unique fields of a
+    :class:`~perjury.generators.django_models.ModelGenerator` that
+    ``factory`` builds.  Other generators that sample without replacement,
+    such as :class:`perjury.generators.UniqueChoice`, are only unique within
+    their own shard.
+
+    Each shard has to draw about ``shards`` values for every unique value it
+    returns, and a finite set of values is split into ``shards`` parts of
+    roughly equal size, one of which a shard can run out of before the
+    others.  Unset ``shared_unique`` when values only need to be unique
+    within a shard.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if shards is None:
+        shards = processes
+
+    tasks = [
+        (factory, shard, shards, count, seed, shared_unique, handler, chunk_size)
+        for shard, count in enumerate(split(n, shards))
+        ]
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        results = pool.map(_run_shard, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+    if handler is None:
+        return [value for values in results for value in values]
@@ -0,0 +1,180 @@
+"""
+Generates batches of values in the background and writes them to several
+sinks at once.
+
+A sink is a function that takes a list of values, or an object with a
+``write_chunk`` method such as the writers in :mod:`perjury.export`.  If it
+has a ``close`` method that is called once the last batch is written::
+
+    from perjury.export import CSVWriter, JSONLinesWriter
+    from perjury.pipeline import Pipeline
+
+    generator = ModelGenerator(MyModel).build_model_kwargs
+    pipeline = Pipeline(generator, [
+        CSVWriter(open('rows.csv', 'wb')),
+        JSONLinesWriter(open('rows.jsonl', 'wb')),
+        lambda rows: MyModel.objects.bulk_create(
+            [MyModel(**kwargs) for kwargs in rows]),
+        ])
+    pipeline.run(1000000)
+
+Every sink is written to by a thread of its own while the next batch is
+generated.  At most ``max_pending`` batches wait for each sink, so a slow
+sink holds generation back rather than batches piling up in memory.  If a
+sink raises, generation stops and the exception is raised by
+:meth:`Pipeline.run`.
+
+:func:`background_batches` is the same idea for a single consumer: batches
+are generated in a thread while the caller works through the previous ones.
+"""
+import Queue
+import sys
+import threading
+
+from perjury import util
+
+
+# Put on a queue after the last batch.
+_DONE = object()
+
+
+def batches(fn, batch_size=1000, n=None):
+    """
+    Yields lists of ``batch_size`` values from ``fn``, until ``n`` values
+    have been generated, or forever if ``n`` is ``None``.
+    """
+    remaining = n
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        yield util.generate_many(fn, size)
+        if remaining is not None:
+            remaining -= size
+
+
+def background_batches(fn, batch_size=1000, n=None, max_pending=4):
+    """
+    Like :func:`batches`, but the batches are generated in a background
+    thread, up to ``max_pending`` ahead of the caller.  Exceptions raised
+    while generating are raised by the iterator.
+    """
+    queue = Queue.Queue(max_pending)
+    stopped = threading.Event()
+    errors = []
+
+    def produce():
+        try:
+            for batch in batches(fn, batch_size, n):
+                if not _put(queue, batch, stopped):
+                    return
+        except Exception:
+            errors.append(sys.exc_info())
+        _put(queue, _DONE, stopped)
+
+    thread = threading.Thread(target=produce)
+    thread.daemon = True
+    thread.start()
+
+    try:
+        while True:
+            batch = queue.get()
+            if batch is _DONE:
+                break
+            yield batch
+    finally:
+        stopped.set()
+        thread.join()
+
+    if errors:
+        raise errors[0][0], errors[0][1], errors[0][2]
+
+
+def _put(queue, item, stopped, poll=0.05):
+    """
+    Puts ``item`` on ``queue``, waiting for room unless ``stopped`` is set.
+    Returns whether it was put.
+    """
+    while not stopped.is_set():
+        try:
+            queue.put(item, timeout=poll)
+            return True
+        except Queue.Full:
+            pass
+    return False
+
+
+class Pipeline(object):
+    """
+    Writes batches of ``batch_size`` values from ``fn`` to each of
+    ``sinks``, as described above.
+    """
+    def __init__(self, fn, sinks, batch_size=1000, max_pending=4):
+        self.fn = fn
+        self.sinks = list(sinks)
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.stopped = threading.Event()
+
+    def stop(self):
+        """
+        Stops a running pipeline after the batch being generated, for
+        example to end a pipeline run without ``n`` from another thread.
+        """
+        self.stopped.set()
+
+    def _write(self, sink, queue, errors):
+        write = getattr(sink, 'write_chunk', sink)
+        while True:
+            batch = queue.get()
+            if batch is _DONE:
+                break
+            elif errors:
+                # Keep taking batches so the producer isn't left waiting.
+                continue
+            try:
+                write(batch)
+            except Exception:
+                errors.append(sys.exc_info())
+                self.stopped.set()
+
+        if not errors and hasattr(sink, 'close'):
+            try:
+                sink.close()
+            except Exception:
+                errors.append(sys.exc_info())
+
+    def run(self, n=None):
+        """
+        Generates ``n`` values, or values until :meth:`stop` is called if
+        ``n`` is ``None``, and writes them to every sink.  Returns once every
+        sink has written every batch, with the number of values generated.
+        """
+        self.stopped.clear()
+        errors = []
+        queues = [Queue.Queue(self.max_pending) for sink in self.sinks]
+        threads = [
+            threading.Thread(target=self._write, args=(sink, queue, errors))
+            for sink, queue in zip(self.sinks, queues)
+            ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        count = 0
+        try:
+            for batch in batches(self.fn, self.batch_size, n):
+                if self.stopped.is_set():
+                    break
+                # Writers take every batch even after a sink fails, so this
+                # only waits while a sink is behind.
+                for queue in queues:
+                    queue.put(batch)
+                count += len(batch)
+        finally:
+            for queue in queues:
+                queue.put(_DONE)
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0][0], errors[0][1], errors[0][2]
+        return count
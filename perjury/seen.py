@@ -0,0 +1,341 @@
+"""
+Stores for the keys that :func:`perjury.util.unique` has already returned.
+
+Any object that supports ``key in seen`` and ``seen.add(key)`` can be used,
+the builtin :class:`set` being the default.  The stores here trade exactness
+or speed for memory, persist keys so that several processes can share them,
+or split the keys between processes so that they needn't::
+
+    from perjury import util
+    from perjury.seen import BloomFilter
+
+    unique_email = util.unique(g.email, seen=BloomFilter(capacity=50000000))
+
+Keys are hashed from their byte representation: ``str`` is used as is,
+``unicode`` is encoded as UTF-8 and anything else is passed through
+``repr``.
+"""
+import binascii
+import hashlib
+import math
+import sqlite3
+import struct
+import threading
+
+
+def key_to_bytes(key):
+    if isinstance(key, str):
+        return key
+    elif isinstance(key, unicode):
+        return key.encode('utf-8')
+    return repr(key)
+
+
+def key_digest(key):
+    return hashlib.md5(key_to_bytes(key)).digest()
+
+
+class DigestSet(object):
+    """
+    Exact-enough set that stores a fixed width digest of each key in an open
+    addressing table backed by a single :class:`bytearray`.  Memory is
+    ``digest_size`` bytes per slot rather than a full Python object per key.
+    Two distinct keys are only confused if their digests collide, which for
+    the default 8 bytes is vanishingly unlikely.
+    """
+    max_load = 0.6
+
+    def __init__(self, digest_size=8, capacity=1024):
+        if not 1 <= digest_size <= 16:
+            raise ValueError('digest_size must be between 1 and 16 bytes.')
+
+        self.digest_size = digest_size
+        self.empty = b'\x00' * digest_size
+        self.count = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        slots = 1
+        while slots < capacity / self.max_load:
+            slots *= 2
+
+        self.slots = slots
+        self.mask = slots - 1
+        self.table = bytearray(slots * self.digest_size)
+
+    def _fingerprint(self, key):
+        fingerprint = key_digest(key)[:self.digest_size]
+        # An all zero fingerprint would be indistinguishable from an empty
+        # slot.
+        if fingerprint == self.empty:
+            fingerprint = fingerprint[:-1] + b'\x01'
+        return fingerprint
+
+    def _index(self, fingerprint):
+        # The slot is derived from the fingerprint alone so that the table
+        # can be rebuilt when it grows without access to the original keys.
+        return int(binascii.hexlify(fingerprint), 16) & self.mask
+
+    def _find(self, index, fingerprint):
+        """
+        Returns the slot holding ``fingerprint`` or the first empty slot in
+        its probe sequence.
+        """
+        table = self.table
+        size = self.digest_size
+        while True:
+            offset = index * size
+            current = bytes(table[offset:offset + size])
+            if current == fingerprint or current == self.empty:
+                return offset, current == fingerprint
+            index = (index + 1) & self.mask
+
+    def __contains__(self, key):
+        fingerprint = self._fingerprint(key)
+        return self._find(self._index(fingerprint), fingerprint)[1]
+
+    def __len__(self):
+        return self.count
+
+    def add(self, key):
+        fingerprint = self._fingerprint(key)
+        offset, found = self._find(self._index(fingerprint), fingerprint)
+        if found:
+            return
+
+        self.table[offset:offset + self.digest_size] = fingerprint
+        self.count += 1
+
+        if self.count > self.slots * self.max_load:
+            self._grow()
+
+    def _grow(self):
+        old_table = self.table
+        size = self.digest_size
+        self._allocate(self.slots)
+        for offset in xrange(0, len(old_table), size):
+            fingerprint = bytes(old_table[offset:offset + size])
+            if fingerprint != self.empty:
+                offset, _ = self._find(self._index(fingerprint), fingerprint)
+                self.table[offset:offset + size] = fingerprint
+
+
+class BloomFilter(object):
+    """
+    Probabilistic set sized for ``capacity`` keys with a false positive rate
+    of ``error_rate``.  Keys are never forgotten, so a unique generator
+    backed by a :class:`BloomFilter` never repeats a value, but it may
+    occasionally reject a value that was never returned.
+    """
+    def __init__(self, capacity, error_rate=0.001):
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate must be between 0 and 1.')
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits = int(math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.bits = max(self.bits, 8)
+        self.hashes = max(1, int(round(
+            self.bits / float(capacity) * math.log(2))))
+        self.array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        # Double hashing: the i-th position is h1 + i * h2.
+        h1, h2 = struct.unpack('<QQ', key_digest(key))
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in xrange(self.hashes)]
+
+    def __contains__(self, key):
+        array = self.array
+        for position in self._positions(key):
+            if not array[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def add(self, key):
+        array = self.array
+        for position in self._positions(key):
+            array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+
+class SqliteSet(object):
+    """
+    Set backed by a table in an SQLite database at ``path``.  Keys survive
+    the process, so several processes pointed at the same file share one set
+    of seen values.  :meth:`add_new` checks and inserts a key in one
+    statement, so it is safe for several processes to use at once.  Threads
+    may share a :class:`SqliteSet` too, taking turns to use its connection.
+
+    Every key is written in a transaction of its own.  If ``durable`` is
+    unset, the database uses write-ahead logging and doesn't wait for writes
+    to reach the disk, which makes adding keys many times faster but may
+    lose keys if the machine crashes.  That suits a temporary store.
+    """
+    def __init__(self, path, table='perjury_seen', timeout=60, durable=True):
+        self.path = path
+        self.table = table
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=timeout,
+                isolation_level=None, check_same_thread=False)
+        if not durable:
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=OFF')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS {0} (key BLOB PRIMARY KEY)'.format(table))
+
+    def __contains__(self, key):
+        with self.lock:
+            cursor = self.connection.execute(
+                    'SELECT 1 FROM {0} WHERE key = ?'.format(self.table),
+                    (buffer(key_to_bytes(key)),))
+            return cursor.fetchone() is not None
+
+    def __len__(self):
+        with self.lock:
+            cursor = self.connection.execute(
+                    'SELECT COUNT(*) FROM {0}'.format(self.table))
+            return cursor.fetchone()[0]
+
+    def add(self, key):
+        self.add_new(key)
+
+    def add_new(self, key):
+        """
+        Adds ``key`` and returns whether it was not already present.
+        """
+        with self.lock:
+            cursor = self.connection.execute(
+                    'INSERT OR IGNORE INTO {0} (key) VALUES (?)'.format(self.table),
+                    (buffer(key_to_bytes(key)),))
+            return cursor.rowcount == 1
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class ShardSet(object):
+    """
+    Store for shard ``shard`` of ``shards`` workers that generate unique
+    values together without sharing a store.  Every key belongs to one
+    shard, picked by its digest, and keys belonging to other shards count as
+    already seen, so no two shards return the same key.  Unlike with a
+    shared store, which values a shard returns only depends on what it
+    draws, not on what the other shards are doing.  Keys of its own are kept
+    in ``seen``, a new :class:`set` by default.
+
+    Only :attr:`share` of the keys drawn are accepted, so a shard draws
+    about ``shards`` values for every one it returns.
+    :func:`perjury.util.unique` allows for this in its number of tries.
+    """
+    def __init__(self, shard, shards, seen=None):
+        if not 0 <= shard < shards:
+            raise ValueError('shard must be between 0 and shards - 1.')
+
+        self.shard = shard
+        self.shards = shards
+        self.share = 1.0 / shards
+        self.seen = set() if seen is None else seen
+
+    def owns(self, key):
+        """
+        Returns whether ``key`` belongs to this shard.
+        """
+        return struct.unpack('<Q', key_digest(key)[:8])[0] % self.shards == self.shard
+
+    def __contains__(self, key):
+        return not self.owns(key) or key in self.seen
+
+    def __len__(self):
+        return len(self.seen)
+
+    def add(self, key):
+        self.add_new(key)
+
+    def add_new(self, key):
+        """
+        Adds ``key`` and returns whether it belongs to this shard and was not
+        already present.
+        """
+        if not self.owns(key) or key in self.seen:
+            return False
+        self.seen.add(key)
+        return True
+
+
+class StripedSet(object):
+    """
+    Set that is safe to share between threads.  Keys are spread over
+    ``stripes`` stores made by ``factory``, each with a lock of its own, so
+    threads only wait for each other when their keys land on the same
+    stripe.  :meth:`add_new` checks and inserts a key atomically.
+    """
+    def __init__(self, stripes=16, factory=set):
+        self.stripes = [factory() for i in xrange(stripes)]
+        self.locks = [threading.Lock() for i in xrange(stripes)]
+        self.share = getattr(self.stripes[0], 'share', 1.0)
+
+    def _stripe(self, key):
+        return hash(key) % len(self.stripes)
+
+    def __contains__(self, key):
+        i = self._stripe(key)
+        with self.locks[i]:
+            return key in self.stripes[i]
+
+    def __len__(self):
+        return sum(len(stripe) for stripe in self.stripes)
+
+    def add(self, key):
+        self.add_new(key)
+
+    def add_new(self, key):
+        """
+        Adds ``key`` and returns whether it was not already present.
+        """
+        i = self._stripe(key)
+        stripe = self.stripes[i]
+        with self.locks[i]:
+            if key in stripe:
+                return False
+            stripe.add(key)
+            return True
+
+
+class LockedSet(object):
+    """
+    Makes the store ``seen`` safe to share between threads by holding a
+    single lock while it is used.  Prefer :class:`StripedSet` for stores
+    that can be split.
+    """
+    def __init__(self, seen):
+        self.seen = seen
+        self.lock = threading.Lock()
+        self.share = getattr(seen, 'share', 1.0)
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.seen
+
+    def __len__(self):
+        with self.lock:
+            return len(self.seen)
+
+    def add(self, key):
+        self.add_new(key)
+
+    def add_new(self, key):
+        """
+        Adds ``key`` and returns whether it was not already present.
+        """
+        with self.lock:
+            if key in self.seen:
+                return False
+            self.seen.add(key)
+            return True
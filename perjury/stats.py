@@ -0,0 +1,224 @@
+"""
+Opt-in instrumentation of generators.
+
+Nothing is recorded unless a :class:`Stats` is collecting, so instrumented
+code only pays for checking :data:`active` when it is switched off.  The
+built-in generators are instrumented, and so are any generator classes
+decorated with :func:`instrumented`, whose methods are only wrapped while
+collecting::
+
+    from perjury import stats
+
+    with stats.collect() as collected:
+        ModelGenerator(MyModel).create_many(10000)
+
+    print collected.report()
+
+Generators are recorded under their ``stats_name`` attribute if they have
+one, and otherwise their class or function name.  The generators in
+:mod:`perjury.generators`, such as ``email``, have their own names as their
+``stats_name``.  :class:`ModelGenerator`
+records each field as ``Model.field``.  Recorded are:
+
+- the number of values generated by each generator and the time taken,
+  including the time taken by any generators it calls,
+- the number of retries :func:`perjury.util.unique` needed to find an unseen
+  value, and
+- the number of times it gave up with a
+  :class:`~perjury.exceptions.UniqueValueTimeoutError`.
+"""
+import contextlib
+import time
+import types
+
+
+# The :class:`Stats` currently collecting, or ``None``.
+active = None
+
+# The classes decorated with :func:`instrumented`.
+_instrumented_classes = []
+
+# (class, name, method) for every method replaced by a recording wrapper
+# while collecting, to be put back afterwards.
+_installed = []
+
+INSTRUMENTED_METHODS = ('__call__', 'generate_many')
+
+timer = time.time
+
+
+def name_of(fn):
+    """
+    Returns the name to record ``fn`` under.
+    """
+    if isinstance(fn, types.MethodType) and fn.__self__ is not None:
+        fn = fn.__self__
+    name = getattr(fn, 'stats_name', None)
+    if name is not None:
+        return name
+    name = getattr(fn, '__name__', None)
+    if name is not None and name != '<lambda>':
+        return name
+    return type(fn).__name__
+
+
+class GeneratorStats(object):
+    """
+    What has been recorded for a single generator.
+    """
+    __slots__ = ('name', 'calls', 'values', 'time', 'retries', 'timeouts')
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.values = 0
+        self.time = 0.0
+        self.retries = 0
+        self.timeouts = 0
+
+    @property
+    def timeout_rate(self):
+        """
+        The fraction of calls that raised a unique value timeout.
+        """
+        return self.timeouts / float(self.calls) if self.calls else 0.0
+
+    def __repr__(self):
+        return ('<GeneratorStats {0}: {1} values in {2} calls, {3:.6f}s, '
+                '{4} retries, {5} timeouts>').format(self.name, self.values,
+                        self.calls, self.time, self.retries, self.timeouts)
+
+
+class Stats(object):
+    """
+    Statistics per generator name, keyed by name in :attr:`generators`.
+    """
+    def __init__(self):
+        self.generators = {}
+
+    def __getitem__(self, name):
+        try:
+            return self.generators[name]
+        except KeyError:
+            stats = self.generators[name] = GeneratorStats(name)
+            return stats
+
+    def __contains__(self, name):
+        return name in self.generators
+
+    def record_call(self, name, elapsed, values=1):
+        stats = self[name]
+        stats.calls += 1
+        stats.values += values
+        stats.time += elapsed
+
+    def record_retries(self, name, retries):
+        self[name].retries += retries
+
+    def record_timeout(self, name):
+        stats = self[name]
+        stats.calls += 1
+        stats.timeouts += 1
+
+    def reset(self):
+        self.generators.clear()
+
+    def report(self):
+        """
+        Returns a table of the recorded statistics, slowest generator first.
+        """
+        rows = sorted(self.generators.values(), key=lambda s: s.time, reverse=True)
+        lines = ['{0:40} {1:>10} {2:>10} {3:>8} {4:>8}'.format(
+            'generator', 'values', 'seconds', 'retries', 'timeouts')]
+        for s in rows:
+            lines.append('{0:40} {1:>10} {2:>10.4f} {3:>8} {4:>8}'.format(
+                s.name, s.values, s.time, s.retries, s.timeouts))
+        return '\n'.join(lines)
+
+
+def timed(stats, name, fn, *args):
+    """
+    Returns ``fn(*args)``, recording the call under ``name`` in ``stats``.
+    """
+    start = timer()
+    value = fn(*args)
+    stats.record_call(name, timer() - start)
+    return value
+
+
+def _recording_call(method):
+    def __call__(self):
+        return timed(active, name_of(self), method, self)
+    return __call__
+
+
+def _recording_generate_many(method):
+    def generate_many(self, n):
+        start = timer()
+        values = method(self, n)
+        active.record_call(name_of(self), timer() - start, n)
+        return values
+    return generate_many
+
+
+_RECORDERS = {
+    '__call__': _recording_call,
+    'generate_many': _recording_generate_many,
+    }
+
+
+def _install(cls):
+    for name in INSTRUMENTED_METHODS:
+        method = cls.__dict__.get(name)
+        if method is not None:
+            _installed.append((cls, name, method))
+            setattr(cls, name, _RECORDERS[name](method))
+
+
+def _uninstall():
+    while _installed:
+        cls, name, method = _installed.pop()
+        setattr(cls, name, method)
+
+
+def instrumented(cls):
+    """
+    Class decorator that records calls to the ``__call__`` and
+    ``generate_many`` methods ``cls`` defines while collecting.  The methods
+    are only wrapped for the duration of :func:`collect`, so they cost
+    nothing extra otherwise.  A method that calls the other on the same
+    generator should go through a helper instead, or its values would be
+    counted twice.
+    """
+    _instrumented_classes.append(cls)
+    if active is not None:
+        _install(cls)
+    return cls
+
+
+@contextlib.contextmanager
+def collect(stats=None):
+    """
+    Context manager that records into ``stats``, or a new :class:`Stats`,
+    while it is active and yields it.  Collection can be nested, in which
+    case only the innermost :class:`Stats` records.
+
+    The methods of :func:`instrumented` classes are replaced while the
+    outermost collection is active, which affects every thread.
+    """
+    global active
+
+    if stats is None:
+        stats = Stats()
+
+    previous = active
+    active = stats
+    if previous is None:
+        for cls in _instrumented_classes:
+            _install(cls)
+    try:
+        yield stats
+    finally:
+        active = previous
+        if previous is None:
+            _uninstall()
@@ -1,33 +1,234 @@
-from perjury.exceptions import UniqueValueTimeoutError
+import hashlib
+import math
+import random
+import threading
 
+from perjury import stats
+from perjury.exceptions import (UniqueValueSaturatedError,
+        ValueSpaceExhaustedError)
 
-def unique(fn, depth_limit=50, key_fn=None, seen=None):
+
+# Called to create the store of seen keys for every :func:`unique` generator
+# that is not given one.
+default_seen = set
+
+
+def unique(fn, depth_limit=50, key_fn=None, seen=None, max_collision_rate=None,
+           thread_safe=False):
     """
     Decorator that ensures a function only ever returns unique values.  You can
     override the ``depth_limit`` to define the max number of recursions before
     failing.  Make sure that ``depth_limit`` is never long that the value
     returned from ``sys.getrecursionlimit``.
+
+    ``seen`` is the store of keys already returned.  It can be any object
+    supporting ``in`` and ``add``, such as the stores in
+    :mod:`perjury.seen`, or a callable that returns one.  It defaults to the
+    result of calling :data:`default_seen`.  Stores that also provide an
+    atomic ``add_new`` method, returning whether the key was added, are
+    checked and updated in a single step.  Stores with a ``share``
+    attribute, such as :class:`perjury.seen.ShardSet`, only accept that
+    fraction of all keys, and ``depth_limit`` is divided by it.
+
+    The returned function has a :class:`UniqueTelemetry` as its
+    ``telemetry`` attribute, which tracks how often values drawn from ``fn``
+    have already been returned.  Once more than ``max_collision_rate`` of
+    them have, which defaults to the rate at which a value is expected to
+    take ``depth_limit`` tries, or once ``depth_limit`` tries in a row fail:
+
+    - if ``fn`` has an ``all_values`` method returning every value it can
+      generate, the values not yet returned are shuffled and handed out in
+      turn, raising :class:`ValueSpaceExhaustedError` when none are left.
+    - otherwise :class:`UniqueValueSaturatedError` is raised straight away
+      with the collision rate, rather than spending ``depth_limit`` tries on
+      every value from then on.
+
+    While :mod:`perjury.stats` is collecting, the retries needed to find an
+    unseen value and any timeouts are recorded under the name of ``fn``.
+
+    If ``thread_safe`` is set, the generator can be called from several
+    threads at once without repeating a value, as long as ``fn`` can.  The
+    default store is then a :class:`perjury.seen.StripedSet` of
+    :data:`default_seen` stores, and stores without ``add_new`` are wrapped
+    in a :class:`perjury.seen.LockedSet`.  The telemetry counts are not
+    exact when threads race to update them.
     """
-    if seen is None:
-        seen = set()
+    if thread_safe:
+        from perjury.seen import LockedSet, StripedSet
+        if seen is None:
+            seen = StripedSet(factory=default_seen)
+        elif callable(seen):
+            seen = seen()
+        if not hasattr(seen, 'add_new'):
+            seen = LockedSet(seen)
+    elif seen is None:
+        seen = default_seen()
+    elif callable(seen):
+        seen = seen()
 
-    if key_fn is None:
-        key_fn = lambda x: x
+    depth_limit = int(math.ceil(depth_limit / getattr(seen, 'share', 1.0)))
+    if max_collision_rate is None:
+        max_collision_rate = 1 - 1.0 / depth_limit
+
+    add_new = getattr(seen, 'add_new', None)
+    telemetry = UniqueTelemetry(fn, key_fn, seen, max_collision_rate)
 
     def wrapper():
-        for _ in xrange(depth_limit):
+        for retries in xrange(depth_limit):
             ret = fn()
-            key = key_fn(ret)
+            key = ret if key_fn is None else key_fn(ret)
 
-            if key not in seen:
+            if add_new is not None:
+                if add_new(key):
+                    break
+            elif key not in seen:
                 seen.add(key)
-                return ret
+                break
+
+            if telemetry.saturated:
+                return telemetry.next_remaining()
+        else:
+            telemetry.record(depth_limit)
+            return telemetry.next_remaining()
 
-        raise UniqueValueTimeoutError
+        telemetry.returned += 1
+        if retries:
+            telemetry.record(retries)
+        return ret
 
+    wrapper.telemetry = telemetry
     return wrapper
 
 
+class UniqueTelemetry(object):
+    """
+    Counts of the values a :func:`unique` generator has returned and of the
+    draws from its source that had already been returned, which are
+    collisions.  :attr:`collision_rate` is the fraction of draws that
+    collided over roughly the last :attr:`window` draws.
+    """
+    window = 100
+
+    def __init__(self, fn, key_fn, seen, max_collision_rate):
+        self.fn = fn
+        self.key_fn = key_fn
+        self.seen = seen
+        self.max_collision_rate = max_collision_rate
+
+        self.returned = 0
+        self.collisions = 0
+        self.collision_rate = 0.0
+        self.saturated = False
+        # The shuffled values left to return, once enumerating.
+        self.remaining = None
+
+        self._window_start = 0
+        self._window_collisions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def attempts(self):
+        return self.returned + self.collisions
+
+    def record(self, collisions):
+        """
+        Records ``collisions`` more draws that had already been returned.
+        The collision rate is only brought up to date here, so that calls
+        without any collisions don't pay for it.
+        """
+        self.collisions += collisions
+        self._window_collisions += collisions
+
+        if stats.active is not None:
+            stats.active.record_retries(stats.name_of(self.fn), collisions)
+
+        attempts = self.attempts
+        drawn = attempts - self._window_start
+        if drawn >= self.window:
+            self.collision_rate = self._window_collisions / float(drawn)
+            self._window_start = attempts
+            self._window_collisions = 0
+            if self.collision_rate > self.max_collision_rate:
+                self.saturated = True
+
+    def is_new(self, key):
+        add_new = getattr(self.seen, 'add_new', None)
+        if add_new is not None:
+            return add_new(key)
+        elif key in self.seen:
+            return False
+        self.seen.add(key)
+        return True
+
+    def next_remaining(self):
+        """
+        Returns the next value the source has not yet returned, listing them
+        first if need be, or raises if it can't.
+        """
+        with self._lock:
+            return self._next_remaining()
+
+    def _next_remaining(self):
+        self.saturated = True
+        key_fn = self.key_fn or (lambda x: x)
+
+        if self.remaining is None:
+            all_values = getattr(self.fn, 'all_values', None)
+            if all_values is None:
+                self.raise_saturated()
+
+            remaining = []
+            listed = set()
+            for value in all_values():
+                key = key_fn(value)
+                if key not in self.seen and key not in listed:
+                    listed.add(key)
+                    remaining.append(value)
+            getattr(self.fn, 'rng', random).shuffle(remaining)
+            self.remaining = remaining
+
+        while self.remaining:
+            value = self.remaining.pop()
+            # Values drawn since the list was made, or added to a shared
+            # store elsewhere, are skipped.
+            if self.is_new(key_fn(value)):
+                self.returned += 1
+                return value
+
+        if stats.active is not None:
+            stats.active.record_timeout(stats.name_of(self.fn))
+        raise ValueSpaceExhaustedError(
+            'All {0} values of {1} have been returned.'.format(
+                self.returned, stats.name_of(self.fn)))
+
+    def raise_saturated(self):
+        if stats.active is not None:
+            stats.active.record_timeout(stats.name_of(self.fn))
+        raise UniqueValueSaturatedError(
+            '{0:.1%} of recent values from {1} were repeats after {2} unique '
+            'values were returned.'.format(
+                self.collision_rate, stats.name_of(self.fn), self.returned),
+            collision_rate=self.collision_rate,
+            attempts=self.attempts,
+            returned=self.returned,
+            )
+
+
+def as_unique(fn, **kwargs):
+    """
+    Returns a version of ``fn`` that never repeats a value.  Generators that
+    know their value space, like :class:`perjury.generators.Choice`, provide
+    an ``as_unique`` method that samples without replacement.  Anything else
+    is wrapped with :func:`unique`, which is passed ``kwargs``.
+    """
+    try:
+        make_unique = fn.as_unique
+    except AttributeError:
+        return unique(fn, **kwargs)
+
+    return make_unique(**kwargs)
+
+
 def forever(fn):
     """
     Returns an iterable that will call the function passed in until forever.
@@ -43,3 +244,61 @@ def times(fn, times):
     """
     for i in xrange(times):
         yield fn()
+
+
+def generate_many(fn, n):
+    """
+    Returns a list of ``n`` values from ``fn``.  Uses the batch
+    ``generate_many`` method of class-based generators when available, and
+    falls back to calling ``fn`` ``n`` times for plain callables.
+    """
+    try:
+        many = fn.generate_many
+    except AttributeError:
+        return [fn() for i in xrange(n)]
+
+    return many(n)
+
+
+def with_rng(fn, rng):
+    """
+    Returns a copy of the generator ``fn`` that draws from ``rng``.  Plain
+    callables can't be rebound and are returned as they are.
+    """
+    try:
+        rebind = fn.with_rng
+    except AttributeError:
+        return fn
+
+    return rebind(rng)
+
+
+def with_max_length(fn, max_length):
+    """
+    Returns a version of the generator ``fn`` whose values are no longer than
+    ``max_length``.  Generators that can't limit the length of their values,
+    and plain callables, are returned as they are.
+    """
+    try:
+        limit = fn.with_max_length
+    except AttributeError:
+        return fn
+
+    return limit(max_length)
+
+
+def derive_seed(seed, stream):
+    """
+    Returns the seed for stream number ``stream`` derived from ``seed``.
+    Derived seeds are stable across processes, runs and platforms.
+    """
+    digest = hashlib.sha1('{0!r}:{1}'.format(seed, stream)).hexdigest()
+    return int(digest[:16], 16)
+
+
+def split_rng(seed, n):
+    """
+    Returns ``n`` independent :class:`random.Random` instances whose seeds
+    are derived from ``seed``, for example one per worker thread.
+    """
+    return [random.Random(derive_seed(seed, i)) for i in xrange(n)]
@@ -15,7 +15,8 @@ setup(name='perjury',
     keywords='content',
     long_description=__doc__,
     url='https://github.com/aaronmerriam/foundry',
-    packages=find_packages(),
+    packages=find_packages(exclude=('tests',)),
+    package_data={'perjury': ['content/*.txt']},
     platforms="any",
     license='BSD',
     test_suite='tests',
@@ -3,6 +3,12 @@ from django.conf import settings
 # https://docs.djangoproject.com/en/dev/topics/settings/#using-settings-without-setting-django-settings-module
 settings.configure(
         DEBUG=True,
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:',
+                },
+            },
         )
 
 import test_django
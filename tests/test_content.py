@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from perjury import content
+from perjury import generators as g
+
+
+class TestLazyContent(TestCase):
+    def test_not_loaded_until_used(self):
+        lazy = content.LazyContent('word_list')
+
+        self.assertEqual(lazy._content, None)
+        assert 'john' in lazy
+        self.assertEqual(lazy._content, content.load('word_list'))
+
+    def test_concatenation(self):
+        self.assertEqual(
+                tuple(content.FIRST_NAMES),
+                content.load('male_names') + content.load('female_names'),
+                )
+        self.assertEqual(len(content.FIRST_NAMES),
+                len(content.MALE_NAMES) + len(content.FEMALE_NAMES))
+
+    def test_choice_resolves_content(self):
+        generator = g.Choice(choices=content.LazyContent('word_list'))
+
+        assert generator() in content.WORD_LIST
+        assert isinstance(generator.choices, tuple)
+
+    def test_choice_resolves_once(self):
+        generator = g.Choice(choices=content.LazyContent('word_list'))
+
+        self.assertFalse('choices' in generator.__dict__)
+        generator.generate_many(2)
+        self.assertTrue(generator.__dict__['choices'] is generator.choices)
+        self.assertRaises(AttributeError, getattr, generator, 'missing')
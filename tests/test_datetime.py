@@ -1,8 +1,10 @@
+from __future__ import division
 import datetime
 
 from unittest import TestCase
 
-from perjury.generators.datetime_generators import datetime_in_range
+from perjury.generators.datetime_generators import (datetime_in_range,
+        DatetimeGenerator, to_epoch, utc)
 from perjury.generators import datetime_generator, current_datetime
 
 
@@ -21,9 +23,117 @@ class DatetimeGeneratorTest(TestCase):
             self.assertTrue(value <= datetime.datetime.max)
             self.assertTrue(value >= datetime.datetime.min)
 
+    def test_generate_many(self):
+        values = current_datetime.generate_many(1000)
+        self.assertEqual(len(values), 1000)
+        for value in values:
+            td = value - datetime.datetime.now()
+            self.assertTrue(td <= datetime.timedelta(30))
+
     def test_current_generator(self):
         for i in xrange(1000):
             td = current_datetime() - datetime.datetime.now()
             one_month = datetime.timedelta(30)
 
             self.assertTrue(td <= one_month)
+
+
+class WeekGenerator(DatetimeGenerator):
+    def start_at(self):
+        return datetime.datetime(2012, 2, 27, 12, 30)
+
+    def end_at(self):
+        return datetime.datetime(2012, 3, 5, 12, 30)
+
+
+class AwareWeekGenerator(WeekGenerator):
+    resolution = 'microseconds'
+
+    def start_at(self):
+        return datetime.datetime(2012, 2, 27, 12, 30, tzinfo=utc)
+
+    def end_at(self):
+        return datetime.datetime(2012, 3, 5, 12, 30, tzinfo=utc)
+
+
+class BatchedDatetimeTest(TestCase):
+    def test_range_is_computed_once(self):
+        calls = []
+
+        class CountingGenerator(WeekGenerator):
+            def range(self):
+                calls.append(1)
+                return super(CountingGenerator, self).range()
+
+        CountingGenerator().generate_many(100)
+        self.assertEqual(len(calls), 1)
+
+    def test_generate_many_in_range(self):
+        generator = WeekGenerator()
+        for value in generator.generate_many(1000):
+            self.assertTrue(generator.start_at() <= value < generator.end_at())
+            self.assertEqual(value.microsecond, 0)
+
+    def test_microsecond_resolution(self):
+        values = AwareWeekGenerator().seeded(1).generate_many(100)
+        self.assertTrue(any(value.microsecond for value in values))
+        for value in values:
+            self.assertEqual(value.tzinfo, utc)
+
+    def test_epochs_match_datetimes(self):
+        for cls in (WeekGenerator, AwareWeekGenerator):
+            values = cls().seeded(3).generate_many(100)
+            epochs = cls().seeded(3).generate_epochs(100)
+            self.assertEqual(
+                epochs, [to_epoch(value, cls.resolution) for value in values])
+
+    def test_epoch_seconds(self):
+        self.assertEqual(to_epoch(datetime.datetime(1970, 1, 2)), 86400)
+
+    def test_isoformat_matches_datetimes(self):
+        for cls in (WeekGenerator, AwareWeekGenerator):
+            values = cls().seeded(5).generate_many(1000)
+            strings = cls().seeded(5).generate_isoformat(1000)
+            self.assertEqual(strings, [value.isoformat() for value in values])
+
+    def test_wide_microsecond_span(self):
+        generator = DatetimeGenerator()
+        generator.resolution = 'microseconds'
+        values = generator.seeded(7).generate_many(100)
+        strings = generator.seeded(7).generate_isoformat(100)
+        self.assertEqual(strings, [value.isoformat() for value in values])
+
+
+class SortedDatetimeTest(TestCase):
+    def test_sorted_stream(self):
+        generator = WeekGenerator().seeded(11)
+        values = list(generator.sorted_stream(10000))
+        self.assertEqual(len(values), 10000)
+        self.assertEqual(values, sorted(values))
+        self.assertTrue(values[0] >= generator.start_at())
+        self.assertTrue(values[-1] < generator.end_at())
+
+    def test_sorted_stream_is_uniform(self):
+        generator = WeekGenerator().seeded(13)
+        midpoint = generator.start_at() + datetime.timedelta(3.5)
+        values = list(generator.sorted_stream(10000))
+        below = sum(1 for value in values if value < midpoint)
+        self.assertTrue(4500 < below < 5500)
+
+    def test_sorted_stream_is_lazy(self):
+        stream = WeekGenerator().sorted_stream(10 ** 12)
+        self.assertTrue(next(stream) <= next(stream))
+
+    def test_aware_sorted_stream(self):
+        values = list(AwareWeekGenerator().seeded(17).sorted_stream(1000))
+        self.assertEqual(values, sorted(values))
+        self.assertTrue(any(value.microsecond for value in values))
+
+    def test_arrivals(self):
+        generator = WeekGenerator().seeded(19)
+        values = list(generator.arrivals(rate=1 / 60))
+        self.assertEqual(values, sorted(values))
+        self.assertTrue(values[0] >= generator.start_at())
+        self.assertTrue(values[-1] < generator.end_at())
+        # A week of minutes, give or take.
+        self.assertTrue(9500 < len(values) < 10700)
@@ -1,17 +1,34 @@
 from unittest import TestCase
 import datetime
 import decimal
+import re
 
-from django.db import models
+from django.core import validators
+from django.core.management.color import no_style
+from django.db import connection, models
 
-from perjury.generators.django_models import ModelGenerator
+from perjury.generators.django_models import (ModelGenerator,
+        CyclicForeignKeyGenerator, ParentPool, create_all, dependency_order,
+        get_generator_for_class, register_field_generator,
+        unregister_field_generator, register_name_generator,
+        unregister_name_generator)
 from perjury import generators as g
+from perjury import stats
+from perjury.parallel import generate_parallel
 
 
 class CustomCharField(models.CharField):
     pass
 
 
+class FieldMixin(object):
+    pass
+
+
+class MixinIntegerField(FieldMixin, models.IntegerField):
+    pass
+
+
 class SimpleModel(models.Model):
     field1 = models.CharField(max_length=255)
     field2 = models.IntegerField()
@@ -45,6 +62,89 @@ class ChoiceFieldModel(models.Model):
     color = models.CharField(max_length=255, choices=COLOR_CHOICES)
 
 
+class ParentModel(models.Model):
+    name = models.CharField(max_length=255)
+
+
+class ChildModel(models.Model):
+    parent = models.ForeignKey(ParentModel)
+    value = models.IntegerField()
+
+
+class GrandchildModel(models.Model):
+    child = models.ForeignKey(ChildModel)
+
+
+class CategoryModel(models.Model):
+    name = models.CharField(max_length=255)
+    parent = models.ForeignKey('self')
+
+
+class CycleA(models.Model):
+    b = models.ForeignKey('CycleB')
+
+
+class CycleB(models.Model):
+    a = models.ForeignKey(CycleA)
+
+
+class ConstrainedModel(models.Model):
+    short = models.CharField(max_length=8)
+    code = models.CharField(max_length=20, unique=True)
+    price = models.DecimalField(max_digits=5, decimal_places=2)
+    rating = models.IntegerField(validators=[
+        validators.MinValueValidator(50), validators.MaxValueValidator(60)])
+    count = models.PositiveIntegerField(validators=[validators.MaxValueValidator(3)])
+    email = models.EmailField(max_length=24)
+    number = models.IntegerField(unique=True)
+    initials = models.CharField(max_length=2)
+    tag = models.CharField(max_length=2, unique=True)
+
+
+class ShortFieldsModel(models.Model):
+    email = models.EmailField(max_length=14)
+    username = models.CharField(max_length=2)
+    url = models.URLField(max_length=10)
+
+
+class UniqueModel(models.Model):
+    username = models.CharField(max_length=30, unique=True)
+    code = models.CharField(max_length=20, unique=True)
+
+
+class UniqueChildModel(models.Model):
+    parent = models.ForeignKey(UniqueModel)
+
+
+def unique_model_kwargs():
+    return ModelGenerator(UniqueModel).build_model_kwargs
+
+
+def unique_parent_usernames():
+    generator = ModelGenerator(UniqueChildModel)
+    return lambda: generator.build_model_kwargs()['parent'].username
+
+
+class DatabaseTestCase(TestCase):
+    """
+    Creates the tables for ``models`` in the in-memory database for the
+    duration of each test.
+    """
+    models = ()
+
+    def setUp(self):
+        cursor = connection.cursor()
+        for model in self.models:
+            statements, _ = connection.creation.sql_create_model(model, no_style())
+            for statement in statements:
+                cursor.execute(statement)
+
+    def tearDown(self):
+        cursor = connection.cursor()
+        for model in reversed(self.models):
+            cursor.execute('DROP TABLE {0}'.format(model._meta.db_table))
+
+
 class TestModelGeneratorOptions(TestCase):
     Model = SimpleModel
 
@@ -104,6 +204,28 @@ class TestModelGeneratorOptions(TestCase):
         assert type(instance.field3) is int
 
 
+class TestSeeded(TestCase):
+    def assertReproducible(self, generator):
+        first = generator.seeded(42)
+        second = generator.seeded(42)
+        self.assertEqual(
+                [first.build_model_kwargs() for i in range(20)],
+                [second.build_model_kwargs() for i in range(20)])
+
+    def test_fields(self):
+        self.assertReproducible(ModelGenerator(SimpleModel))
+
+    def test_unique_fields(self):
+        self.assertReproducible(ModelGenerator(UniqueModel))
+
+    def test_foreign_keys(self):
+        first = ModelGenerator(ChildModel).seeded(3)
+        second = ModelGenerator(ChildModel).seeded(3)
+
+        for i in range(20):
+            self.assertEqual(first().parent.name, second().parent.name)
+
+
 class TestFieldMatching(TestCase):
     Model = ModelWithLotsOfFields
 
@@ -133,6 +255,78 @@ class TestFieldMatching(TestCase):
         assert isinstance(instance.custom, basestring)
 
 
+class TestIntrospectionCache(TestCase):
+    def test_introspection_is_reused(self):
+        first = ModelGenerator(ChoiceFieldModel)
+        second = ModelGenerator(ChoiceFieldModel)
+
+        self.assertTrue(first.generators['color'] is second.generators['color'])
+
+    def test_overrides_do_not_leak(self):
+        ModelGenerator(SimpleModel, generators={'field1': g.email})
+
+        generator = ModelGenerator(SimpleModel)
+
+        self.assertTrue(generator.generators['field1'] is g.words)
+
+    def test_fields_and_exclude_are_part_of_the_key(self):
+        self.assertEqual(
+                set(ModelGenerator(SimpleModel, exclude=['field2']).generators),
+                set(['field1']))
+        self.assertEqual(
+                set(ModelGenerator(SimpleModel, fields=['field3']).generators),
+                set(['field3']))
+
+    def test_mro_lookup(self):
+        self.assertTrue(get_generator_for_class(MixinIntegerField) is g.smallint)
+        self.assertRaises(IndexError, get_generator_for_class, FieldMixin)
+
+
+class ContactModel(models.Model):
+    work_email = models.CharField(max_length=255)
+    home_phone = models.CharField(max_length=255)
+    age = MixinIntegerField()
+
+
+class TestRegistry(TestCase):
+    def test_register_field_generator(self):
+        register_field_generator(MixinIntegerField, g.Repeat(42))
+        try:
+            instance = ModelGenerator(ContactModel)()
+            self.assertEqual(instance.age, 42)
+        finally:
+            unregister_field_generator(MixinIntegerField)
+
+        self.assertTrue(
+                ModelGenerator(ContactModel).generators['age'] is g.smallint)
+
+    def test_register_name_glob(self):
+        register_name_generator('*_email', g.email)
+        try:
+            instance = ModelGenerator(ContactModel)()
+            assert instance.work_email.endswith('@example.com')
+        finally:
+            unregister_name_generator('*_email')
+
+        self.assertTrue(
+                ModelGenerator(ContactModel).generators['work_email'] is g.words)
+
+    def test_register_name_regex(self):
+        pattern = re.compile(r'^(home|work)_phone$')
+        register_name_generator(pattern, g.Repeat('555-1234'))
+        try:
+            self.assertEqual(ModelGenerator(ContactModel)().home_phone, '555-1234')
+        finally:
+            unregister_name_generator(pattern)
+
+    def test_register_exact_name(self):
+        register_name_generator('home_phone', g.Repeat('555-0000'))
+        try:
+            self.assertEqual(ModelGenerator(ContactModel)().home_phone, '555-0000')
+        finally:
+            unregister_name_generator('home_phone')
+
+
 class TestChoiceField(TestCase):
     def test_choice_field(self):
         generator = ModelGenerator(ChoiceFieldModel)
@@ -141,3 +335,235 @@ class TestChoiceField(TestCase):
         for i in range(1, 1000):
             instance = generator()
             assert instance.color in choices
+
+
+class TestCreateMany(DatabaseTestCase):
+    models = (ParentModel, ChildModel)
+
+    def test_create_many(self):
+        generator = ModelGenerator(ParentModel)
+
+        instances = generator.create_many(25, batch_size=10)
+
+        self.assertEqual(ParentModel.objects.count(), 25)
+        self.assertEqual(
+                sorted(instance.pk for instance in instances),
+                sorted(ParentModel.objects.values_list('pk', flat=True)),
+                )
+
+    def test_sequences_reset(self):
+        reset = []
+
+        def sequence_reset_sql(style, model_list):
+            reset.extend(model_list)
+            return ['SELECT 1']
+
+        connection.ops.sequence_reset_sql = sequence_reset_sql
+        try:
+            ModelGenerator(ChildModel).create_many(10, batch_size=4)
+        finally:
+            del connection.ops.sequence_reset_sql
+
+        self.assertEqual(set(reset), set([ChildModel, ParentModel]))
+        ParentModel.objects.create(name='after')
+        self.assertEqual(ParentModel.objects.count(), 11)
+
+    def test_create_many_with_foreign_keys(self):
+        generator = ModelGenerator(ChildModel)
+
+        generator.create_many(30, batch_size=7)
+
+        self.assertEqual(ChildModel.objects.count(), 30)
+        self.assertEqual(ParentModel.objects.count(), 30)
+        for child in ChildModel.objects.select_related('parent'):
+            assert child.parent.name
+
+
+class TestConstraints(DatabaseTestCase):
+    models = (ConstrainedModel,)
+
+    def test_valid_on_first_try(self):
+        instances = ModelGenerator(ConstrainedModel).create_many(300)
+
+        for instance in ConstrainedModel.objects.all():
+            instance.full_clean()
+
+        self.assertEqual(len(set(instance.code for instance in instances)), 300)
+        self.assertEqual(len(set(instance.number for instance in instances)), 300)
+        self.assertEqual(len(set(instance.tag for instance in instances)), 300)
+        self.assertTrue(all(instance.initials for instance in instances))
+        self.assertTrue(any(instance.price >= 100 for instance in instances))
+        self.assertEqual(
+                set(instance.rating for instance in instances), set(range(50, 61)))
+        self.assertEqual(
+                set(instance.count for instance in instances), set([1, 2, 3]))
+
+    def test_fields_too_short_for_their_generators(self):
+        generator = ModelGenerator(ShortFieldsModel)
+
+        for instance in generator.build_many(100):
+            instance.clean_fields(exclude=['url'])
+            self.assertTrue(0 < len(instance.username) <= 2)
+            self.assertTrue(0 < len(instance.url) <= 10)
+
+    def test_unique_values_are_not_shared(self):
+        # Each generator can use most of the usernames without running out.
+        for generator in (ModelGenerator(UniqueModel), ModelGenerator(UniqueModel)):
+            rows = generator.build_many(3000)
+            self.assertEqual(len(set(row.username for row in rows)), 3000)
+            self.assertEqual(len(set(row.code for row in rows)), 3000)
+
+    def test_unique_across_processes(self):
+        # A generator built before the workers start must not hand its used
+        # values down to them.
+        unique_model_kwargs()()
+
+        rows = generate_parallel(unique_model_kwargs, 1000, seed=5,
+                processes=4, shared_unique=True)
+
+        self.assertEqual(len(rows), 1000)
+        self.assertEqual(len(set(row['username'] for row in rows)), 1000)
+        self.assertEqual(len(set(row['code'] for row in rows)), 1000)
+
+    def test_unique_reproducible_across_processes(self):
+        first = generate_parallel(unique_model_kwargs, 1000, seed=5,
+                processes=4)
+        second = generate_parallel(unique_model_kwargs, 1000, seed=5,
+                processes=4)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(set(row['username'] for row in first)), 1000)
+
+    def test_unique_parent_values_are_not_shared(self):
+        first = ModelGenerator(UniqueChildModel).generators['parent']
+        second = ModelGenerator(UniqueChildModel).generators['parent']
+
+        self.assertFalse(first is second)
+        self.assertFalse(
+                first.generators['username'] is second.generators['username'])
+
+    def test_unique_parents_across_processes(self):
+        unique_parent_usernames()()
+
+        usernames = generate_parallel(unique_parent_usernames, 1000, seed=5,
+                processes=4, shared_unique=True)
+
+        self.assertEqual(len(set(usernames)), 1000)
+
+    def test_unconstrained_generators_are_shared(self):
+        generators = ModelGenerator(ModelWithLotsOfFields).generators
+        self.assertTrue(generators['string'] is g.words)
+        self.assertTrue(generators['email'] is g.email)
+
+
+class TestStats(DatabaseTestCase):
+    models = (ParentModel, ChildModel)
+
+    def test_build_model_kwargs(self):
+        generator = ModelGenerator(SimpleModel)
+        with stats.collect() as collected:
+            generator()
+            generator()
+
+        self.assertEqual(collected['SimpleModel'].calls, 2)
+        self.assertEqual(collected['SimpleModel.field1'].values, 2)
+        self.assertEqual(collected['SimpleModel.field2'].values, 2)
+
+    def test_create_many(self):
+        with stats.collect() as collected:
+            ModelGenerator(ChildModel).create_many(30, batch_size=10)
+
+        self.assertEqual(collected['ChildModel.parent'].values, 30)
+        self.assertEqual(collected['ChildModel.parent'].calls, 3)
+        self.assertEqual(collected['ParentModel.name'].values, 30)
+
+
+class TestParentPools(DatabaseTestCase):
+    models = (ParentModel, ChildModel, GrandchildModel, CategoryModel)
+
+    def test_fan_out(self):
+        generator = ModelGenerator(ChildModel).with_parent_pools(fan_out=10)
+
+        generator.create_many(100, batch_size=30)
+
+        self.assertEqual(ChildModel.objects.count(), 100)
+        self.assertEqual(ParentModel.objects.count(), 10)
+
+    def test_seeded(self):
+        generator = ModelGenerator(ChildModel).with_parent_pools(fan_out=5)
+
+        names = [
+            [child.parent.name for child in generator.seeded(8).create_many(50)]
+            for i in range(2)
+            ]
+
+        self.assertEqual(names[0], names[1])
+
+    def test_single_instances(self):
+        generator = ModelGenerator(ChildModel).with_parent_pools(fan_out=5)
+
+        for i in range(20):
+            generator(commit=True)
+
+        self.assertEqual(ParentModel.objects.count(), 4)
+
+    def test_pools_all_the_way_up(self):
+        generator = ModelGenerator(GrandchildModel).with_parent_pools(fan_out=4)
+
+        generator.create_many(64)
+
+        self.assertEqual(ChildModel.objects.count(), 16)
+        self.assertEqual(ParentModel.objects.count(), 4)
+
+    def test_existing_rows(self):
+        ModelGenerator(ParentModel).create_many(3)
+        generator = ModelGenerator(ChildModel).with_parent_pools(
+                fan_out=None, existing=True)
+
+        generator.create_many(30)
+
+        self.assertEqual(ParentModel.objects.count(), 3)
+        self.assertEqual(
+                set(ChildModel.objects.values_list('parent_id', flat=True)),
+                set(ParentModel.objects.values_list('pk', flat=True)))
+
+    def test_empty_pool(self):
+        pool = ParentPool(ParentModel)
+
+        self.assertRaises(ValueError, pool)
+
+    def test_self_referential(self):
+        generator = ModelGenerator(CategoryModel)
+        self.assertTrue(
+                isinstance(generator.generators['parent'], CyclicForeignKeyGenerator))
+
+        generator.create_many(20, batch_size=7)
+        generator.create_many(5)
+
+        pks = set(CategoryModel.objects.values_list('pk', flat=True))
+        parents = set(CategoryModel.objects.values_list('parent_id', flat=True))
+        self.assertEqual(len(pks), 25)
+        self.assertTrue(parents <= pks)
+
+    def test_create_all(self):
+        created = create_all([
+            (ModelGenerator(ChildModel), 50),
+            (ModelGenerator(ParentModel), 5),
+            ])
+
+        self.assertEqual(len(created[ParentModel]), 5)
+        self.assertEqual(ParentModel.objects.count(), 5)
+        self.assertEqual(ChildModel.objects.count(), 50)
+
+
+class TestDependencyOrder(TestCase):
+    def test_parents_first(self):
+        self.assertEqual(
+                dependency_order([GrandchildModel, ChildModel, ParentModel]),
+                [ParentModel, ChildModel, GrandchildModel])
+
+    def test_self_reference_ignored(self):
+        self.assertEqual(dependency_order([CategoryModel]), [CategoryModel])
+
+    def test_cycle(self):
+        self.assertRaises(ValueError, dependency_order, [CycleA, CycleB])
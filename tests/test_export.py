@@ -0,0 +1,79 @@
+from unittest import TestCase
+from StringIO import StringIO
+import csv
+import datetime
+import decimal
+import json
+
+from perjury import generators as g
+from perjury.export import export, read_columnar, chunked
+
+
+def row_generator():
+    counter = g.consumer(g.sequence())
+
+    def row():
+        i = counter()
+        return {
+            'id': i,
+            'name': g.username(),
+            'score': i / 2.0,
+            'active': i % 2 == 0,
+            'created': datetime.datetime(2013, 1, 1, 12, 0, i % 60),
+            'amount': decimal.Decimal('1.50'),
+            'note': None if i % 3 else u'caf\xe9',
+            }
+    return row
+
+
+class TestChunked(TestCase):
+    def test_chunked(self):
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+
+class TestExport(TestCase):
+    def test_csv(self):
+        f = StringIO()
+
+        count = export(row_generator(), f, format='csv', n=25, chunk_size=10)
+
+        self.assertEqual(count, 25)
+        rows = list(csv.DictReader(StringIO(f.getvalue())))
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[0]['id'], '1')
+        self.assertEqual(rows[0]['created'], '2013-01-01T12:00:01')
+        self.assertEqual(rows[0]['note'], '')
+        self.assertEqual(rows[2]['note'].decode('utf-8'), u'caf\xe9')
+
+    def test_jsonl_fields(self):
+        f = StringIO()
+
+        export(row_generator(), f, format='jsonl', n=5, fields=['id', 'amount'])
+
+        rows = [json.loads(line) for line in f.getvalue().splitlines()]
+        self.assertEqual(rows[4], {'id': 5, 'amount': '1.50'})
+
+    def test_columnar_round_trip(self):
+        f = StringIO()
+
+        export(row_generator(), f, format='columnar', n=25, chunk_size=10)
+
+        groups = list(read_columnar(StringIO(f.getvalue())))
+        self.assertEqual([len(group['id']) for group in groups], [10, 10, 5])
+        group = groups[0]
+        self.assertEqual(group['id'][:3], [1, 2, 3])
+        self.assertEqual(group['score'][:3], [0.5, 1.0, 1.5])
+        self.assertEqual(group['active'][:2], [False, True])
+        self.assertEqual(group['created'][0], u'2013-01-01T12:00:01')
+        self.assertEqual(group['note'][:3], [None, None, u'caf\xe9'])
+
+    def test_sequence_rows(self):
+        f = StringIO()
+
+        export(lambda: (1, 'a'), f, format='columnar', n=3)
+
+        groups = list(read_columnar(StringIO(f.getvalue())))
+        self.assertEqual(groups, [{u'0': [1, 1, 1], u'1': [u'a', u'a', u'a']}])
+
+    def test_unknown_format(self):
+        self.assertRaises(ValueError, export, g.smallint, StringIO(), format='xml')
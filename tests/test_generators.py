@@ -1,7 +1,9 @@
 from unittest import TestCase
 import random
 
+from perjury import generators as g
 from perjury.generators import BaseGenerator, sequence, consumer
+from perjury import util
 
 
 class TestBasicBaseGenerator(TestCase):
@@ -38,6 +40,192 @@ class TestGeneratorUniqueness(TestCase):
             values.add(value)
 
 
+class TestGenerateMany(TestCase):
+    def test_choice(self):
+        values = g.Choice(choices=(1, 2, 3)).generate_many(1000)
+        self.assertEqual(len(values), 1000)
+        self.assertEqual(set(values), set([1, 2, 3]))
+
+    def test_smallint(self):
+        values = g.smallint.generate_many(1000)
+        self.assertEqual(set(values), set(range(1, 11)))
+
+    def test_words(self):
+        for value in g.words.generate_many(100):
+            self.assertTrue(1 <= len(value.split(' ')) <= 10)
+
+    def test_words_max_length(self):
+        generator = g.words.with_max_length(12).seeded(3)
+        values = generator.generate_many(1000) + [generator() for i in xrange(100)]
+        for value in values:
+            self.assertTrue(0 < len(value) <= 12)
+            for word in value.split(' '):
+                self.assertTrue(word in g.word.choices)
+        self.assertTrue(any(' ' in value for value in values))
+
+    def test_words_tiny_max_length(self):
+        shortest = min(len(word) for word in g.word.choices)
+        generator = g.words.with_max_length(shortest)
+        for value in generator.generate_many(100):
+            self.assertEqual(len(value), shortest)
+
+        generator = g.words.with_max_length(shortest - 1)
+        for value in generator.generate_many(100) + [generator()]:
+            self.assertTrue(0 < len(value) < shortest)
+            self.assertTrue(value.isalpha())
+
+    def test_letters(self):
+        generator = g.LettersGenerator(2)
+        values = generator.generate_many(5000)
+        self.assertEqual(set(len(value) for value in values), set([1, 2]))
+        self.assertEqual(len(generator.all_values()), 26 + 26 ** 2)
+        self.assertRaises(ValueError, g.LettersGenerator, 0)
+
+    def test_words_length_distribution(self):
+        generator = g.WordsGenerator(length=g.Choice(choices=(2,)))
+        for value in generator.generate_many(100):
+            self.assertEqual(len(value.split(' ')), 2)
+
+    def test_words_max_length_plain_word(self):
+        generator = g.WordsGenerator(word=g.Repeat('abcd'), max_length=10)
+        self.assertEqual(set(generator.generate_many(100)) - set(['abcd', 'abcd abcd']), set())
+
+    def test_integer_generator(self):
+        generator = g.IntegerGenerator(-2, 2)
+        values = generator.generate_many(1000) + [generator() for i in xrange(100)]
+        self.assertEqual(set(values), set(range(-2, 3)))
+
+    def test_decimal_digits(self):
+        generator = g.decimal.with_digits(4, 3)
+        for value in generator.generate_many(1000):
+            sign, digits, exponent = value.as_tuple()
+            self.assertEqual(exponent, -3)
+            self.assertTrue(len(digits) <= 4)
+            self.assertTrue(0 <= value < 10)
+
+    def test_max_length_unchanged_when_everything_fits(self):
+        self.assertTrue(g.words.with_max_length(1000) is g.words)
+        self.assertTrue(g.email.with_max_length(1000) is g.email)
+        self.assertTrue(util.with_max_length(len, 5) is len)
+
+    def test_email_max_length(self):
+        generator = g.email.with_max_length(20)
+        for value in generator.generate_many(200):
+            self.assertTrue(len(value) <= 20)
+
+        generator = g.email.with_max_length(14)
+        for value in generator.generate_many(200):
+            self.assertTrue(value.endswith('@example.com'))
+            self.assertTrue(0 < len(value) <= 14)
+
+        for length in (12, 5):
+            for value in g.email.with_max_length(length).generate_many(100):
+                self.assertTrue(0 < len(value) <= length)
+                self.assertTrue(value.isalpha())
+
+    def test_choice_max_length_fallback(self):
+        for value in g.username.with_max_length(2).generate_many(100):
+            self.assertTrue(0 < len(value) <= 2)
+        self.assertEqual(g.username.with_max_length(0)(), '')
+        self.assertEqual(
+                len(g.LettersGenerator(3, min_length=2).with_max_length(1)()), 1)
+
+    def test_email(self):
+        for value in g.email.generate_many(100):
+            self.assertTrue(value.endswith('@example.com'))
+
+    def test_unique_base_generator(self):
+        class TestGenerator(BaseGenerator):
+            def generator(self):
+                return random.randint(0, 1000)
+
+        values = TestGenerator().generate_many(500)
+        self.assertEqual(len(set(values)), 500)
+
+    def test_plain_callable_fallback(self):
+        values = util.generate_many(consumer(sequence()), 3)
+        self.assertEqual(values, [1, 2, 3])
+
+
+class TestWeightedChoice(TestCase):
+    def test_distribution(self):
+        generator = g.weighted_choice({'a': 1, 'b': 3})
+        values = generator.generate_many(40000)
+
+        ratio = values.count('b') / float(values.count('a'))
+        self.assertTrue(2.7 < ratio < 3.3)
+
+    def test_float_and_large_weights(self):
+        generator = g.weighted_choice({True: 0.5, False: 999999.5})
+
+        self.assertEqual(len(generator.values), 2)
+        self.assertEqual(set([generator() for i in range(100)]), set([False]))
+
+    def test_zero_weights_never_returned(self):
+        generator = g.weighted_choice({1: 0, 2: 1, 3: 1})
+
+        self.assertEqual(set(generator.generate_many(1000)), set([2, 3]))
+
+    def test_requires_positive_weight(self):
+        self.assertRaises(ValueError, g.weighted_choice, {1: 0})
+
+
+class TestSeededGenerators(TestCase):
+    generators = (
+        g.Choice(choices=range(100)),
+        g.weighted_choice({1: 1, 2: 2, 3: 3}),
+        g.smallint,
+        g.decimal,
+        g.words,
+        g.email,
+        g.datetime_generator,
+        )
+
+    def test_reproducible(self):
+        for generator in self.generators:
+            first = generator.seeded(42)
+            second = generator.seeded(42)
+
+            self.assertEqual(
+                    [first() for i in range(20)], [second() for i in range(20)])
+            self.assertEqual(first.generate_many(20), second.generate_many(20))
+
+    def test_independent_of_global_state(self):
+        generator = g.words.seeded(1)
+        expected = generator.seeded(1).generate_many(10)
+
+        random.seed(1)
+        random.random()
+
+        self.assertEqual(generator.generate_many(10), expected)
+
+    def test_with_rng_leaves_original(self):
+        generator = g.Choice(choices=range(100))
+        rng = random.Random(3)
+
+        self.assertTrue(generator.with_rng(rng).rng is rng)
+        self.assertTrue(generator.rng is random)
+
+    def test_unique_base_generator(self):
+        class TestGenerator(BaseGenerator):
+            def generator(self):
+                return self.rng.randint(0, 1000)
+
+        first = TestGenerator().seeded(5)
+        second = TestGenerator().seeded(5)
+
+        values = [first() for i in range(500)]
+        self.assertEqual(len(set(values)), 500)
+        self.assertEqual(values, [second() for i in range(500)])
+
+    def test_split_rng(self):
+        first = [rng.random() for rng in util.split_rng(7, 3)]
+        second = [rng.random() for rng in util.split_rng(7, 3)]
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(set(first)), 3)
+
+
 class TestConsumer(TestCase):
     def test_consumer(self):
         generator = consumer([1, 2, 3])
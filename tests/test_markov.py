@@ -0,0 +1,206 @@
+from unittest import TestCase
+import os
+import random
+import shutil
+import tempfile
+import threading
+
+from perjury.exceptions import MarkovModelError
+from perjury.generators import markov
+
+
+CORPUS = ' '.join([
+    'the quick brown fox jumps over the lazy dog .',
+    'the lazy dog sleeps in the sun .',
+    'a quick brown dog jumps over a sleeping fox .',
+    ] * 5)
+
+
+def assert_same_model(test, first, second):
+    test.assertEqual(first.vocabulary, second.vocabulary)
+    test.assertEqual(first.token_size, second.token_size)
+    test.assertEqual(first.states, second.states)
+    for name in ('offsets', 'successors', 'cumulative', 'unigram_ids',
+                 'unigram_cumulative'):
+        test.assertEqual(list(getattr(first, name)), list(getattr(second, name)))
+
+
+class TestMarkovGenerator(TestCase):
+    def test_transitions(self):
+        generator = markov.MarkovGenerator(CORPUS, 2)
+        model = generator.model
+        ids = dict((token, i) for i, token in enumerate(model.vocabulary))
+
+        self.assertEqual(
+                model.transitions((ids['the'], ids['lazy'])), {'dog': 10})
+        self.assertEqual(
+                model.transitions((ids['over'], ids['the'])), {'lazy': 5})
+        self.assertEqual(
+                model.transitions((ids['.'], ids['the'])),
+                {'lazy': 5, 'quick': 4})
+
+    def test_vocabulary_is_interned(self):
+        generator = markov.MarkovGenerator(CORPUS, 2)
+
+        self.assertEqual(
+                sorted(generator.model.vocabulary), sorted(set(CORPUS.split(' '))))
+
+    def test_word_follows_transitions(self):
+        generator = markov.MarkovGenerator(CORPUS, 2)
+        words = [generator.word() for i in xrange(500)]
+
+        for first, second in zip(words, words[1:]):
+            if first == 'lazy':
+                self.assertEqual(second, 'dog')
+
+    def test_rng(self):
+        first = markov.MarkovGenerator(CORPUS, 2, rng=random.Random(1))
+        second = markov.MarkovGenerator(CORPUS, 2, rng=random.Random(1))
+
+        self.assertEqual(
+                [first.word() for i in range(50)],
+                [second.word() for i in range(50)])
+
+    def test_sentence(self):
+        generator = markov.MarkovGenerator(CORPUS, 2)
+
+        assert generator.sentence().endswith('.')
+
+    def test_threads_keep_their_own_state(self):
+        generator = markov.MarkovGenerator(CORPUS, 2)
+        results = []
+
+        def walk():
+            results.append([generator.word() for i in xrange(2000)])
+
+        threads = [threading.Thread(target=walk) for i in xrange(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 4)
+        for words in results:
+            for first, second in zip(words, words[1:]):
+                if first == 'lazy':
+                    self.assertEqual(second, 'dog')
+
+
+class TestMarkovTrainer(TestCase):
+    def test_chunks_match_whole_corpus(self):
+        trainer = markov.MarkovTrainer(2)
+        # Chunks that split tokens in half.
+        trainer.feed(CORPUS[i:i + 7] for i in xrange(0, len(CORPUS), 7))
+
+        assert_same_model(
+                self, trainer.model(), markov.MarkovGenerator(CORPUS, 2).model)
+
+    def test_merge(self):
+        first = markov.MarkovTrainer(2)
+        first.feed(['a quick dog .'])
+        second = markov.MarkovTrainer(2)
+        second.feed(['the lazy dog sleeps . a quick dog naps .'])
+
+        first.merge(second)
+        model = first.model()
+        ids = dict((token, i) for i, token in enumerate(model.vocabulary))
+
+        self.assertEqual(
+                model.transitions((ids['a'], ids['quick'])), {'dog': 2})
+        self.assertEqual(
+                model.transitions((ids['quick'], ids['dog'])),
+                {'.': 1, 'naps': 1})
+
+    def test_merge_token_size_mismatch(self):
+        self.assertRaises(ValueError, markov.MarkovTrainer(2).merge,
+                markov.MarkovTrainer(3))
+
+
+class MarkovTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+class TestCompiledModels(MarkovTestCase):
+    def test_round_trip(self):
+        generator = markov.MarkovGenerator(CORPUS, 2)
+        path = os.path.join(self.directory, 'model')
+
+        markov.save_model(generator, path)
+        loaded = markov.load_model(path)
+
+        self.assertEqual(loaded.token_size, 2)
+        assert_same_model(self, loaded.model, generator.model)
+
+    def test_unicode_round_trip(self):
+        generator = markov.MarkovGenerator(u'caf\xe9 au lait .', 1)
+        path = os.path.join(self.directory, 'model')
+
+        markov.save_model(generator, path)
+
+        assert_same_model(self, markov.load_model(path).model, generator.model)
+
+    def test_mismatch(self):
+        path = os.path.join(self.directory, 'model')
+        markov.save_model(markov.MarkovGenerator(CORPUS, 2), path, digest='abc')
+
+        self.assertRaises(MarkovModelError, markov.load_model, path, digest='def')
+        self.assertRaises(MarkovModelError, markov.load_model, path, token_size=3)
+
+    def test_invalid_file(self):
+        path = os.path.join(self.directory, 'model')
+        with open(path, 'wb') as f:
+            f.write('not a model')
+
+        self.assertRaises(MarkovModelError, markov.load_model, path)
+
+
+class TestModelCache(MarkovTestCase):
+    def cached_paths(self):
+        return sorted(os.listdir(self.directory))
+
+    def test_cache_is_reused(self):
+        first = markov.load_cached(CORPUS, 2, cache_dir=self.directory)
+        paths = self.cached_paths()
+        second = markov.load_cached(CORPUS, 2, cache_dir=self.directory)
+
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(self.cached_paths(), paths)
+        assert_same_model(self, first.model, second.model)
+
+    def test_cache_keyed_on_corpus_and_token_size(self):
+        markov.load_cached(CORPUS, 2, cache_dir=self.directory)
+        markov.load_cached(CORPUS, 3, cache_dir=self.directory)
+        markov.load_cached(CORPUS + ' more .', 2, cache_dir=self.directory)
+
+        self.assertEqual(len(self.cached_paths()), 3)
+
+    def test_corrupt_cache_is_rebuilt(self):
+        markov.load_cached(CORPUS, 2, cache_dir=self.directory)
+        path = os.path.join(self.directory, self.cached_paths()[0])
+        with open(path, 'wb') as f:
+            f.write('garbage')
+
+        generator = markov.load_cached(CORPUS, 2, cache_dir=self.directory)
+
+        assert_same_model(self, generator.model, markov.load_model(path).model)
+
+
+class TestTrainFiles(MarkovTestCase):
+    def test_train_files(self):
+        paths = []
+        for i, text in enumerate(['the lazy dog .', 'a lazy dog sleeps .']):
+            path = os.path.join(self.directory, 'corpus{0}.txt'.format(i))
+            with open(path, 'w') as f:
+                f.write(text)
+            paths.append(path)
+
+        trainer = markov.train_files(paths, token_size=1, processes=2)
+        model = trainer.model()
+        ids = dict((token, i) for i, token in enumerate(model.vocabulary))
+
+        self.assertEqual(model.transitions((ids['lazy'],)), {'dog': 2})
+        self.assertEqual(model.transitions((ids['dog'],)), {'.': 1, 'sleeps': 1})
@@ -0,0 +1,73 @@
+from unittest import TestCase
+import os
+import shutil
+import tempfile
+
+from perjury import generators as g
+from perjury import util
+from perjury.parallel import derive_seed, generate_parallel, split
+
+
+def smallint_factory():
+    return g.smallint
+
+
+def unique_factory():
+    return util.unique(g.Choice(choices=range(400)))
+
+
+def write_handler(shard, values):
+    path = os.path.join(os.environ['PERJURY_TEST_DIR'], str(shard))
+    with open(path, 'a') as f:
+        f.write(''.join('{0}\n'.format(value) for value in values))
+
+
+class TestGenerateParallel(TestCase):
+    def test_split(self):
+        self.assertEqual(split(10, 3), [4, 3, 3])
+        self.assertEqual(split(2, 3), [1, 1, 0])
+
+    def test_derived_seeds(self):
+        self.assertEqual(derive_seed(1, 0), derive_seed(1, 0))
+        self.assertNotEqual(derive_seed(1, 0), derive_seed(1, 1))
+        self.assertNotEqual(derive_seed(1, 0), derive_seed(2, 0))
+
+    def test_reproducible(self):
+        first = generate_parallel(smallint_factory, 100, seed=7, processes=2)
+        second = generate_parallel(smallint_factory, 100, seed=7, processes=2)
+
+        self.assertEqual(len(first), 100)
+        self.assertEqual(first, second)
+
+    def test_unique_across_shards(self):
+        values = generate_parallel(
+                unique_factory, 200, seed=3, processes=2, shards=4)
+
+        self.assertEqual(len(values), 200)
+        self.assertEqual(len(set(values)), 200)
+
+    def test_reproducible_unique(self):
+        first = generate_parallel(unique_factory, 200, seed=3, processes=2,
+                shards=4)
+        second = generate_parallel(unique_factory, 200, seed=3, processes=4)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(set(first)), 200)
+
+    def test_handler(self):
+        directory = tempfile.mkdtemp()
+        os.environ['PERJURY_TEST_DIR'] = directory
+        try:
+            result = generate_parallel(smallint_factory, 95, seed=1,
+                    processes=2, handler=write_handler, chunk_size=10)
+
+            self.assertEqual(result, None)
+            self.assertEqual(sorted(os.listdir(directory)), ['0', '1'])
+            lines = []
+            for name in os.listdir(directory):
+                with open(os.path.join(directory, name)) as f:
+                    lines.extend(f.read().split())
+            self.assertEqual(len(lines), 95)
+        finally:
+            del os.environ['PERJURY_TEST_DIR']
+            shutil.rmtree(directory)
@@ -0,0 +1,99 @@
+from unittest import TestCase
+import threading
+import time
+import StringIO
+
+from perjury import generators as g
+from perjury.export import JSONLinesWriter
+from perjury.generators import consumer, sequence
+from perjury.pipeline import Pipeline, background_batches, batches
+
+
+class ListSink(object):
+    def __init__(self, delay=0):
+        self.rows = []
+        self.delay = delay
+        self.closed = False
+
+    def __call__(self, batch):
+        time.sleep(self.delay)
+        self.rows.extend(batch)
+
+    def close(self):
+        self.closed = True
+
+
+class FailingSink(object):
+    def __init__(self, after):
+        self.after = after
+        self.calls = 0
+
+    def __call__(self, batch):
+        self.calls += 1
+        if self.calls > self.after:
+            raise IOError('disk full')
+
+
+class BatchesTest(TestCase):
+    def test_batches(self):
+        sizes = [len(batch) for batch in batches(g.smallint, 10, 25)]
+        self.assertEqual(sizes, [10, 10, 5])
+
+    def test_background_batches(self):
+        values = []
+        for batch in background_batches(consumer(sequence()), 10, 95, max_pending=2):
+            values.extend(batch)
+        self.assertEqual(values, range(1, 96))
+
+    def test_background_batches_errors(self):
+        def broken():
+            raise KeyError('broken')
+
+        self.assertRaises(KeyError, list, background_batches(broken, 10, 20))
+
+    def test_background_batches_abandoned(self):
+        for batch in background_batches(g.smallint, 10):
+            break
+        # The producer thread has been stopped and joined.
+        self.assertEqual(threading.active_count(), 1)
+
+
+class PipelineTest(TestCase):
+    def test_every_sink_gets_every_value(self):
+        sinks = [ListSink(), ListSink(delay=0.001), ListSink()]
+        count = Pipeline(consumer(sequence()), sinks, batch_size=7).run(100)
+
+        self.assertEqual(count, 100)
+        for sink in sinks:
+            self.assertEqual(sink.rows, range(1, 101))
+            self.assertTrue(sink.closed)
+
+    def test_export_writers(self):
+        f = StringIO.StringIO()
+        Pipeline(g.smallint, [JSONLinesWriter(f)], batch_size=10).run(25)
+        self.assertEqual(len(f.getvalue().splitlines()), 25)
+
+    def test_backpressure(self):
+        produced = []
+
+        def fn():
+            produced.append(1)
+            return 1
+
+        slow = ListSink(delay=0.01)
+        pipeline = Pipeline(fn, [slow], batch_size=1, max_pending=2)
+        thread = threading.Thread(target=pipeline.run)
+        thread.start()
+        time.sleep(0.1)
+        pipeline.stop()
+        thread.join()
+
+        # Generation is held back to a few batches ahead of the sink.
+        self.assertTrue(len(produced) <= len(slow.rows) + 4)
+        self.assertTrue(slow.rows)
+
+    def test_sink_error(self):
+        good = ListSink()
+        pipeline = Pipeline(g.smallint, [good, FailingSink(after=2)], batch_size=10)
+        self.assertRaises(IOError, pipeline.run)
+        self.assertFalse(good.closed)
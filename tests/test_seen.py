@@ -0,0 +1,192 @@
+from unittest import TestCase
+import os
+import shutil
+import tempfile
+import threading
+
+from perjury import generators as g
+from perjury import util
+from perjury.generators import BaseGenerator, sequence, consumer
+from perjury.seen import (DigestSet, BloomFilter, SqliteSet, StripedSet,
+        LockedSet, ShardSet)
+
+
+class SeenStoreTestMixin(object):
+    def make_seen(self):
+        raise NotImplementedError
+
+    def test_membership(self):
+        seen = self.make_seen()
+
+        for i in xrange(2000):
+            assert i not in seen
+            seen.add(i)
+            assert i in seen
+
+        assert 'not-added' not in seen
+
+    def test_unique(self):
+        generator = util.unique(g.username, seen=self.make_seen())
+
+        values = [generator() for i in xrange(300)]
+        self.assertEqual(len(set(values)), 300)
+
+
+class TestDigestSet(SeenStoreTestMixin, TestCase):
+    def make_seen(self):
+        return DigestSet(capacity=16)
+
+    def test_len(self):
+        seen = self.make_seen()
+        seen.add('a')
+        seen.add(u'a')
+        seen.add('b')
+        self.assertEqual(len(seen), 2)
+
+
+class TestBloomFilter(SeenStoreTestMixin, TestCase):
+    def make_seen(self):
+        return BloomFilter(capacity=10000, error_rate=0.0001)
+
+
+class TestSqliteSet(SeenStoreTestMixin, TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'seen.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_seen(self):
+        return SqliteSet(self.path)
+
+    def test_shared_between_connections(self):
+        first = self.make_seen()
+        second = self.make_seen()
+
+        first.add('value')
+
+        assert 'value' in second
+
+
+class TestNonDurableSqliteSet(TestSqliteSet):
+    def make_seen(self):
+        return SqliteSet(self.path, durable=False)
+
+
+class TestSeenFactory(TestCase):
+    def test_base_generator_seen_factory(self):
+        class TestGenerator(BaseGenerator):
+            seen = DigestSet
+
+            def __init__(self):
+                self.generator = consumer(sequence())
+                super(TestGenerator, self).__init__()
+
+        first = TestGenerator()
+        second = TestGenerator()
+
+        self.assertEqual(first(), 1)
+        self.assertEqual(second(), 1)
+
+
+class TestStripedSet(SeenStoreTestMixin, TestCase):
+    def make_seen(self):
+        return StripedSet(stripes=4)
+
+    def test_add_new(self):
+        seen = self.make_seen()
+        self.assertTrue(seen.add_new('a'))
+        self.assertFalse(seen.add_new('a'))
+        self.assertEqual(len(seen), 1)
+
+
+class TestLockedSet(SeenStoreTestMixin, TestCase):
+    def make_seen(self):
+        return LockedSet(DigestSet(capacity=16))
+
+
+class TestShardSet(TestCase):
+    def test_partition(self):
+        shards = [ShardSet(shard, 3) for shard in xrange(3)]
+
+        for i in xrange(300):
+            self.assertEqual(sum(shard.add_new(i) for shard in shards), 1)
+            for shard in shards:
+                assert i in shard
+                self.assertFalse(shard.add_new(i))
+
+        self.assertEqual(sum(len(shard) for shard in shards), 300)
+        self.assertTrue(all(len(shard) for shard in shards))
+
+    def test_unique_across_shards(self):
+        values = []
+        for shard in xrange(4):
+            generator = util.unique(g.Choice(choices=range(1000)).seeded(shard),
+                    seen=ShardSet(shard, 4))
+            values.extend(generator() for i in xrange(200))
+
+        self.assertEqual(len(set(values)), 800)
+
+    def test_invalid_shard(self):
+        self.assertRaises(ValueError, ShardSet, 2, 2)
+
+
+class TestThreadSafeUnique(TestCase):
+    def run_threads(self, generator, threads=8, per_thread=500):
+        results = []
+
+        def work():
+            results.extend([generator() for i in xrange(per_thread)])
+
+        workers = [threading.Thread(target=work) for i in xrange(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return results
+
+    def test_unique(self):
+        generator = util.unique(g.Choice(choices=range(5000)), thread_safe=True)
+        values = self.run_threads(generator)
+        self.assertEqual(len(values), 4000)
+        self.assertEqual(len(set(values)), 4000)
+
+    def test_unique_with_store(self):
+        generator = util.unique(g.Choice(choices=range(5000)),
+                seen=DigestSet(capacity=16), thread_safe=True)
+        values = self.run_threads(generator)
+        self.assertEqual(len(set(values)), 4000)
+
+    def test_unique_with_sqlite_store(self):
+        directory = tempfile.mkdtemp()
+        try:
+            seen = SqliteSet(os.path.join(directory, 'seen.db'))
+            generator = util.unique(g.Choice(choices=range(5000)),
+                    seen=seen, thread_safe=True)
+            values = self.run_threads(generator, threads=4)
+            self.assertEqual(len(values), 2000)
+            self.assertEqual(len(set(values)), 2000)
+            self.assertEqual(len(seen), 2000)
+            seen.close()
+        finally:
+            shutil.rmtree(directory)
+
+    def test_unique_choice(self):
+        generator = util.as_unique(g.Choice(choices=range(4000)), thread_safe=True)
+        values = self.run_threads(generator)
+        self.assertEqual(sorted(values), range(4000))
+
+    def test_base_generator(self):
+        class TestGenerator(BaseGenerator):
+            thread_safe = True
+
+            def generator(self):
+                return self.rng.randint(0, 100000)
+
+        values = self.run_threads(TestGenerator())
+        self.assertEqual(len(set(values)), 4000)
+
+    def test_consumer(self):
+        values = self.run_threads(consumer(sequence(), thread_safe=True))
+        self.assertEqual(sorted(values), range(1, 4001))
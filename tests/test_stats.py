@@ -0,0 +1,95 @@
+from unittest import TestCase
+
+from perjury import generators as g
+from perjury import stats, util
+from perjury.exceptions import UniqueValueTimeoutError
+from perjury.generators import DatetimeGenerator, Template
+
+
+class UniqueDatetimeGenerator(DatetimeGenerator):
+    unique = True
+    stats_name = 'unique_datetime'
+
+
+class StatsTest(TestCase):
+    def test_disabled_by_default(self):
+        self.assertTrue(stats.active is None)
+        UniqueDatetimeGenerator()()
+
+    def test_collect_restores_previous(self):
+        outer = stats.Stats()
+        with stats.collect(outer):
+            with stats.collect() as inner:
+                self.assertTrue(stats.active is inner)
+            self.assertTrue(stats.active is outer)
+        self.assertTrue(stats.active is None)
+
+    def test_generator_calls(self):
+        generator = UniqueDatetimeGenerator()
+        with stats.collect() as collected:
+            for i in xrange(10):
+                generator()
+
+        recorded = collected['unique_datetime']
+        self.assertEqual(recorded.calls, 10)
+        self.assertEqual(recorded.values, 10)
+        self.assertTrue(recorded.time > 0)
+        self.assertTrue('unique_datetime' in collected.report())
+
+    def test_generators(self):
+        template = Template('{first_name}@{domain}')
+        with stats.collect() as collected:
+            g.email()
+            g.email.generate_many(5)
+            g.words.with_max_length(20)()
+            g.weighted_choice({1: 1, 2: 1}).generate_many(3)
+            template.generate_many(4)
+
+        self.assertEqual(collected['email'].calls, 2)
+        self.assertEqual(collected['email'].values, 6)
+        self.assertEqual(collected['username'].values, 6)
+        self.assertEqual(collected['words'].calls, 1)
+        self.assertEqual(collected['words'].values, 1)
+        self.assertEqual(collected['WeightedChoice'].values, 3)
+        self.assertEqual(collected['Template'].values, 4)
+        self.assertEqual(collected['first_name'].values, 4)
+
+    def test_wrapped_only_while_collecting(self):
+        original = g.Choice.__dict__['__call__']
+
+        with stats.collect():
+            with stats.collect():
+                self.assertFalse(g.Choice.__dict__['__call__'] is original)
+            self.assertFalse(g.Choice.__dict__['__call__'] is original)
+
+        self.assertTrue(g.Choice.__dict__['__call__'] is original)
+
+    def test_unique_retries_and_timeouts(self):
+        values = iter([1, 1, 1, 2, 2, 2, 2])
+
+        def counter():
+            return next(values)
+
+        fn = util.unique(counter, depth_limit=3)
+        with stats.collect() as collected:
+            self.assertEqual(fn(), 1)
+            self.assertEqual(fn(), 2)
+            self.assertRaises(UniqueValueTimeoutError, fn)
+
+        recorded = collected['counter']
+        self.assertEqual(recorded.retries, 2 + 3)
+        self.assertEqual(recorded.timeouts, 1)
+        self.assertEqual(recorded.timeout_rate, 1.0)
+
+    def test_nothing_recorded_when_disabled(self):
+        collected = stats.Stats()
+        with stats.collect(collected):
+            pass
+        UniqueDatetimeGenerator()()
+        self.assertEqual(collected.generators, {})
+
+    def test_name_of(self):
+        self.assertEqual(stats.name_of(UniqueDatetimeGenerator()), 'unique_datetime')
+        self.assertEqual(stats.name_of(DatetimeGenerator()), 'DatetimeGenerator')
+        self.assertEqual(stats.name_of(DatetimeGenerator().generator), 'DatetimeGenerator')
+        self.assertEqual(stats.name_of(len), 'len')
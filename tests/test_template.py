@@ -0,0 +1,53 @@
+from unittest import TestCase
+import re
+
+from perjury import generators as g
+from perjury import util
+from perjury.exceptions import ValueSpaceExhaustedError
+from perjury.generators.template import Template
+
+
+class TemplateTest(TestCase):
+    def test_fields(self):
+        template = Template('{first_name}.{last_name}{int:2}@{domain}')
+        pattern = re.compile(r'^(\w+)\.(\w+)(\d\d)@(example\.(com|net|org))$')
+
+        values = template.generate_many(500) + [template() for i in xrange(100)]
+        for value in values:
+            match = pattern.match(value)
+            self.assertTrue(match, value)
+            self.assertTrue(match.group(1) in g.first_name.choices)
+            self.assertTrue(match.group(2) in g.last_name.choices)
+
+    def test_keyword_generators_and_literals(self):
+        template = Template('{{{greeting}}} #{int:5-7} {greeting!r}',
+                greeting=g.Repeat('hi'))
+        self.assertTrue(template() in ("{hi} #5 'hi'", "{hi} #6 'hi'", "{hi} #7 'hi'"))
+
+    def test_format_spec(self):
+        template = Template('{n:>4}', n=g.Repeat(7))
+        self.assertEqual(template(), '   7')
+
+    def test_unknown_field(self):
+        self.assertRaises(ValueError, Template, '{no_such_generator}')
+        self.assertRaises(ValueError, Template, '{int:x}')
+
+    def test_cardinality(self):
+        template = Template('{domain}-{int:2}-{smallint}')
+        self.assertEqual(template.cardinality, 3 * 100 * 10)
+        self.assertEqual(Template('{words}').cardinality, None)
+        self.assertEqual(Template('static').cardinality, 1)
+
+    def test_unique_enumerates(self):
+        template = Template('{domain}/{int:1}')
+        generator = util.unique(template.seeded(2))
+
+        values = [generator() for i in xrange(template.cardinality)]
+
+        self.assertEqual(len(set(values)), 30)
+        self.assertRaises(ValueSpaceExhaustedError, generator)
+
+    def test_seeded(self):
+        template = Template('{username}{int:4}')
+        self.assertEqual(
+                template.seeded(1).generate_many(20), template.seeded(1).generate_many(20))
@@ -2,7 +2,8 @@ from unittest import TestCase
 
 from perjury import generators as g
 from perjury import util
-from perjury.exceptions import UniqueValueTimeoutError
+from perjury.exceptions import (UniqueValueTimeoutError,
+        UniqueValueSaturatedError, ValueSpaceExhaustedError)
 
 
 class TestUniqueDecorator(TestCase):
@@ -28,6 +29,82 @@ class TestUniqueDecorator(TestCase):
 
         self.assertRaises(UniqueValueTimeoutError, generator)
 
+    def test_enumerates_remaining_values(self):
+        generator = util.unique(g.Choice(choices=range(1000)).seeded(1))
+
+        values = [generator() for i in xrange(1000)]
+
+        self.assertEqual(sorted(values), range(1000))
+        self.assertTrue(generator.telemetry.saturated)
+        self.assertRaises(ValueSpaceExhaustedError, generator)
+
+    def test_enumerates_formatted_values(self):
+        generator = util.unique(g.FormatGenerator('{0}!', g.smallint))
+
+        values = [generator() for i in xrange(10)]
+
+        self.assertEqual(sorted(values), sorted('{0}!'.format(i) for i in xrange(1, 11)))
+        self.assertRaises(ValueSpaceExhaustedError, generator)
+
+    def test_saturated_error(self):
+        rng = g.Choice(choices=range(200)).seeded(2)
+        generator = util.unique(lambda: rng(), depth_limit=1000,
+                max_collision_rate=0.5)
+
+        with self.assertRaises(UniqueValueSaturatedError) as context:
+            for i in xrange(200):
+                generator()
+
+        error = context.exception
+        self.assertTrue(error.collision_rate > 0.5)
+        self.assertEqual(error.returned, generator.telemetry.returned)
+        self.assertTrue(error.returned < 200)
+
+    def test_telemetry(self):
+        values = iter([1, 1, 2, 3])
+        generator = util.unique(lambda: next(values))
+
+        generator()
+        generator()
+        generator()
+
+        telemetry = generator.telemetry
+        self.assertEqual(telemetry.returned, 3)
+        self.assertEqual(telemetry.collisions, 1)
+        self.assertEqual(telemetry.attempts, 4)
+        self.assertFalse(telemetry.saturated)
+
+
+class TestAsUnique(TestCase):
+    def test_choice_without_replacement(self):
+        generator = util.as_unique(g.Choice(choices=range(100)))
+
+        values = [generator() for i in xrange(100)]
+
+        self.assertEqual(sorted(values), range(100))
+        self.assertRaises(ValueSpaceExhaustedError, generator)
+
+    def test_duplicate_choices(self):
+        generator = util.as_unique(g.Choice(choices=(1, 1, 2)))
+
+        self.assertEqual(sorted([generator(), generator()]), [1, 2])
+        self.assertRaises(UniqueValueTimeoutError, generator)
+
+    def test_every_username(self):
+        generator = util.as_unique(g.email)
+        count = len(set(g.username.choices))
+
+        values = set(generator() for i in xrange(count))
+
+        self.assertEqual(len(values), count)
+        self.assertRaises(ValueSpaceExhaustedError, generator)
+
+    def test_plain_callable(self):
+        generator = util.as_unique(g.Choice(choices=(1, 2)).__call__)
+
+        self.assertEqual(sorted([generator(), generator()]), [1, 2])
+        self.assertRaises(UniqueValueTimeoutError, generator)
+
 
 class TestIterableUtils(TestCase):
     def test_forever(self):